@@ -31,6 +31,7 @@ class Config(BaseConfig):
     # Trade Execution Mode
     TRADING_MODE: str = "PAPER"  # Options: "PAPER" or "LIVE"
     PRICE_IMPROVEMENT_FACTOR: float = 0.4  # For live trading: 0.5 = midpoint, <0.5 = closer to bid, >0.5 = closer to ask
+    MAX_BATCH_SIZE: int = 20  # Max orders submitted per broker round-trip
 
     # Risk Management Parameters
     MAX_POSITIONS: int = 5
@@ -56,6 +57,7 @@ class Config(BaseConfig):
     MAX_DELTA: float = 0.50
     MAX_SPREAD_COST: float = 500  # Max cost per spread in dollars
     MIN_REWARD_RISK: float = 1.5  # Minimum reward-to-risk ratio
+    STRIKE_WINDOW_PCT: float = 0.10  # Only pair strikes within 10% of the price
 
     # Exit Strategy Parameters
     USE_FIBO_TARGETS: bool = True
@@ -78,6 +80,9 @@ class Config(BaseConfig):
 
     # Trade Execution Timing
     ALLOW_LATE_DAY_ENTRY: bool = True
+    QUEUED_TRADE_INTERVAL: float = 5.0  # Seconds between queued-trade checks
+    SIGNAL_QUEUE_MAX: int = 1000  # Pending signals before new ones are dropped
+    POSITION_UPDATE_INTERVAL: float = 30.0  # Seconds between broker position syncs
 
     # Universe Filtering
     MIN_MARKET_CAP: int = 10_000_000_000  # $10B
@@ -144,6 +149,10 @@ class Config(BaseConfig):
     USE_EMAIL_ALERTS: bool = True
     USE_SMS_ALERTS: bool = False
     USE_SLACK_ALERTS: bool = True
+    ALERT_TIMEOUT: float = 30.0  # Seconds to wait for all channels to deliver an alert
+    ALERT_DEDUP_SECONDS: float = 60.0  # Suppress identical alerts within this window
+    ALERT_HISTORY_SIZE: int = 1000  # Number of recent alerts kept in memory
+    DIGEST_INTERVAL_S: float = 30.0  # Batch non-critical alerts per window (0 = off)
 
     # Email Alert Settings
     EMAIL_SETTINGS: Optional[Dict[str, Any]] = None  # Will be set in __post_init__
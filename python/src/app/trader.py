@@ -1,5 +1,4 @@
 import queue
-import threading
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -10,7 +9,8 @@
 from src.trading.option_selector import OptionSelector
 from src.trading.risk_manager import RiskManager
 from src.trading.trade_executor import TradeExecutor
-from src.utils.logger import log_debug, log_error, log_info, log_warning
+from src.utils.logger import log_error, log_info, log_warning
+from src.utils.signal_worker import SignalWorker
 
 
 class Trader:
@@ -22,9 +22,7 @@ class Trader:
     option_selector: OptionSelector
     risk_manager: RiskManager
     trade_executor: TradeExecutor
-    signal_queue: queue.Queue
-    processing: bool
-    processing_thread: Optional[threading.Thread]
+    _worker: SignalWorker
 
     def __init__(self, config_file: str = "config.yaml"):
         """Initialize the trader.
@@ -48,20 +46,35 @@ def __init__(self, config_file: str = "config.yaml"):
         self.risk_manager = RiskManager(self.config, self.broker_api)
         self.trade_executor = TradeExecutor(self.config, self.broker_api)
 
-        # Signal processing queue
-        self.signal_queue = queue.Queue()
-        self.processing = False
-        self.processing_thread = None
+        # Signals and broker housekeeping share one worker thread
+        self._worker = SignalWorker(
+            self.process_signal, maxsize=getattr(self.config, "SIGNAL_QUEUE_MAX", 1000)
+        )
+        self._worker.add_task(
+            getattr(self.config, "POSITION_UPDATE_INTERVAL", 30.0),
+            self.risk_manager.update_positions_from_broker,
+        )
+        self._worker.add_task(
+            getattr(self.config, "QUEUED_TRADE_INTERVAL", 5.0),
+            self.trade_executor.process_queued_trades,
+        )
+
+    @property
+    def signal_queue(self) -> "queue.Queue[Any]":
+        """Queue of signals waiting for the worker thread."""
+        return self._worker.queue
+
+    @property
+    def processing(self) -> bool:
+        """Whether the worker thread is running."""
+        return self._worker.running
 
     def start(self) -> None:
         """Start the trader."""
         log_info("Starting trader...")
 
-        # Start the signal processing thread
-        self.processing = True
-        self.processing_thread = threading.Thread(target=self._process_signals_thread)
-        self.processing_thread.daemon = True
-        self.processing_thread.start()
+        # Start the worker thread for signals and housekeeping
+        self._worker.start()
 
         log_info("Trader started successfully")
 
@@ -69,10 +82,11 @@ def stop(self) -> None:
         """Stop the trader."""
         log_info("Stopping trader...")
 
-        # Stop the processing thread
-        self.processing = False
-        if self.processing_thread:
-            self.processing_thread.join(timeout=5.0)
+        # Stop the worker thread
+        self._worker.stop()
+
+        # Drop cached option chains at the session boundary
+        self.option_selector.clear_chain_cache()
 
         # Disconnect from broker
         if self.broker_api:
@@ -104,13 +118,18 @@ def scan_for_signals(
             signal_count = 0
             for symbol, signal_types in signals.items():
                 for signal_type in signal_types:
-                    self.signal_queue.put(
+                    queued = self._worker.put(
                         {
                             "symbol": symbol,
                             "direction": signal_type,
                             "timestamp": datetime.now(),
                         }
                     )
+                    if not queued:
+                        log_warning(
+                            "Signal queue full, dropping %s %s", symbol, signal_type
+                        )
+                        continue
                     signal_count += 1
 
             log_info(f"Scan completed, queued {signal_count} signals for processing")
@@ -158,7 +177,7 @@ def process_signal(self, signal: Dict[str, Any]) -> Tuple[str, Any]:
 
             # Calculate position size
             account_value = self.risk_manager.get_account_value()
-            position_size = self.risk_manager.calculate_position_size(
+            position_size = self.risk_manager.calculate_contract_position_size(
                 account_value, option_spread.cost
             )
 
@@ -184,28 +203,6 @@ def process_signal(self, signal: Dict[str, Any]) -> Tuple[str, Any]:
             log_error(f"Error processing signal: {str(e)}")
             return "ERROR", str(e)
 
-    def _process_signals_thread(self) -> None:
-        """Background thread for processing signals from the queue."""
-        while self.processing:
-            try:
-                # Process any queued signals with a timeout
-                try:
-                    signal = self.signal_queue.get(timeout=1.0)
-                    status, result = self.process_signal(signal)
-                    log_debug(f"Signal processing result: {status} - {result}")
-                    self.signal_queue.task_done()
-                except queue.Empty:
-                    # No signals to process, check queued trades
-                    self.trade_executor.process_queued_trades()
-
-                # Periodically update positions from broker
-                self.risk_manager.update_positions_from_broker()
-
-                # Sleep to avoid excessive CPU usage
-                time.sleep(0.1)
-            except Exception as e:
-                log_error(f"Error in signal processing thread: {str(e)}")
-
     def get_status(self) -> Dict[str, Any]:
         """Get current trader status.
 
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Dict, List, Literal, Optional, Union
+from typing import Dict, List, Literal, Optional, Tuple, Union
 
+import numpy as np
 
-@dataclass
+from src.utils.compat import DATACLASS_SLOTS
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Option:
     """Represents a single option contract."""
 
@@ -54,7 +58,7 @@ def __str__(self) -> str:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OptionSpread:
     """Represents an option spread strategy."""
 
@@ -89,3 +93,163 @@ def __str__(self) -> str:
             f"[{self.long_leg.strike:.2f}-{self.short_leg.strike:.2f}] "
             f"Cost: ${self.cost:.2f} R/R: {self.reward_risk_ratio:.2f}"
         )
+
+
+# Storage dtypes for OptionChain columns. Quotes and Greeks are kept in
+# float32, which holds about 7 significant digits: enough for screening
+# spreads, and quotes are rounded back to _PRICE_DECIMALS when Option
+# objects are created so money math downstream runs on float64 values.
+# Strikes stay float64 since they identify the contract.
+_CHAIN_DTYPES: Dict[str, type] = {
+    "strike": np.float64,
+    "exp_idx": np.int32,
+    "bid": np.float32,
+    "ask": np.float32,
+    "last": np.float32,
+    "volume": np.int32,
+    "open_interest": np.int32,
+    "implied_volatility": np.float32,
+    "delta": np.float32,
+    "gamma": np.float32,
+    "theta": np.float32,
+    "vega": np.float32,
+    "rho": np.float32,
+}
+_PRICE_COLUMNS = ("bid", "ask", "last")
+_PRICE_DECIMALS = 4
+
+
+@dataclass(frozen=True, eq=False)
+class OptionChain:
+    """Column-oriented options chain with one array entry per contract.
+
+    This is the in-memory form used for scanning; Option objects are only
+    created on demand via to_options(). All arrays are read-only and
+    converted to the compact dtypes in _CHAIN_DTYPES.
+    """
+
+    underlying: str
+    expirations: Tuple[date, ...]
+    symbol: Tuple[str, ...]
+    option_type: np.ndarray
+    strike: np.ndarray
+    exp_idx: np.ndarray  # Index into expirations
+    bid: np.ndarray
+    ask: np.ndarray
+    last: np.ndarray
+    volume: np.ndarray
+    open_interest: np.ndarray
+    implied_volatility: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+    rho: np.ndarray
+
+    def __post_init__(self) -> None:
+        for name, dtype in _CHAIN_DTYPES.items():
+            object.__setattr__(
+                self, name, np.ascontiguousarray(getattr(self, name), dtype=dtype)
+            )
+        for value in vars(self).values():
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.symbol)
+
+    @property
+    def expiration(self) -> np.ndarray:
+        """Get the expiration of every contract as datetime64[D]."""
+        return np.array(self.expirations, dtype="datetime64[D]")[self.exp_idx]
+
+    def _column(self, name: str, rows: np.ndarray) -> list:
+        """Get a column as Python values.
+
+        Args:
+            name: Column name
+            rows: Row indices to read
+
+        Returns:
+            List of values for the given rows
+        """
+        values = getattr(self, name)[rows]
+        if name in _PRICE_COLUMNS:
+            # Undo float32 representation error, e.g. 3.1 -> 3.0999999
+            values = np.round(values.astype(np.float64), _PRICE_DECIMALS)
+        return values.tolist()
+
+    def to_options(self, rows: Optional[np.ndarray] = None) -> List[Option]:
+        """Create Option objects for the given rows.
+
+        Args:
+            rows: Row indices to materialize (default: all rows)
+
+        Returns:
+            List of options
+        """
+        if rows is None:
+            rows = np.arange(len(self))
+
+        symbols = self.symbol
+        expirations = self.expirations
+        columns = zip(
+            [symbols[i] for i in rows.tolist()],
+            *(
+                self._column(name, rows)
+                for name in (
+                    "option_type",
+                    "strike",
+                    "exp_idx",
+                    "bid",
+                    "ask",
+                    "last",
+                    "volume",
+                    "open_interest",
+                    "implied_volatility",
+                    "delta",
+                    "gamma",
+                    "theta",
+                    "vega",
+                    "rho",
+                )
+            ),
+        )
+
+        return [
+            Option(
+                symbol=sym,
+                underlying=self.underlying,
+                option_type=opt_type,
+                strike=strike,
+                expiration=expirations[exp],
+                bid=bid,
+                ask=ask,
+                last=last,
+                volume=volume,
+                open_interest=oi,
+                implied_volatility=iv,
+                delta=delta,
+                gamma=gamma,
+                theta=theta,
+                vega=vega,
+                rho=rho,
+            )
+            for (
+                sym,
+                opt_type,
+                strike,
+                exp,
+                bid,
+                ask,
+                last,
+                volume,
+                oi,
+                iv,
+                delta,
+                gamma,
+                theta,
+                vega,
+                rho,
+            ) in columns
+        ]
@@ -0,0 +1,93 @@
+"""
+Numeric kernels for vertical spread construction.
+
+The kernels are compiled with Numba when it is installed. Without Numba
+the same arithmetic runs as plain NumPy array expressions.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+SpreadArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def call_spread_kernel(
+        ask: np.ndarray, bid: np.ndarray, strike: np.ndarray, delta: np.ndarray
+    ) -> SpreadArrays:
+        """Compute bull call spreads for adjacent strikes.
+
+        Long leg is strike i, short leg is strike i + 1.
+        """
+        n = ask.size - 1
+        cost = np.empty(n)
+        max_profit = np.empty(n)
+        net_delta = np.empty(n)
+        reward_risk = np.empty(n)
+        for i in range(n):
+            c = ask[i] - bid[i + 1]
+            cost[i] = c
+            max_profit[i] = strike[i + 1] - strike[i] - c
+            net_delta[i] = delta[i] - delta[i + 1]
+            reward_risk[i] = max_profit[i] / c if c > 0 else 0.0
+        return cost, max_profit, net_delta, reward_risk
+
+    @njit(cache=True)
+    def put_spread_kernel(
+        ask: np.ndarray, bid: np.ndarray, strike: np.ndarray, delta: np.ndarray
+    ) -> SpreadArrays:
+        """Compute bear put spreads for adjacent strikes.
+
+        Long leg is strike i + 1, short leg is strike i.
+        """
+        n = ask.size - 1
+        cost = np.empty(n)
+        max_profit = np.empty(n)
+        net_delta = np.empty(n)
+        reward_risk = np.empty(n)
+        for i in range(n):
+            c = ask[i + 1] - bid[i]
+            cost[i] = c
+            max_profit[i] = strike[i + 1] - strike[i] - c
+            net_delta[i] = delta[i + 1] - delta[i]
+            reward_risk[i] = max_profit[i] / c if c > 0 else 0.0
+        return cost, max_profit, net_delta, reward_risk
+
+else:
+
+    def _reward_risk(max_profit: np.ndarray, cost: np.ndarray) -> np.ndarray:
+        return np.divide(max_profit, cost, out=np.zeros_like(cost), where=cost > 0)
+
+    def call_spread_kernel(
+        ask: np.ndarray, bid: np.ndarray, strike: np.ndarray, delta: np.ndarray
+    ) -> SpreadArrays:
+        """Compute bull call spreads for adjacent strikes.
+
+        Long leg is strike i, short leg is strike i + 1.
+        """
+        cost = ask[:-1] - bid[1:]
+        max_profit = strike[1:] - strike[:-1] - cost
+        net_delta = delta[:-1] - delta[1:]
+        return cost, max_profit, net_delta, _reward_risk(max_profit, cost)
+
+    def put_spread_kernel(
+        ask: np.ndarray, bid: np.ndarray, strike: np.ndarray, delta: np.ndarray
+    ) -> SpreadArrays:
+        """Compute bear put spreads for adjacent strikes.
+
+        Long leg is strike i + 1, short leg is strike i.
+        """
+        cost = ask[1:] - bid[:-1]
+        max_profit = strike[1:] - strike[:-1] - cost
+        net_delta = delta[1:] - delta[:-1]
+        return cost, max_profit, net_delta, _reward_risk(max_profit, cost)
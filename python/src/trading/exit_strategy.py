@@ -4,13 +4,88 @@
 
 import math
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 from src.app.config import Config
 from src.models.option import OptionSpread
 from src.utils.logger import log_debug, log_error, log_info, log_warning
 
 
+class AtrTable:
+    """
+    Contiguous ATR store for a multi-underlying portfolio.
+
+    ATRs are kept in a single float32 array with a symbol-to-index map, so
+    batch exit calculations can gather every position's ATR in one vector
+    operation instead of one dict lookup per position.
+    """
+
+    def __init__(self, atrs: Optional[Dict[str, float]] = None):
+        """
+        Initialize the ATR table.
+
+        Args:
+            atrs: Optional initial mapping of symbol to ATR
+        """
+        self.symbol_index: Dict[str, int] = {}
+        self.values = np.zeros(0, dtype=np.float32)
+        if atrs:
+            self.update(atrs)
+
+    def update(self, atrs: Dict[str, float]) -> None:
+        """
+        Insert or overwrite ATR values.
+
+        Args:
+            atrs: Mapping of symbol to ATR
+        """
+        new_symbols = [s for s in atrs if s not in self.symbol_index]
+        if new_symbols:
+            start = len(self.symbol_index)
+            for offset, symbol in enumerate(new_symbols):
+                self.symbol_index[symbol] = start + offset
+            self.values = np.concatenate(
+                [self.values, np.zeros(len(new_symbols), dtype=np.float32)]
+            )
+
+        for symbol, atr in atrs.items():
+            self.values[self.symbol_index[symbol]] = atr or 0.0
+
+    def indices(self, symbols: Iterable[str]) -> np.ndarray:
+        """
+        Map symbols to their row in the ATR array.
+
+        Args:
+            symbols: Symbols to look up
+
+        Returns:
+            int32 array of indices (-1 for unknown symbols)
+        """
+        return np.fromiter(
+            (self.symbol_index.get(symbol, -1) for symbol in symbols), dtype=np.int32
+        )
+
+    def get(self, symbol: str, default: float = 0.0) -> float:
+        """
+        Get the ATR for a single symbol.
+
+        Args:
+            symbol: Symbol to look up
+            default: Value returned when the symbol is unknown
+
+        Returns:
+            ATR value
+        """
+        idx = self.symbol_index.get(symbol)
+        if idx is None:
+            return default
+        return float(self.values[idx])
+
+    def __len__(self) -> int:
+        return len(self.symbol_index)
+
+
 class ExitStrategyManager:
     """
     Manages different exit strategies for option trades.
@@ -71,7 +146,7 @@ def calculate_exits(
         # ATR-based exit
         if getattr(self.config, "USE_ATR_EXIT", False) and underlying_data:
             exits["atr_exit"] = self._calculate_atr_exit(
-                entry_price, direction, underlying_data
+                entry_price, direction, underlying_data, option_spread
             )
 
         # Fibonacci-based exit
@@ -185,7 +260,11 @@ def _calculate_r_multiple_exit(
         return target_price
 
     def _calculate_atr_exit(
-        self, entry_price: float, direction: str, underlying_data: Dict
+        self,
+        entry_price: float,
+        direction: str,
+        underlying_data: Dict,
+        option_spread: OptionSpread,
     ) -> float:
         """
         Calculate ATR-based exit level.
@@ -194,6 +273,7 @@ def _calculate_atr_exit(
             entry_price: Entry price
             direction: 'LONG' or 'SHORT'
             underlying_data: Historical data with ATR
+            option_spread: Option spread details, used when no ATR is available
 
         Returns:
             ATR-based target price
@@ -201,8 +281,8 @@ def _calculate_atr_exit(
         # Get the ATR value
         atr = underlying_data.get("atr", 0)
         if not atr:
-            # If ATR is not available, fall back to fixed percentage
-            return self._calculate_profit_target(entry_price, direction, None)
+            # If ATR is not available, fall back to the profit target
+            return self._calculate_profit_target(entry_price, direction, option_spread)
 
         atr_multiple = getattr(self.config, "ATR_TARGET_MULTIPLE", 3.0)
 
@@ -215,6 +295,44 @@ def _calculate_atr_exit(
 
         return target_price
 
+    def calculate_atr_exits_batch(
+        self,
+        entry_prices: np.ndarray,
+        directions: Iterable[str],
+        symbols: Iterable[str],
+        atr_table: AtrTable,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate ATR-based exit levels for many positions at once.
+
+        Args:
+            entry_prices: Entry price of each position
+            directions: 'LONG' or 'SHORT' for each position
+            symbols: Underlying symbol of each position
+            atr_table: ATR values for the underlyings
+
+        Returns:
+            Tuple of (target prices, mask of rows that had an ATR available)
+        """
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        sign = np.fromiter(
+            (1.0 if direction == "LONG" else -1.0 for direction in directions),
+            dtype=np.float64,
+        )
+        symbol_idx = atr_table.indices(symbols)
+
+        known = symbol_idx >= 0
+        atrs = np.zeros(len(symbol_idx), dtype=np.float32)
+        atrs[known] = atr_table.values[symbol_idx[known]]
+
+        atr_multiple = getattr(self.config, "ATR_TARGET_MULTIPLE", 3.0)
+        targets = entry_prices + sign * atrs * atr_multiple
+
+        # Short targets are floored like the scalar path
+        targets = np.where(sign < 0, np.maximum(targets, 0.05), targets)
+
+        return targets, atrs != 0
+
     def _calculate_fibonacci_exit(
         self, entry_price: float, direction: str, option_spread: OptionSpread
     ) -> float:
@@ -404,6 +522,7 @@ def update_exits_for_position(
         position: Dict,
         current_price: float,
         underlying_data: Optional[Dict] = None,
+        atr_table: Optional[AtrTable] = None,
     ) -> Dict:
         """
         Update exit levels for a position based on current price.
@@ -412,6 +531,7 @@ def update_exits_for_position(
             position: Position details
             current_price: Current price of the position
             underlying_data: Historical data for the underlying
+            atr_table: ATR values by symbol, used when underlying_data is omitted
 
         Returns:
             Updated position dictionary
@@ -420,6 +540,13 @@ def update_exits_for_position(
         entry_price = position["entry_price"]
         option_spread = position["spread"]
 
+        if (
+            underlying_data is None
+            and atr_table is not None
+            and option_spread.symbol in atr_table.symbol_index
+        ):
+            underlying_data = {"atr": atr_table.get(option_spread.symbol)}
+
         # Only update trailing stops and adaptive exits
         if getattr(self.config, "USE_TRAILING_STOP", False):
             if direction == "LONG":
@@ -448,7 +575,58 @@ def update_exits_for_position(
         # Update ATR-based exits if enabled and underlying data available
         if getattr(self.config, "USE_ADAPTIVE_ATR_EXIT", False) and underlying_data:
             position["atr_exit"] = self._calculate_atr_exit(
-                entry_price, direction, underlying_data
+                entry_price, direction, underlying_data, option_spread
             )
 
         return position
+
+    def update_exits_for_positions(
+        self,
+        positions: Dict[str, Dict],
+        current_prices: Dict[str, float],
+        atr_table: Optional[AtrTable] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Update exit levels for a whole portfolio in one pass.
+
+        Trailing stops are updated per position; ATR-based exits are
+        computed for all positions with a single vectorized operation.
+
+        Args:
+            positions: Positions keyed by symbol
+            current_prices: Current price of each position keyed by symbol
+            atr_table: ATR values for the underlyings
+
+        Returns:
+            The updated positions dictionary
+        """
+        symbols = [symbol for symbol in positions if symbol in current_prices]
+
+        for symbol in symbols:
+            self.update_exits_for_position(positions[symbol], current_prices[symbol])
+
+        if (
+            not getattr(self.config, "USE_ADAPTIVE_ATR_EXIT", False)
+            or atr_table is None
+            or not symbols
+        ):
+            return positions
+
+        batch = [positions[symbol] for symbol in symbols]
+        targets, has_atr = self.calculate_atr_exits_batch(
+            np.fromiter((p["entry_price"] for p in batch), dtype=np.float64),
+            [p["direction"] for p in batch],
+            [p["spread"].symbol for p in batch],
+            atr_table,
+        )
+
+        for position, target, valid in zip(batch, targets.tolist(), has_atr.tolist()):
+            if valid:
+                position["atr_exit"] = target
+            else:
+                # No ATR for this underlying, fall back to the profit target
+                position["atr_exit"] = self._calculate_profit_target(
+                    position["entry_price"], position["direction"], position["spread"]
+                )
+
+        return positions
@@ -1,11 +1,248 @@
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from src.app.config import Config
-from src.models.option import Option, OptionSpread
+from src.models.option import Option, OptionChain, OptionSpread
+from src.trading._spread_kernels import call_spread_kernel, put_spread_kernel
 from src.utils.logger import log_debug, log_error, log_info, log_warning
 
+try:
+    from scipy.special import ndtr as _norm_cdf
+except ImportError:
+
+    # Abramowitz-Stegun 7.1.26 erfc coefficients, highest order first
+    _ERFC_P = 0.3275911
+    _ERFC_COEFFS = (1.061405429, -1.453152027, 1.421413741, -0.284496736, 0.254829592)
+
+    def _norm_cdf(x: np.ndarray) -> np.ndarray:
+        """Standard normal CDF as whole-array NumPy operations.
+
+        Absolute error is below 1e-7, which is plenty for Greeks.
+        """
+        z = np.abs(x) / math.sqrt(2.0)
+        t = 1.0 / (1.0 + _ERFC_P * z)
+        poly = np.zeros_like(t)
+        for coeff in _ERFC_COEFFS:
+            poly = poly * t + coeff
+        tail = 0.5 * t * poly * np.exp(-z * z)  # N(-|x|)
+        return np.where(x >= 0, 1.0 - tail, tail)
+
+
+# Placeholder market inputs for the synthetic development chain
+_SYNTHETIC_SPOT = 100.0
+_SYNTHETIC_RATE = 0.04
+_SYNTHETIC_IV = 0.3
+
+
+def _compute_greeks_batch(
+    strikes: np.ndarray,
+    spots: np.ndarray,
+    ttes: np.ndarray,
+    sigmas: np.ndarray,
+    rates: np.ndarray,
+    is_call: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Compute Black-Scholes Greeks for a whole chain at once.
+
+    All inputs broadcast against each other. The shared terms (d1, d2,
+    N(d1), N(d2), pdf(d1), discount factor) are computed once for every
+    contract, with no Python-level loop.
+
+    Args:
+        strikes: Strike prices
+        spots: Underlying prices
+        ttes: Times to expiration in years
+        sigmas: Implied volatilities
+        rates: Risk-free rates
+        is_call: True for calls, False for puts
+
+    Returns:
+        Dictionary with delta, gamma, theta (per day), vega and rho
+        (per 1 percentage point) arrays
+    """
+    sqrt_t = np.sqrt(ttes)
+    sigma_sqrt_t = sigmas * sqrt_t
+    d1 = (np.log(spots / strikes) + (rates + 0.5 * sigmas**2) * ttes) / sigma_sqrt_t
+    d2 = d1 - sigma_sqrt_t
+
+    pdf_d1 = np.exp(-0.5 * d1**2) / math.sqrt(2.0 * math.pi)
+    cdf_d1 = _norm_cdf(d1)
+    cdf_d2 = _norm_cdf(d2)
+    discounted_strike = strikes * np.exp(-rates * ttes)
+
+    # Put values via put-call parity on N(x) = 1 - N(-x)
+    delta = np.where(is_call, cdf_d1, cdf_d1 - 1.0)
+    signed_cdf_d2 = np.where(is_call, cdf_d2, cdf_d2 - 1.0)
+
+    return {
+        "delta": delta,
+        "gamma": pdf_d1 / (spots * sigma_sqrt_t),
+        "theta": (
+            -spots * pdf_d1 * sigmas / (2.0 * sqrt_t)
+            - rates * discounted_strike * signed_cdf_d2
+        )
+        / 365.0,
+        "vega": spots * pdf_d1 * sqrt_t / 100.0,
+        "rho": discounted_strike * ttes * signed_cdf_d2 / 100.0,
+    }
+
+
+_reward_risk_key = attrgetter("reward_risk_ratio")
+_strike_key = attrgetter("strike")
+
+# Calls and puts of one expiration, each sorted by strike
+ExpiryLegs = Tuple[List[Option], List[Option]]
+
+
+def _split_by_expiration(options: Iterable[Option]) -> Dict[date, ExpiryLegs]:
+    """Bucket options by expiration into strike-sorted calls and puts.
+
+    Args:
+        options: Options to bucket
+
+    Returns:
+        Dictionary mapping expiration dates to (calls, puts)
+    """
+    buckets: DefaultDict[date, ExpiryLegs] = defaultdict(lambda: ([], []))
+    for option in options:
+        buckets[option.expiration][option.option_type == "put"].append(option)
+
+    for calls, puts in buckets.values():
+        calls.sort(key=_strike_key)
+        puts.sort(key=_strike_key)
+
+    return dict(buckets)
+
+
+def _days_to_expiration(expirations: np.ndarray, today: date) -> np.ndarray:
+    """Days from today to each datetime64[D] expiration."""
+    return (expirations - np.datetime64(today, "D")).astype(np.int64)
+
+
+@lru_cache(maxsize=512)
+def _fetch_chain_cached(symbol: str, day: str) -> OptionChain:
+    """Build the options chain for a symbol on a given trading day.
+
+    Args:
+        symbol: Underlying symbol
+        day: Trading day in ISO format
+
+    Returns:
+        Read-only column-oriented chain
+    """
+    today = date.fromisoformat(day)
+
+    # In a real implementation, we would fetch from IBKR API
+    # For now, create some synthetic options as a placeholder
+    expiration_dates = [
+        today + timedelta(days=30),
+        today + timedelta(days=45),
+        today + timedelta(days=60),
+    ]
+
+    # Create synthetic ATM options for development purposes
+    atm_strikes = np.array([95.0, 100.0, 105.0, 110.0])  # Assuming stock around $100
+
+    # One row per (expiration, strike) with calls and puts interleaved
+    strike_grid, exp_grid = np.meshgrid(atm_strikes, np.arange(len(expiration_dates)))
+    strike = np.repeat(strike_grid.ravel(), 2)
+    exp_idx = np.repeat(exp_grid.ravel(), 2)
+    is_call = np.tile(np.array([True, False]), strike_grid.size)
+    n = strike.size
+
+    # Intrinsic-style moneyness: positive when in the money
+    moneyness = np.where(is_call, 100 - strike, strike - 100)
+
+    # Greeks for every contract in one vectorized pass
+    days_out = np.array(
+        [(exp - today).days for exp in expiration_dates], dtype=np.float64
+    )
+    greeks = _compute_greeks_batch(
+        strike,
+        _SYNTHETIC_SPOT,
+        days_out[exp_idx] / 365.0,
+        _SYNTHETIC_IV,
+        _SYNTHETIC_RATE,
+        is_call,
+    )
+
+    # OCC-style symbols: the expiry prefix is formatted once per expiration
+    bases = [f"{symbol}{exp:%y%m%d}" for exp in expiration_dates]
+    strike_codes = (strike * 100).astype(np.int64).tolist()
+    rights = np.where(is_call, "C", "P").tolist()
+    symbols = [
+        f"{bases[e]}{right}{k:08d}"
+        for e, right, k in zip(exp_idx.tolist(), rights, strike_codes)
+    ]
+
+    return OptionChain(
+        underlying=symbol,
+        expirations=tuple(expiration_dates),
+        symbol=tuple(symbols),
+        option_type=np.where(is_call, "call", "put"),
+        strike=strike,
+        exp_idx=exp_idx,
+        bid=np.maximum(0.1, moneyness + 3),
+        ask=np.maximum(0.15, moneyness + 3.5),
+        last=np.maximum(0.125, moneyness + 3.25),
+        volume=np.full(n, 100),
+        open_interest=np.full(n, 1000),
+        implied_volatility=np.full(n, _SYNTHETIC_IV),
+        delta=greeks["delta"],
+        gamma=greeks["gamma"],
+        theta=greeks["theta"],
+        vega=greeks["vega"],
+        rho=greeks["rho"],
+    )
+
+
+@lru_cache(maxsize=512)
+def _options_by_expiration_cached(
+    symbol: str, day: str, min_dte: int, max_dte: int
+) -> Tuple[Tuple[date, Tuple[Tuple[Option, ...], Tuple[Option, ...]]], ...]:
+    """Materialize the options inside a DTE window, bucketed by expiration.
+
+    Args:
+        symbol: Underlying symbol
+        day: Trading day in ISO format
+        min_dte: Minimum days to expiration
+        max_dte: Maximum days to expiration
+
+    Returns:
+        Immutable (expiration, (calls, puts)) pairs, legs sorted by strike
+    """
+    chain = _fetch_chain_cached(symbol, day)
+
+    dte = _days_to_expiration(chain.expiration, date.fromisoformat(day))
+    in_window = (dte >= min_dte) & (dte <= max_dte)
+
+    # Drop contracts with missing quotes or Greeks so spread math never sees NaN
+    usable = (
+        np.isfinite(chain.strike)
+        & np.isfinite(chain.bid)
+        & np.isfinite(chain.ask)
+        & np.isfinite(chain.delta)
+    )
+    dropped = int(np.count_nonzero(in_window & ~usable))
+    if dropped:
+        log_warning("Dropped %d %s options with missing data", dropped, symbol)
+
+    (in_range,) = np.nonzero(in_window & usable)
+
+    buckets = _split_by_expiration(chain.to_options(in_range))
+    return tuple(
+        (expiry, (tuple(calls), tuple(puts)))
+        for expiry, (calls, puts) in buckets.items()
+    )
+
 
 class OptionSelector:
     """Selects optimal vertical spreads based on configured criteria."""
@@ -33,45 +270,63 @@ def select_vertical_spread(
         """
         try:
             # Fetch available options
-            options_chain = self.fetch_options_chain(symbol)
-            if not options_chain:
+            options_chain = self.fetch_options_chain_soa(symbol)
+            if not len(options_chain):
                 log_warning(f"No options available for {symbol}")
                 return None
 
             # Filter by expiration (prefer 30-45 DTE)
-            valid_expirations = self.filter_by_dte(options_chain)
+            valid_expirations = self.fetch_options_by_expiration(symbol)
             if not valid_expirations:
                 log_warning(f"No options with valid expiration for {symbol}")
                 return None
 
-            # Create spreads based on direction
+            # Bail out before building spreads if no strikes are near the money
+            if not self._has_strikes_near_price(
+                valid_expirations, direction, current_price
+            ):
+                log_warning(
+                    "No strikes near %.2f for %s %s", current_price, symbol, direction
+                )
+                return None
+
+            # Build candidate spreads as parallel arrays based on direction
             if direction == "LONG":
                 # For bullish trades, find call verticals
-                spreads = self.create_call_vertical_spreads(
-                    valid_expirations, current_price
+                batch = self._vertical_spread_arrays(
+                    valid_expirations, "BULL_CALL", current_price
                 )
             else:
                 # For bearish trades, find put verticals
-                spreads = self.create_put_vertical_spreads(
-                    valid_expirations, current_price
+                batch = self._vertical_spread_arrays(
+                    valid_expirations, "BEAR_PUT", current_price
                 )
 
-            if not spreads:
+            profitable = batch["max_profit"] > 0
+            if not profitable.any():
                 log_warning(f"No valid spreads created for {symbol} {direction}")
                 return None
 
-            # Filter by criteria
-            filtered_spreads = self.filter_spreads(spreads)
-            if not filtered_spreads:
+            # Filter by criteria and rank by reward-to-risk ratio in one pass
+            order = self.filter_spread_arrays(
+                batch["cost"] * 100,
+                batch["delta"],
+                batch["reward_risk"],
+                valid=profitable,
+                top_k=1,
+            )
+            if order.size == 0:
                 log_warning(f"No spreads matching criteria for {symbol} {direction}")
                 return None
 
-            # Rank by reward-to-risk ratio
-            ranked_spreads = self.rank_by_reward_risk(filtered_spreads)
+            # Only the best candidate is turned into an OptionSpread
+            ranked_spreads = self._materialize_spreads(batch, order)
 
             selected_spread = ranked_spreads[0] if ranked_spreads else None
             if selected_spread:
-                log_info(f"Selected spread for {symbol} {direction}: {selected_spread}")
+                log_info(
+                    "Selected spread for %s %s: %s", symbol, direction, selected_spread
+                )
 
             return selected_spread
         except Exception as e:
@@ -90,72 +345,87 @@ def fetch_options_chain(self, symbol: str) -> List[Option]:
         Returns:
             List of available options
         """
+        log_debug("Fetching options chain for %s", symbol)
+        return self.fetch_options_chain_soa(symbol).to_options()
+
+    def fetch_options_chain_soa(self, symbol: str) -> OptionChain:
+        """Fetch options chain for a symbol in column-oriented form.
+
+        Chains are cached per (symbol, trading day) and shared between
+        callers, which is safe because OptionChain is read-only.
+
+        Args:
+            symbol: Symbol to fetch options for
+
+        Returns:
+            Column-oriented options chain
+        """
         # TODO: Implement real options chain retrieval from broker API
         # This is a stub implementation for development
-        log_debug(f"Fetching options chain for {symbol}")
+        return _fetch_chain_cached(symbol, datetime.now().date().isoformat())
 
-        # In a real implementation, we would fetch from IBKR API
-        # For now, create some synthetic options as a placeholder
-        today = datetime.now().date()
-        expiration_dates = [
-            today + timedelta(days=30),
-            today + timedelta(days=45),
-            today + timedelta(days=60),
-        ]
+    def fetch_options_by_expiration(self, symbol: str) -> Dict[date, ExpiryLegs]:
+        """Fetch the options for a symbol already filtered by days to expiration.
 
-        # Create synthetic ATM options for development purposes
-        atm_strikes = [95.0, 100.0, 105.0, 110.0]  # Assuming stock around $100
-
-        options = []
-        for exp in expiration_dates:
-            for strike in atm_strikes:
-                # Create call option
-                call = Option(
-                    symbol=f"{symbol}{exp.strftime('%y%m%d')}C{int(strike*100):08d}",
-                    underlying=symbol,
-                    option_type="call",
-                    strike=strike,
-                    expiration=exp,
-                    bid=max(0.1, (100 - strike) + 3),
-                    ask=max(0.15, (100 - strike) + 3.5),
-                    last=max(0.125, (100 - strike) + 3.25),
-                    volume=100,
-                    open_interest=1000,
-                    implied_volatility=0.3,
-                    delta=max(
-                        0.01, min(0.99, 0.5 + (100 - strike) * 0.04)
-                    ),  # Synthetic delta
-                    gamma=0.02,
-                    theta=-0.01,
-                    vega=0.1,
-                    rho=0.01,
-                )
-                options.append(call)
-
-                # Create put option
-                put = Option(
-                    symbol=f"{symbol}{exp.strftime('%y%m%d')}P{int(strike*100):08d}",
-                    underlying=symbol,
-                    option_type="put",
-                    strike=strike,
-                    expiration=exp,
-                    bid=max(0.1, (strike - 100) + 3),
-                    ask=max(0.15, (strike - 100) + 3.5),
-                    last=max(0.125, (strike - 100) + 3.25),
-                    volume=100,
-                    open_interest=1000,
-                    implied_volatility=0.3,
-                    delta=min(
-                        -0.01, max(-0.99, -0.5 - (strike - 100) * 0.04)
-                    ),  # Synthetic delta
-                    gamma=0.02,
-                    theta=-0.01,
-                    vega=0.1,
-                    rho=0.01,
-                )
-                options.append(put)
+        Equivalent to ``filter_legs_by_dte(fetch_options_chain(symbol))`` but only
+        materializes options inside the DTE window, and caches the result per
+        (symbol, trading day, DTE window).
 
-        return options
+        Args:
+            symbol: Symbol to fetch options for
+
+        Returns:
+            Dictionary mapping expiration dates to strike-sorted (calls, puts)
+        """
+        buckets = _options_by_expiration_cached(
+            symbol,
+            datetime.now().date().isoformat(),
+            self.config.MIN_DTE,
+            self.config.MAX_DTE,
+        )
+        return {
+            expiry: (list(calls), list(puts)) for expiry, (calls, puts) in buckets
+        }
+
+    @staticmethod
+    def clear_chain_cache() -> None:
+        """Drop all cached option chains, e.g. at a session boundary."""
+        _fetch_chain_cached.cache_clear()
+        _options_by_expiration_cached.cache_clear()
+
+    def _has_strikes_near_price(
+        self,
+        option_chains: Dict[date, ExpiryLegs],
+        direction: str,
+        current_price: float,
+    ) -> bool:
+        """Check whether any expiration has a spread-able pair near the money.
+
+        Uses the same STRIKE_WINDOW_PCT window as the spread builders, so a
+        False result means no spread could be built.
+
+        Args:
+            option_chains: Strike-sorted (calls, puts) by expiration
+            direction: Trade direction ("LONG" or "SHORT")
+            current_price: Current price of the underlying
+
+        Returns:
+            True if at least two strikes fall inside the window
+        """
+        if not current_price:
+            return True
+
+        side = 0 if direction == "LONG" else 1  # calls or puts
+        window = getattr(self.config, "STRIKE_WINDOW_PCT", 0.10)
+        low = current_price * (1 - window)
+        high = current_price * (1 + window)
+
+        for expiry_legs in option_chains.values():
+            strikes = [opt.strike for opt in expiry_legs[side]]
+            if bisect_right(strikes, high) - bisect_left(strikes, low) >= 2:
+                return True
+
+        return False
 
     def filter_by_dte(self, options_chain: List[Option]) -> Dict[date, List[Option]]:
         """Filter options by preferred days to expiration.
@@ -166,17 +436,54 @@ def filter_by_dte(self, options_chain: List[Option]) -> Dict[date, List[Option]]
         Returns:
             Dictionary mapping expiration dates to option lists
         """
-        filtered = {}
-        today = datetime.now().date()
+        filtered: DefaultDict[date, List[Option]] = defaultdict(list)
+        for i in self._in_dte_window(options_chain):
+            option = options_chain[i]
+            filtered[option.expiration].append(option)
 
-        for option in options_chain:
-            dte = (option.expiration - today).days
-            if self.config.MIN_DTE <= dte <= self.config.MAX_DTE:
-                if option.expiration not in filtered:
-                    filtered[option.expiration] = []
-                filtered[option.expiration].append(option)
+        return dict(filtered)
 
-        return filtered
+    def filter_legs_by_dte(
+        self, options_chain: List[Option]
+    ) -> Dict[date, ExpiryLegs]:
+        """Filter options by preferred days to expiration, split into legs.
+
+        Like filter_by_dte, but each expiration maps to its calls and puts,
+        each sorted by strike, as used by the spread builders.
+
+        Args:
+            options_chain: Full list of options
+
+        Returns:
+            Dictionary mapping expiration dates to (calls, puts)
+        """
+        return _split_by_expiration(
+            options_chain[i] for i in self._in_dte_window(options_chain)
+        )
+
+    def _in_dte_window(self, options_chain: List[Option]) -> List[int]:
+        """Find the options whose days to expiration are in the DTE window.
+
+        Args:
+            options_chain: Full list of options
+
+        Returns:
+            Indexes into options_chain, in chain order
+        """
+        if not options_chain:
+            return []
+
+        dte = _days_to_expiration(
+            np.array(
+                [option.expiration for option in options_chain],
+                dtype="datetime64[D]",
+            ),
+            datetime.now().date(),
+        )
+        (in_range,) = np.nonzero(
+            (dte >= self.config.MIN_DTE) & (dte <= self.config.MAX_DTE)
+        )
+        return in_range.tolist()
 
     def filter_spreads(self, spreads: List[OptionSpread]) -> List[OptionSpread]:
         """Filter spreads by configured criteria.
@@ -187,177 +494,293 @@ def filter_spreads(self, spreads: List[OptionSpread]) -> List[OptionSpread]:
         Returns:
             Filtered list of spreads meeting criteria
         """
+        min_delta, max_delta, max_cost, min_rr = self._spread_thresholds()
         return [
             spread
             for spread in spreads
-            if self.config.MIN_DELTA <= abs(spread.delta) <= self.config.MAX_DELTA
-            and spread.cost <= self.config.MAX_SPREAD_COST
-            and spread.reward_risk_ratio >= self.config.MIN_REWARD_RISK
-            and spread.cost > 0  # Avoid zero or negative cost spreads (data errors)
+            if min_delta <= abs(spread.delta) <= max_delta
+            # Positive cost also screens out zero/negative cost data errors
+            and 0 < spread.cost <= max_cost
+            and spread.reward_risk_ratio >= min_rr
         ]
 
+    def _spread_thresholds(self) -> Tuple[float, float, float, float]:
+        """Read the spread filter thresholds from config in one go.
+
+        Returns:
+            Tuple of (min_delta, max_delta, max_cost, min_reward_risk)
+        """
+        config = self.config
+        return (
+            config.MIN_DELTA,
+            config.MAX_DELTA,
+            config.MAX_SPREAD_COST,
+            config.MIN_REWARD_RISK,
+        )
+
+    def filter_spread_arrays(
+        self,
+        cost: np.ndarray,
+        delta: np.ndarray,
+        reward_risk: np.ndarray,
+        valid: Optional[np.ndarray] = None,
+        top_k: Optional[int] = None,
+    ) -> np.ndarray:
+        """Filter and rank spreads held as parallel arrays.
+
+        Applies the same criteria as filter_spreads and orders the survivors
+        like rank_by_reward_risk, without building OptionSpread objects.
+
+        Args:
+            cost: Spread cost in dollars
+            delta: Net delta of each spread
+            reward_risk: Reward-to-risk ratio of each spread
+            valid: Optional mask of rows eligible for selection
+            top_k: If given, only return the best top_k spreads
+
+        Returns:
+            Indices of spreads meeting criteria, highest reward/risk first
+        """
+        min_delta, max_delta, max_cost, min_rr = self._spread_thresholds()
+        abs_delta = np.abs(delta)
+        mask = (
+            (abs_delta >= min_delta)
+            & (abs_delta <= max_delta)
+            & (cost <= max_cost)
+            & (reward_risk >= min_rr)
+            & (cost > 0)  # Avoid zero or negative cost spreads (data errors)
+        )
+        if valid is not None:
+            mask &= valid
+
+        (candidates,) = np.nonzero(mask)
+        if top_k == 1 and candidates.size:
+            # argmax returns the first maximum, matching the stable sort
+            return candidates[[np.argmax(reward_risk[candidates])]]
+
+        order = np.argsort(-reward_risk[candidates], kind="stable")
+        return candidates[order[:top_k]]
+
     def create_call_vertical_spreads(
-        self, option_chains: Dict[date, List[Option]], current_price: float
+        self, option_chains: Dict[date, ExpiryLegs], current_price: float
     ) -> List[OptionSpread]:
         """Create bull call spreads.
 
         Args:
-            option_chains: Dictionary of options by expiration
+            option_chains: Strike-sorted (calls, puts) by expiration
             current_price: Current price of the underlying
 
         Returns:
             List of possible bull call spreads
         """
-        spreads = []
-
-        for expiry, chain in option_chains.items():
-            # Extract calls and sort by strike
-            calls = sorted(
-                [opt for opt in chain if opt.option_type == "call"],
-                key=lambda x: x.strike,
-            )
-
-            # Need at least 2 calls to create a spread
-            if len(calls) < 2:
-                continue
-
-            # Create spreads for adjacent strikes
-            for i in range(len(calls) - 1):
-                long_call = calls[i]
-                short_call = calls[i + 1]
-
-                # Create the spread
-                try:
-                    # Calculate cost (net debit)
-                    cost = long_call.ask - short_call.bid
-
-                    # Calculate max profit and loss
-                    max_profit = short_call.strike - long_call.strike - cost
-                    max_loss = cost
-
-                    # Skip if max_profit is negative or zero
-                    if max_profit <= 0:
-                        continue
-
-                    # Calculate net delta
-                    net_delta = long_call.delta - short_call.delta
-
-                    spread = OptionSpread(
-                        symbol=long_call.underlying,
-                        expiration=expiry,
-                        spread_type="BULL_CALL",
-                        long_leg=long_call,
-                        short_leg=short_call,
-                        cost=cost * 100,  # Convert to dollars (1 contract = 100 shares)
-                        max_profit=max_profit * 100,
-                        max_loss=max_loss * 100,
-                        delta=net_delta,
-                        reward_risk_ratio=max_profit / cost if cost > 0 else 0,
-                    )
+        batch = self._vertical_spread_arrays(
+            option_chains, "BULL_CALL", current_price
+        )
 
-                    spreads.append(spread)
-                except Exception as e:
-                    log_error(f"Error creating call spread: {str(e)}")
-
-        return spreads
+        # Skip if max_profit is negative or zero
+        (rows,) = np.nonzero(batch["max_profit"] > 0)
+        return self._materialize_spreads(batch, rows)
 
     def create_put_vertical_spreads(
-        self, option_chains: Dict[date, List[Option]], current_price: float
+        self, option_chains: Dict[date, ExpiryLegs], current_price: float
     ) -> List[OptionSpread]:
         """Create bear put spreads.
 
         Args:
-            option_chains: Dictionary of options by expiration
+            option_chains: Strike-sorted (calls, puts) by expiration
             current_price: Current price of the underlying
 
         Returns:
             List of possible bear put spreads
         """
-        spreads = []
+        batch = self._vertical_spread_arrays(
+            option_chains, "BEAR_PUT", current_price
+        )
+
+        # Skip if max_profit is negative or zero
+        (rows,) = np.nonzero(batch["max_profit"] > 0)
+        return self._materialize_spreads(batch, rows)
+
+    def _vertical_spread_arrays(
+        self,
+        option_chains: Dict[date, ExpiryLegs],
+        spread_type: str,
+        current_price: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Compute every adjacent-strike vertical spread as parallel arrays.
 
-        for expiry, chain in option_chains.items():
-            # Extract puts and sort by strike
-            puts = sorted(
-                [opt for opt in chain if opt.option_type == "put"],
-                key=lambda x: x.strike,
-            )
+        Args:
+            option_chains: Strike-sorted (calls, puts) by expiration
+            spread_type: "BULL_CALL" or "BEAR_PUT"
+            current_price: Current price of the underlying; when given, only
+                strikes within STRIKE_WINDOW_PCT of it are paired
 
-            # Need at least 2 puts to create a spread
-            if len(puts) < 2:
-                continue
-
-            # Create spreads for adjacent strikes
-            for i in range(len(puts) - 1):
-                short_put = puts[i]
-                long_put = puts[i + 1]
-
-                # Create the spread
-                try:
-                    # Calculate cost (net debit)
-                    cost = long_put.ask - short_put.bid
-
-                    # Calculate max profit and loss
-                    max_profit = long_put.strike - short_put.strike - cost
-                    max_loss = cost
-
-                    # Skip if max_profit is negative or zero
-                    if max_profit <= 0:
-                        continue
-
-                    # Calculate net delta
-                    net_delta = long_put.delta - short_put.delta
-
-                    spread = OptionSpread(
-                        symbol=long_put.underlying,
-                        expiration=expiry,
-                        spread_type="BEAR_PUT",
-                        long_leg=long_put,
-                        short_leg=short_put,
-                        cost=cost * 100,  # Convert to dollars (1 contract = 100 shares)
-                        max_profit=max_profit * 100,
-                        max_loss=max_loss * 100,
-                        delta=net_delta,
-                        reward_risk_ratio=max_profit / cost if cost > 0 else 0,
+        Returns:
+            Dictionary with the per-expiry legs plus one array entry per
+            candidate spread (group, long/short leg index, per-share cost,
+            max profit, net delta and reward/risk)
+        """
+        side = 0 if spread_type == "BULL_CALL" else 1  # calls or puts
+        window = getattr(self.config, "STRIKE_WINDOW_PCT", 0.10)
+
+        groups: List[Tuple[date, List[Option]]] = []
+        columns: Dict[str, List[np.ndarray]] = defaultdict(list)
+
+        for expiry, expiry_legs in option_chains.items():
+            try:
+                legs = expiry_legs[side]
+
+                # Only pair strikes inside the window around the current price
+                if current_price:
+                    strikes = [opt.strike for opt in legs]
+                    lo = bisect_left(strikes, current_price * (1 - window))
+                    hi = bisect_right(strikes, current_price * (1 + window))
+                    legs = legs[lo:hi]
+
+                # Need at least 2 legs to create a spread
+                if len(legs) < 2:
+                    continue
+
+                ask, bid, strike, delta = self._leg_arrays(legs)
+                lower = np.arange(len(legs) - 1)
+
+                if spread_type == "BULL_CALL":
+                    # Long the lower strike, short the next strike up
+                    long_idx, short_idx = lower, lower + 1
+                    cost, max_profit, net_delta, reward_risk = call_spread_kernel(
+                        ask, bid, strike, delta
+                    )
+                else:
+                    # Long the higher strike, short the next strike down
+                    long_idx, short_idx = lower + 1, lower
+                    cost, max_profit, net_delta, reward_risk = put_spread_kernel(
+                        ask, bid, strike, delta
                     )
 
-                    spreads.append(spread)
-                except Exception as e:
-                    log_error(f"Error creating put spread: {str(e)}")
+                columns["group"].append(np.full(lower.size, len(groups)))
+                columns["long_idx"].append(long_idx)
+                columns["short_idx"].append(short_idx)
+                columns["cost"].append(cost)
+                columns["max_profit"].append(max_profit)
+                columns["delta"].append(net_delta)
+                columns["reward_risk"].append(reward_risk)
+                groups.append((expiry, legs))
+            except Exception as e:
+                log_error(
+                    f"Error creating {spread_type} spreads for {expiry}: {str(e)}"
+                )
+
+        batch: Dict[str, Any] = {
+            name: np.concatenate(columns[name]) if groups else np.empty(0)
+            for name in (
+                "group",
+                "long_idx",
+                "short_idx",
+                "cost",
+                "max_profit",
+                "delta",
+                "reward_risk",
+            )
+        }
+        batch["groups"] = groups
+        batch["spread_type"] = spread_type
+        return batch
+
+    def _leg_arrays(
+        self, legs: List[Option]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Extract ask, bid, strike and delta columns from strike-sorted legs.
+
+        Args:
+            legs: Options sorted by strike
+
+        Returns:
+            Tuple of (ask, bid, strike, delta) arrays
+        """
+        ask = np.array([opt.ask for opt in legs], dtype=np.float64)
+        bid = np.array([opt.bid for opt in legs], dtype=np.float64)
+        strike = np.array([opt.strike for opt in legs], dtype=np.float64)
+        delta = np.array([opt.delta for opt in legs], dtype=np.float64)
+        return ask, bid, strike, delta
+
+    def _materialize_spreads(
+        self, batch: Dict[str, Any], rows: np.ndarray
+    ) -> List[OptionSpread]:
+        """Create OptionSpread objects for selected rows of a spread batch.
+
+        Args:
+            batch: Candidate spreads from _vertical_spread_arrays
+            rows: Row indices to materialize, in output order
+
+        Returns:
+            List of spreads
+        """
+        spread_type = batch["spread_type"]
+        groups = batch["groups"]
+
+        spreads = []
+        for i in rows.tolist():
+            expiry, legs = groups[int(batch["group"][i])]
+            long_leg = legs[int(batch["long_idx"][i])]
+            cost = float(batch["cost"][i])
+            spreads.append(
+                OptionSpread(
+                    symbol=long_leg.underlying,
+                    expiration=expiry,
+                    spread_type=spread_type,
+                    long_leg=long_leg,
+                    short_leg=legs[int(batch["short_idx"][i])],
+                    cost=cost * 100,  # Convert to dollars (1 contract = 100 shares)
+                    max_profit=float(batch["max_profit"][i]) * 100,
+                    max_loss=cost * 100,
+                    delta=float(batch["delta"][i]),
+                    reward_risk_ratio=float(batch["reward_risk"][i]),
+                )
+            )
 
         return spreads
 
-    def rank_by_reward_risk(self, spreads: List[OptionSpread]) -> List[OptionSpread]:
+    def rank_by_reward_risk(
+        self, spreads: List[OptionSpread], top_k: Optional[int] = None
+    ) -> List[OptionSpread]:
         """Rank spreads by reward-to-risk ratio.
 
         Args:
             spreads: List of spreads to rank
+            top_k: If given, only return the best top_k spreads
 
         Returns:
             Sorted list of spreads (highest reward/risk first)
         """
-        return sorted(spreads, key=lambda x: x.reward_risk_ratio, reverse=True)
+        if top_k is not None:
+            return heapq.nlargest(top_k, spreads, key=_reward_risk_key)
+        return sorted(spreads, key=_reward_risk_key, reverse=True)
 
     def get_chain_by_expiration(
-        self, chain: Dict[str, Dict[str, Any]], days_min: int, days_max: int
-    ) -> Dict[str, Dict[str, Any]]:
+        self,
+        chain: Dict[Union[str, date], Dict[str, Any]],
+        days_min: int,
+        days_max: int,
+    ) -> Dict[Union[str, date], Dict[str, Any]]:
         """Filter the option chain by expiration days.
 
         Args:
-            chain: Option chain data
+            chain: Option chain data keyed by expiration date, either as a
+                date or an ISO "YYYY-MM-DD" string
             days_min: Minimum days to expiration
             days_max: Maximum days to expiration
 
         Returns:
-            Filtered option chain
+            Filtered option chain with the original keys
         """
-        filtered: Dict[str, Dict[str, Any]] = {}
+        filtered: Dict[Union[str, date], Dict[str, Any]] = {}
+        today = datetime.now().date()
 
-        # Implement the filtering logic here
         for exp_date, options in chain.items():
-            days = (
-                datetime.strptime(exp_date, "%Y-%m-%d").date() - datetime.now().date()
-            ).days
-            if days_min <= days <= days_max:
+            expiry = (
+                exp_date if isinstance(exp_date, date) else date.fromisoformat(exp_date)
+            )
+            if days_min <= (expiry - today).days <= days_max:
                 filtered[exp_date] = options
 
         return filtered
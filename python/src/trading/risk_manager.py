@@ -1,12 +1,30 @@
 import math
+import time
 from collections import defaultdict
 from datetime import date, datetime, timedelta
 from typing import Any, DefaultDict, Dict, List, Optional, Tuple, Set
 
+import numpy as np
+
 from src.app.config import Config
 from src.models.option import OptionSpread
 from src.utils.alert_system import AlertSystem
-from src.utils.logger import log_debug, log_error, log_info, log_warning
+from src.utils.logger import (
+    is_debug_enabled,
+    log_debug,
+    log_error,
+    log_info,
+    log_warning,
+)
+
+# Exposure left in a sector/industry bucket below this is float residue
+_EXPOSURE_EPSILON = 1e-6
+
+# Minimum seconds between position refreshes from the broker
+_POSITION_REFRESH_INTERVAL = 30.0
+
+# Seconds an account summary is reused by back-to-back risk checks
+_ACCOUNT_SUMMARY_MAX_AGE = 5.0
 
 
 class RiskManager:
@@ -28,14 +46,30 @@ def __init__(
         self.config = config
         self.broker_api = broker_api
         self.alert_system = alert_system
-        self.daily_trades: Dict[str, List[Dict[str, Any]]] = {}  # Track trades by date
+        self.daily_trades: DefaultDict[date, List[Dict[str, Any]]] = defaultdict(
+            list
+        )  # Track trades by date
         self.active_positions: Dict[str, Dict[str, Any]] = {}  # Track current positions
+        # Same position entries partitioned by direction
+        self._long_positions: Dict[str, Dict[str, Any]] = {}
+        self._short_positions: Dict[str, Dict[str, Any]] = {}
         self.sector_exposure: DefaultDict[str, float] = defaultdict(
             float
         )  # Track exposure by sector
         self.industry_exposure: DefaultDict[str, float] = defaultdict(
             float
         )  # Track exposure by industry
+        # Remaining room under the sector/industry limits for the account
+        # value they were last computed at; names not listed have the full
+        # limit available
+        self._headroom_account_value: Optional[float] = None
+        self._sector_limit = 0.0
+        self._industry_limit = 0.0
+        self._sector_headroom: Dict[str, float] = {}
+        self._industry_headroom: Dict[str, float] = {}
+        self._sector_cache: Dict[
+            str, Tuple[Optional[str], Optional[str]]
+        ] = {}  # Fundamentals rarely change, so look each symbol up once
 
         # Initialize risk tracking
         self.positions: Dict[str, Dict[str, Any]] = {}
@@ -45,41 +79,256 @@ def __init__(
         self.max_positions = getattr(config, "MAX_POSITIONS", 5)
         self.max_position_size = getattr(config, "MAX_POSITION_SIZE", 10000.0)
         self.max_daily_loss = getattr(config, "MAX_DAILY_LOSS", -2000.0)
+        self._risk_per_trade = getattr(config, "RISK_PER_TRADE", 0.02)
+
+        # Risk limits read on every entry check, snapshotted from config
+        self._max_daily_trades = config.MAX_DAILY_TRADES
+        self._max_contracts = config.MAX_CONTRACTS_PER_TRADE
+        self._max_portfolio_heat = config.MAX_PORTFOLIO_HEAT
+        self._max_sector_exposure = config.MAX_SECTOR_EXPOSURE
+        self._max_industry_exposure = config.MAX_INDUSTRY_EXPOSURE
+        self._max_directional_bias = config.MAX_DIRECTIONAL_BIAS
+        self._min_buying_power = config.MIN_BUYING_POWER
+
+        # Metric fields that never change, copied into each get_metrics result
+        self._metrics_template: Dict[str, Any] = {
+            "max_daily_trades": self._max_daily_trades,
+            "max_positions": self.max_positions,
+        }
+
+        # Exit rule settings used when pricing and checking positions
+        self._stop_loss_pct = getattr(config, "STOP_LOSS_PERCENTAGE", 0.5)
+        self._target_reward_risk = getattr(config, "TARGET_REWARD_RISK", 1.5)
+        self._use_r_multiple = config.USE_R_MULTIPLE_EXIT
+        self._r_multiple_target = config.R_MULTIPLE_TARGET
+        self._min_days_to_expiry = config.MIN_DAYS_TO_EXPIRY
         
-        # Last time positions were updated
+        # Last time positions were updated; the monotonic copy drives the
+        # refresh throttle and is immune to wall clock changes
         self.last_position_update = datetime.now() - timedelta(hours=1)
+        self._last_position_update_mono = time.monotonic() - 3600.0
+
+        # Exit triggers of active_positions as parallel arrays, rebuilt
+        # lazily after positions change
+        self._exit_arrays: Optional[Dict[str, Any]] = None
 
-    def calculate_position_size(self, account_value: float, spread_cost: float) -> int:
-        """Calculate position size based on risk parameters.
+        # Last account summary fetched from the broker, shared by risk checks
+        self._account_summary: Optional[Dict[str, Any]] = None
+        self._account_summary_time = 0.0
+
+        # Cached current date, valid until the next local midnight
+        self._today: Optional[date] = None
+        self._today_rollover = 0.0  # Epoch seconds of the next midnight
+
+        # Number of trades recorded today, so limit checks read an int
+        self._trade_count_day: Optional[date] = None
+        self._today_trade_count = 0
+
+        # Running totals over active_positions, kept in step by record_trade
+        # and close_position so risk checks don't rescan every position
+        self._total_risk = 0.0
+        self._long_exposure = 0.0
+        self._short_exposure = 0.0
+
+    def _daily_trade_count(self, today: date) -> int:
+        """Get the number of trades recorded on a day.
 
         Args:
-            account_value: Current account value
-            spread_cost: Cost of the option spread per contract
+            today: Today's date key
 
         Returns:
-            Number of contracts to trade
+            Number of trades recorded today
         """
-        # Calculate risk amount based on risk percentage
-        max_risk_amount = account_value * self.config.RISK_PER_TRADE
+        if today != self._trade_count_day:
+            self._trade_count_day = today
+            self._today_trade_count = len(self.daily_trades.get(today, ()))
+        return self._today_trade_count
+
+    def _apply_position_exposure(self, position: Dict[str, Any], sign: int) -> None:
+        """Add a position to, or remove it from, the running exposure totals.
+
+        Args:
+            position: Active position entry
+            sign: 1 to add the position, -1 to remove it
+        """
+        net_risk = sign * position["net_risk"]
+        self._total_risk += net_risk
+
+        if position["direction"] == "LONG":
+            self._long_exposure += net_risk
+        else:  # SHORT
+            self._short_exposure += net_risk
 
-        # Calculate number of contracts
-        if spread_cost > 0:  # Prevent division by zero
-            # Each contract is 100 shares, so multiply spread cost by 100
-            contracts = math.floor(max_risk_amount / (spread_cost))
+    def _sync_headroom(self, account_value: float) -> None:
+        """Recompute all sector/industry headroom if the account value moved.
+
+        Args:
+            account_value: Current account value
+        """
+        if account_value == self._headroom_account_value:
+            return
+
+        self._headroom_account_value = account_value
+        self._sector_limit = account_value * self._max_sector_exposure
+        self._industry_limit = account_value * self._max_industry_exposure
+        self._sector_headroom = {
+            name: self._sector_limit - exposure
+            for name, exposure in self.sector_exposure.items()
+        }
+        self._industry_headroom = {
+            name: self._industry_limit - exposure
+            for name, exposure in self.industry_exposure.items()
+        }
+
+    def _update_headroom(self, sector: Optional[str], industry: Optional[str]) -> None:
+        """Refresh the headroom of the buckets a trade just changed.
+
+        Args:
+            sector: Sector of the traded symbol, if known
+            industry: Industry of the traded symbol, if known
+        """
+        if self._headroom_account_value is None:
+            return  # Nothing computed yet; the next entry check builds it all
+
+        if sector:
+            exposure = self.sector_exposure.get(sector)
+            if exposure is None:
+                self._sector_headroom.pop(sector, None)
+            else:
+                self._sector_headroom[sector] = self._sector_limit - exposure
+
+        if industry:
+            exposure = self.industry_exposure.get(industry)
+            if exposure is None:
+                self._industry_headroom.pop(industry, None)
+            else:
+                self._industry_headroom[industry] = self._industry_limit - exposure
+
+    @staticmethod
+    def _reduce_exposure(exposure: Dict[str, float], key: str, amount: float) -> None:
+        """Subtract from an exposure bucket, dropping it once it is used up.
+
+        Args:
+            exposure: Sector or industry exposure by name
+            key: Bucket to reduce
+            amount: Exposure to remove
+        """
+        remaining = exposure.get(key, 0.0) - amount
+        if remaining < _EXPOSURE_EPSILON:
+            exposure.pop(key, None)
         else:
-            contracts = 0
+            exposure[key] = remaining
+
+    @staticmethod
+    def _net_risk(spread: OptionSpread, contracts: int) -> float:
+        """Calculate the defined risk of a vertical spread position.
 
-        # Apply maximum contracts limit
-        contracts = min(contracts, self.config.MAX_CONTRACTS_PER_TRADE)
+        Both legs share an expiration, so the most the position can lose is
+        its max loss per contract, capped by the strike width. Spread cost
+        and max loss are already in dollars per contract.
+
+        Args:
+            spread: Option spread held
+            contracts: Number of contracts
+
+        Returns:
+            Maximum dollar loss of the position
+        """
+        per_contract = spread.max_loss if spread.max_loss > 0 else abs(spread.cost)
+        width = spread.width * 100
+        if width > 0 and per_contract > width:
+            per_contract = width
+        return per_contract * contracts
+
+    def _direction_bucket(self, direction: str) -> Dict[str, Dict[str, Any]]:
+        """Get the partition of active positions for a direction.
+
+        Args:
+            direction: Trade direction ("LONG" or "SHORT")
+
+        Returns:
+            Positions by symbol for that direction
+        """
+        return self._long_positions if direction == "LONG" else self._short_positions
 
-        # Ensure at least 1 contract (if any)
-        contracts = max(contracts, 1) if contracts > 0 else 0
+    def reconcile_exposure(self) -> None:
+        """Recompute the running exposure totals from active_positions.
+
+        Clears accumulated floating point drift and picks up any positions
+        that were edited in place.
+        """
+        self._long_exposure = sum(
+            p["net_risk"] for p in self._long_positions.values()
+        )
+        self._short_exposure = sum(
+            p["net_risk"] for p in self._short_positions.values()
+        )
+        self._total_risk = self._long_exposure + self._short_exposure
+
+    def _today_key(self, now: Optional[datetime] = None) -> date:
+        """Get the key for today's entry in daily_trades.
+
+        Dates hash and compare natively, so no string formatting is needed.
+        The date is cached and only re-read once the clock passes midnight.
+
+        Args:
+            now: Current time, if the caller already has it
+
+        Returns:
+            Today's date
+        """
+        if now is not None:
+            return now.date()
+
+        if self._today is None or time.time() >= self._today_rollover:
+            today = date.today()
+            next_midnight = datetime.combine(
+                today + timedelta(days=1), datetime.min.time()
+            )
+            self._today = today
+            self._today_rollover = next_midnight.timestamp()
+
+        return self._today
+
+    def calculate_contract_position_size(
+        self, account_value: float, spread_cost: float
+    ) -> int:
+        """Calculate the number of spread contracts to trade.
+
+        Args:
+            account_value: Current account value
+            spread_cost: Cost of the option spread per contract
+
+        Returns:
+            Number of contracts to trade
+        """
+        risk_per_trade = self._risk_per_trade
+        max_contracts = self._max_contracts
+
+        # Calculate risk amount based on risk percentage
+        max_risk_amount = account_value * risk_per_trade
+
+        # Calculate number of contracts using whole cents, rounding the budget
+        # down and the cost up so sizing never exceeds the risk budget. The
+        # inner round() drops float noise such as 3.35 * 100 = 335.00000000000006.
+        risk_cents = math.floor(round(max_risk_amount * 100, 6))
+        cost_cents = math.ceil(round(spread_cost * 100, 6))
+        contracts = risk_cents // cost_cents if cost_cents > 0 else 0
+
+        # Clamp to [0, max_contracts]
+        contracts = (
+            0
+            if contracts <= 0
+            else (contracts if contracts < max_contracts else max_contracts)
+        )
 
         log_debug(
-            f"Position sizing: Account value ${account_value:.2f}, "
-            f"Risk amount ${max_risk_amount:.2f}, "
-            f"Spread cost ${spread_cost:.2f}, "
-            f"Contracts: {contracts}"
+            "Position sizing: Account value $%.2f, Risk amount $%.2f, "
+            "Spread cost $%.2f, Contracts: %d",
+            account_value,
+            max_risk_amount,
+            spread_cost,
+            contracts,
         )
 
         return contracts
@@ -97,24 +346,25 @@ def can_enter_trade(
         Returns:
             Tuple of (can_enter, reason)
         """
-        # Check if we have reached the maximum daily trades limit
-        today = datetime.now().date()
-        today_str = today.strftime("%Y-%m-%d")
-
-        if today_str not in self.daily_trades:
-            self.daily_trades[today_str] = []
+        # Cheap in-memory checks first so rejections skip the broker calls
+        if symbol in self.banned_symbols:
+            return False, f"Symbol {symbol} is banned from trading"
 
-        if len(self.daily_trades[today_str]) >= self.config.MAX_DAILY_TRADES:
+        # Check if we have reached the maximum daily trades limit
+        if (
+            self._daily_trade_count(self._today_key())
+            >= self._max_daily_trades
+        ):
             return (
                 False,
-                f"Maximum daily trades limit ({self.config.MAX_DAILY_TRADES}) reached",
+                f"Maximum daily trades limit ({self._max_daily_trades}) reached",
             )
 
         # Check if we have reached the maximum positions limit
-        if len(self.active_positions) >= self.config.MAX_POSITIONS:
+        if len(self.active_positions) >= self.max_positions:
             return (
                 False,
-                f"Maximum positions limit ({self.config.MAX_POSITIONS}) reached",
+                f"Maximum positions limit ({self.max_positions}) reached",
             )
 
         # Check if we already have a position in this symbol
@@ -123,13 +373,47 @@ def can_enter_trade(
             if existing_direction == direction:
                 return False, f"Already have a {direction} position in {symbol}"
 
-        # Get account value and check portfolio level risk
-        account_value = self.get_account_value()
+        # Check if the daily loss limit has been reached
+        if self.daily_pnl < self.max_daily_loss:
+            return False, f"Daily loss limit reached (${self.daily_pnl:.2f})"
+
+        # Check directional bias limits
+        long_exposure, short_exposure = self.calculate_directional_exposure()
+        if direction == "LONG" and long_exposure > self._max_directional_bias * (
+            long_exposure + short_exposure
+        ):
+            msg = f"Maximum long exposure bias reached: {long_exposure:.1f}%"
+            if self.alert_system:
+                self.alert_system.send_risk_alert("Directional Bias Limit", msg)
+            return False, msg
+        elif (
+            direction == "SHORT"
+            and short_exposure
+            > self._max_directional_bias * (long_exposure + short_exposure)
+        ):
+            msg = f"Maximum short exposure bias reached: {short_exposure:.1f}%"
+            if self.alert_system:
+                self.alert_system.send_risk_alert("Directional Bias Limit", msg)
+            return False, msg
+
+        # Fetch the account summary once and check portfolio level risk
+        account_summary = self._fetch_account_summary()
+        if self.broker_api and account_summary is None:
+            return False, "Account summary unavailable"
+        account_value = self.get_account_value(account_summary)
+
+        # Check buying power while the summary is fresh
+        if account_summary is not None:
+            if account_summary.get("available_funds", 0) < self._min_buying_power:
+                msg = f"Insufficient buying power: ${account_summary.get('available_funds', 0):.2f} < ${self._min_buying_power:.2f}"
+                if self.alert_system:
+                    self.alert_system.send_risk_alert("Insufficient Buying Power", msg)
+                return False, msg
 
         # Check portfolio heat (percentage of account at risk)
-        portfolio_heat = self.calculate_portfolio_heat()
-        if portfolio_heat >= self.config.MAX_PORTFOLIO_HEAT:
-            msg = f"Maximum portfolio heat reached: {portfolio_heat:.1f}% >= {self.config.MAX_PORTFOLIO_HEAT}%"
+        portfolio_heat = self.calculate_portfolio_heat(account_value)
+        if portfolio_heat >= self._max_portfolio_heat:
+            msg = f"Maximum portfolio heat reached: {portfolio_heat:.1f}% >= {self._max_portfolio_heat}%"
             if self.alert_system:
                 self.alert_system.send_risk_alert("Portfolio Heat Limit", msg)
             return False, msg
@@ -137,12 +421,12 @@ def can_enter_trade(
         # Get sector and industry for this symbol
         sector, industry = self.get_sector_industry(symbol)
 
+        self._sync_headroom(account_value)
+
         # Check sector exposure limits
         if sector:
-            sector_exposure = self.sector_exposure.get(sector, 0)
-            if (
-                sector_exposure + cost_per_contract
-                > account_value * self.config.MAX_SECTOR_EXPOSURE
+            if cost_per_contract > self._sector_headroom.get(
+                sector, self._sector_limit
             ):
                 msg = f"Sector exposure limit reached for {sector}"
                 if self.alert_system:
@@ -151,46 +435,14 @@ def can_enter_trade(
 
         # Check industry exposure limits
         if industry:
-            industry_exposure = self.industry_exposure.get(industry, 0)
-            if (
-                industry_exposure + cost_per_contract
-                > account_value * self.config.MAX_INDUSTRY_EXPOSURE
+            if cost_per_contract > self._industry_headroom.get(
+                industry, self._industry_limit
             ):
                 msg = f"Industry exposure limit reached for {industry}"
                 if self.alert_system:
                     self.alert_system.send_risk_alert("Industry Exposure Limit", msg)
                 return False, msg
 
-        # Check directional bias limits
-        long_exposure, short_exposure = self.calculate_directional_exposure()
-        if direction == "LONG" and long_exposure > self.config.MAX_DIRECTIONAL_BIAS * (
-            long_exposure + short_exposure
-        ):
-            msg = f"Maximum long exposure bias reached: {long_exposure:.1f}%"
-            if self.alert_system:
-                self.alert_system.send_risk_alert("Directional Bias Limit", msg)
-            return False, msg
-        elif (
-            direction == "SHORT"
-            and short_exposure
-            > self.config.MAX_DIRECTIONAL_BIAS * (long_exposure + short_exposure)
-        ):
-            msg = f"Maximum short exposure bias reached: {short_exposure:.1f}%"
-            if self.alert_system:
-                self.alert_system.send_risk_alert("Directional Bias Limit", msg)
-            return False, msg
-
-        # Get account value from broker if available
-        if self.broker_api:
-            account_summary = self.broker_api.get_account_summary()
-
-            # Check if we have enough buying power
-            if account_summary.get("available_funds", 0) < self.config.MIN_BUYING_POWER:
-                msg = f"Insufficient buying power: ${account_summary.get('available_funds', 0):.2f} < ${self.config.MIN_BUYING_POWER:.2f}"
-                if self.alert_system:
-                    self.alert_system.send_risk_alert("Insufficient Buying Power", msg)
-                return False, msg
-
         return True, "Trade allowed"
 
     def record_trade(
@@ -205,13 +457,12 @@ def record_trade(
             spread: Option spread used
         """
         # Record daily trade
-        today = datetime.now().date()
-        today_str = today.strftime("%Y-%m-%d")
+        now = datetime.now()
+        today = self._today_key(now)
 
-        if today_str not in self.daily_trades:
-            self.daily_trades[today_str] = []
+        trade_count = self._daily_trade_count(today) + 1
 
-        self.daily_trades[today_str].append(
+        self.daily_trades[today].append(
             {
                 "symbol": symbol,
                 "direction": direction,
@@ -219,24 +470,80 @@ def record_trade(
                 "spread_type": spread.spread_type,
                 "expiration": spread.expiration,
                 "cost": spread.cost,
-                "timestamp": datetime.now(),
+                "timestamp": now,
             }
         )
+        self._today_trade_count = trade_count
+
+        # The fill changed buying power, so don't reuse the cached summary
+        self.invalidate_account_summary()
+
+        # Record active position, replacing any existing one in the symbol
+        previous = self.active_positions.get(symbol)
+        if previous is not None:
+            self._apply_position_exposure(previous, -1)
+
+        entry_price = spread.cost  # Per contract
+        stop_price = self.calculate_stop_price(spread)
+        target_price = self.calculate_target_price(spread, direction)
 
-        # Record active position
-        self.active_positions[symbol] = {
+        # 1R is the distance to the stop; the R-multiple exit sits N R away
+        r_value = abs(entry_price - stop_price)
+        r_offset = r_value * self._r_multiple_target
+
+        position = {
             "direction": direction,
             "contracts": contracts,
             "spread": spread,
             "entry_date": today,
-            "entry_price": spread.cost,  # Per contract
-            "stop_price": self.calculate_stop_price(spread),
-            "target_price": self.calculate_target_price(spread, direction),
+            "entry_price": entry_price,
+            "stop_price": stop_price,
+            "target_price": target_price,
+            "r_value": r_value,
+            "net_risk": self._net_risk(spread, contracts),
+            # Exit checks need no arithmetic once these are known
+            "expiry_date": spread.expiration,
+            "exit_date": spread.expiration - timedelta(days=self._min_days_to_expiry),
+            "r_exit_low": -math.inf,
+            "r_exit_high": math.inf,
         }
 
+        # Prices falling to exit_low or rising to exit_high trigger an exit
+        if direction == "LONG":
+            position.update(
+                exit_low=stop_price,
+                exit_low_reason="Stop loss triggered",
+                exit_high=target_price,
+                exit_high_reason="Profit target reached",
+                r_target_price=entry_price + r_offset,
+            )
+            if self._use_r_multiple:
+                position["r_exit_high"] = position["r_target_price"]
+        else:  # SHORT
+            position.update(
+                exit_low=target_price,
+                exit_low_reason="Profit target reached",
+                exit_high=stop_price,
+                exit_high_reason="Stop loss triggered",
+                r_target_price=entry_price - r_offset,
+            )
+            if self._use_r_multiple:
+                position["r_exit_low"] = position["r_target_price"]
+
+        self.active_positions[symbol] = position
+        self._apply_position_exposure(position, 1)
+
+        # File under its direction, dropping any replaced entry first
+        self._long_positions.pop(symbol, None)
+        self._short_positions.pop(symbol, None)
+        self._direction_bucket(direction)[symbol] = position
+        self._exit_arrays = None
+
         # Update sector and industry exposure
         sector, industry = self.get_sector_industry(symbol)
-        total_cost = spread.cost * contracts * 100  # Total position cost
+        total_cost = position["net_risk"]
+        if previous is not None:
+            total_cost -= previous["net_risk"]
 
         if sector:
             self.sector_exposure[sector] += total_cost
@@ -244,10 +551,18 @@ def record_trade(
         if industry:
             self.industry_exposure[industry] += total_cost
 
+        self._update_headroom(sector, industry)
+
         log_info(
-            f"Recorded new trade: {symbol} {direction} x{contracts} contracts, "
-            f"Daily trades: {len(self.daily_trades[today_str])}/{self.config.MAX_DAILY_TRADES}, "
-            f"Active positions: {len(self.active_positions)}/{self.config.MAX_POSITIONS}"
+            "Recorded new trade: %s %s x%d contracts, Daily trades: %d/%d, "
+            "Active positions: %d/%d",
+            symbol,
+            direction,
+            contracts,
+            trade_count,
+            self._max_daily_trades,
+            len(self.active_positions),
+            self.max_positions,
         )
 
     def close_position(self, symbol: str) -> None:
@@ -258,31 +573,41 @@ def close_position(self, symbol: str) -> None:
         """
         if symbol in self.active_positions:
             position = self.active_positions.pop(symbol)
+            self._direction_bucket(position["direction"]).pop(symbol, None)
+            self._exit_arrays = None
+
+            if self.active_positions:
+                self._apply_position_exposure(position, -1)
+            else:
+                # Reset exactly rather than leave floating point residue
+                self.reconcile_exposure()
 
             # Update sector and industry exposure
             sector, industry = self.get_sector_industry(symbol)
-            total_cost = position["spread"].cost * position["contracts"] * 100
+            total_cost = position["net_risk"]
 
             if sector:
-                self.sector_exposure[sector] -= total_cost
-                if self.sector_exposure[sector] <= 0:
-                    del self.sector_exposure[sector]
+                self._reduce_exposure(self.sector_exposure, sector, total_cost)
 
             if industry:
-                self.industry_exposure[industry] -= total_cost
-                if self.industry_exposure[industry] <= 0:
-                    del self.industry_exposure[industry]
+                self._reduce_exposure(self.industry_exposure, industry, total_cost)
+
+            self._update_headroom(sector, industry)
 
             log_info(
-                f"Closed position: {symbol} {position['direction']} x{position['contracts']} contracts, "
-                f"Active positions: {len(self.active_positions)}/{self.config.MAX_POSITIONS}"
+                "Closed position: %s %s x%d contracts, Active positions: %d/%d",
+                symbol,
+                position["direction"],
+                position["contracts"],
+                len(self.active_positions),
+                self.max_positions,
             )
 
     def update_positions_from_broker(self) -> None:
         """Update positions from broker API."""
         # Only update positions every 30 seconds
-        now = datetime.now()
-        if (now - self.last_position_update).total_seconds() < 30:
+        now = time.monotonic()
+        if now - self._last_position_update_mono < _POSITION_REFRESH_INTERVAL:
             return
             
         # Get positions from broker if API supports it
@@ -291,39 +616,50 @@ def update_positions_from_broker(self) -> None:
                 positions = self.broker_api.get_positions()
                 if positions:
                     self.positions = positions
-                    self.last_position_update = now
+                    self._last_position_update_mono = now
+                    self.last_position_update = datetime.now()
+
+                    # Periodically resync the running exposure totals
+                    self.reconcile_exposure()
                     
                     # Update daily P&L
                     realized_pnl = 0.0
                     unrealized_pnl = 0.0
                     
                     # First try to get P&L from account summary
-                    if hasattr(self.broker_api, 'get_account_summary'):
-                        account_summary = self.broker_api.get_account_summary()
-                        if account_summary:
-                            if 'realized_pnl' in account_summary and account_summary['realized_pnl'] is not None:
-                                realized_pnl = account_summary['realized_pnl']
-                            if 'unrealized_pnl' in account_summary and account_summary['unrealized_pnl'] is not None:
-                                unrealized_pnl = account_summary['unrealized_pnl']
+                    account_summary = self._fetch_account_summary()
+                    if account_summary:
+                        if 'realized_pnl' in account_summary and account_summary['realized_pnl'] is not None:
+                            realized_pnl = account_summary['realized_pnl']
+                        if 'unrealized_pnl' in account_summary and account_summary['unrealized_pnl'] is not None:
+                            unrealized_pnl = account_summary['unrealized_pnl']
                     
                     # If P&L not found in account summary, try to calculate from positions
                     if realized_pnl == 0:
-                        for position in self.positions.values():
-                            if "realized_pnl" in position:
-                                realized_pnl += position.get("realized_pnl", 0.0)
-                            if "unrealized_pnl" in position:
-                                unrealized_pnl += position.get("unrealized_pnl", 0.0)
+                        broker_positions = self.positions.values()
+                        realized_pnl = sum(
+                            p.get("realized_pnl", 0.0) for p in broker_positions
+                        )
+                        unrealized_pnl += sum(
+                            p.get("unrealized_pnl", 0.0) for p in broker_positions
+                        )
                     
                     self.daily_pnl = realized_pnl
                     
                     # Log updated positions with P&L information
                     if self.positions:
-                        position_summary = ", ".join([
-                            f"{symbol}: {pos['quantity']} @ ${pos.get('avg_price', 0):.2f}"
-                            for symbol, pos in self.positions.items()
-                        ])
-                        log_info(f"Updated positions: {position_summary}")
-                        log_info(f"P&L: Realized=${realized_pnl:.2f}, Unrealized=${unrealized_pnl:.2f}")
+                        log_info("Updated %d positions", len(self.positions))
+                        if is_debug_enabled():
+                            position_summary = ", ".join(
+                                f"{symbol}: {pos['quantity']} @ ${pos.get('avg_price', 0):.2f}"
+                                for symbol, pos in self.positions.items()
+                            )
+                            log_debug("Position details: %s", position_summary)
+                        log_info(
+                            "P&L: Realized=$%.2f, Unrealized=$%.2f",
+                            realized_pnl,
+                            unrealized_pnl,
+                        )
                     else:
                         log_info("No positions found")
             except Exception as e:
@@ -340,47 +676,48 @@ def can_trade_symbol(self, symbol: str) -> bool:
         """
         # Check if symbol is banned
         if symbol in self.banned_symbols:
-            log_warning(f"Symbol {symbol} is banned from trading")
+            log_warning("Symbol %s is banned from trading", symbol)
             return False
             
         # Check if we have too many positions
         if len(self.positions) >= self.max_positions and symbol not in self.positions:
-            log_warning(f"Maximum positions reached ({self.max_positions}), can't open new position for {symbol}")
+            log_warning(
+                "Maximum positions reached (%d), can't open new position for %s",
+                self.max_positions,
+                symbol,
+            )
             return False
             
         # Check if daily loss limit has been reached
         if self.daily_pnl < self.max_daily_loss:
-            log_warning(f"Daily loss limit reached (${self.daily_pnl:.2f}), stopping trading")
+            log_warning(
+                "Daily loss limit reached ($%.2f), stopping trading", self.daily_pnl
+            )
             return False
             
         # All checks passed
         return True
         
-    def calculate_position_size(self, symbol: str, price: float) -> int:
-        """Calculate the appropriate position size for a trade.
+    def calculate_share_position_size(self, symbol: str, price: float) -> int:
+        """Calculate the number of shares to trade in an underlying.
         
         Args:
             symbol: Symbol to trade
             price: Current price
             
         Returns:
-            Number of shares/contracts to trade
+            Number of shares to trade
         """
         # Get account value or use default
         account_value = 100000.0  # Default
         
         # If broker API supports getting account summary, use that
-        if hasattr(self.broker_api, 'get_account_summary'):
-            try:
-                account_summary = self.broker_api.get_account_summary()
-                if account_summary and "net_liquidation" in account_summary:
-                    account_value = account_summary["net_liquidation"]
-            except Exception as e:
-                log_warning(f"Could not get account value: {str(e)}")
+        account_summary = self._fetch_account_summary()
+        if account_summary and "net_liquidation" in account_summary:
+            account_value = account_summary["net_liquidation"]
         
         # Calculate max position size as percentage of account
-        risk_per_trade = getattr(self.config, "RISK_PER_TRADE", 0.02)  # Default 2%
-        max_risk = account_value * risk_per_trade
+        max_risk = account_value * self._risk_per_trade
         
         # Calculate position size based on price
         position_size = int(max_risk / price)
@@ -391,22 +728,87 @@ def calculate_position_size(self, symbol: str, price: float) -> int:
             
         return max(1, position_size)  # Ensure minimum of 1
 
-    def get_account_value(self) -> float:
+    def _call_broker(self, method: str) -> Any:
+        """Call a no-argument broker method if the broker supports it.
+
+        Args:
+            method: Broker API method name
+
+        Returns:
+            Method result, or None if unsupported or the call failed
+        """
+        func = getattr(self.broker_api, method, None)
+        if func is None:
+            return None
+        try:
+            return func()
+        except Exception as e:
+            log_error(f"Error calling broker {method}: {str(e)}")
+            return None
+
+    def invalidate_account_summary(self) -> None:
+        """Force the next risk check to fetch a fresh account summary."""
+        self._account_summary = None
+
+    def _fetch_account_summary(
+        self, max_age_s: float = _ACCOUNT_SUMMARY_MAX_AGE
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the account summary from the broker.
+
+        A summary younger than max_age_s is reused, so a burst of risk checks
+        and position refreshes shares one get_account_summary() call.
+        Positions are only fetched by update_positions_from_broker.
+
+        Args:
+            max_age_s: Maximum age in seconds of a reusable summary
+
+        Returns:
+            Account summary, or None if the broker is unavailable or failed
+        """
+        if not self.broker_api:
+            return None
+
+        now = time.monotonic()
+        if (
+            self._account_summary is not None
+            and now - self._account_summary_time < max_age_s
+        ):
+            return self._account_summary
+
+        account_summary = self._call_broker("get_account_summary")
+
+        # Failed fetches aren't cached; the next call retries
+        if account_summary is not None:
+            self._account_summary = account_summary
+            self._account_summary_time = now
+
+        return account_summary
+
+    def get_account_value(
+        self, account_summary: Optional[Dict[str, Any]] = None
+    ) -> float:
         """Get the current account value.
 
+        Args:
+            account_summary: Account summary already fetched by the caller;
+                fetched from the broker when omitted
+
         Returns:
             Account value or default value if broker not available
         """
-        if self.broker_api and hasattr(self.broker_api, 'get_account_summary'):
+        if account_summary is None:
+            account_summary = self._fetch_account_summary()
+
+        if account_summary is not None:
             try:
-                account_summary = self.broker_api.get_account_summary()
-                
                 # Try different fields in order of preference
                 for field in ['net_liquidation', 'equity_with_loan', 'total_cash_value', 'portfolio_value']:
                     if field in account_summary and account_summary[field] is not None:
                         account_value = float(account_summary[field])
                         if account_value > 0:
-                            log_debug(f"Using {field}=${account_value:.2f} as account value")
+                            log_debug(
+                                "Using %s=$%.2f as account value", field, account_value
+                            )
                             return account_value
                 
                 # Log warning if no valid value found
@@ -429,9 +831,7 @@ def calculate_stop_price(self, option_spread: OptionSpread) -> float:
         """
         # For a vertical spread, the stop is typically based on a percentage of the spread's cost
         # or a maximum dollar loss amount
-        stop_percentage = getattr(
-            self.config, "STOP_LOSS_PERCENTAGE", 0.5
-        )  # Default to 50% loss
+        stop_percentage = self._stop_loss_pct  # Default to 50% loss
 
         # Calculate stop price
         stop_price = option_spread.cost * (1 - stop_percentage)
@@ -454,7 +854,7 @@ def calculate_target_price(
             Target price
         """
         # Get reward-to-risk ratio from config
-        target_reward_risk = getattr(self.config, "TARGET_REWARD_RISK", 1.5)
+        target_reward_risk = self._target_reward_risk
 
         # Calculate the max possible value of the spread
         if direction == "LONG":
@@ -504,65 +904,106 @@ def should_exit_position(
         Returns:
             Tuple of (should_exit, reason)
         """
-        if symbol not in self.active_positions:
+        position = self.active_positions.get(symbol)
+        if position is None:
             return False, "Position not found"
 
-        position = self.active_positions[symbol]
-        direction = position["direction"]
-
-        # Check stop loss
-        if direction == "LONG" and current_price <= position["stop_price"]:
-            return True, "Stop loss triggered"
-        elif direction == "SHORT" and current_price >= position["stop_price"]:
-            return True, "Stop loss triggered"
-
-        # Check profit target
-        if direction == "LONG" and current_price >= position["target_price"]:
-            return True, "Profit target reached"
-        elif direction == "SHORT" and current_price <= position["target_price"]:
-            return True, "Profit target reached"
+        # Check stop loss and profit target (sides depend on direction)
+        if current_price <= position["exit_low"]:
+            return True, position["exit_low_reason"]
+        if current_price >= position["exit_high"]:
+            return True, position["exit_high_reason"]
 
         # Check time-based exit (option expiration approach)
-        days_to_expiry = (position["spread"].expiration - datetime.now().date()).days
-        if days_to_expiry <= self.config.MIN_DAYS_TO_EXPIRY:
+        today = self._today_key()
+        if today >= position["exit_date"]:
+            days_to_expiry = (position["expiry_date"] - today).days
             return True, f"Position close to expiry ({days_to_expiry} days)"
 
         # Check R-multiple exit (if price moved in favorable direction)
-        if self.config.USE_R_MULTIPLE_EXIT:
-            entry_price = position["entry_price"]
-            stop_price = position["stop_price"]
-            r_value = abs(entry_price - stop_price)  # 1R
-
-            if direction == "LONG" and current_price >= entry_price + (
-                r_value * self.config.R_MULTIPLE_TARGET
-            ):
-                return (
-                    True,
-                    f"R-multiple target reached ({self.config.R_MULTIPLE_TARGET}R)",
-                )
-            elif direction == "SHORT" and current_price <= entry_price - (
-                r_value * self.config.R_MULTIPLE_TARGET
-            ):
-                return (
-                    True,
-                    f"R-multiple target reached ({self.config.R_MULTIPLE_TARGET}R)",
-                )
+        if (
+            current_price <= position["r_exit_low"]
+            or current_price >= position["r_exit_high"]
+        ):
+            return True, f"R-multiple target reached ({self._r_multiple_target}R)"
 
         return False, "No exit criteria met"
 
-    def calculate_portfolio_heat(self) -> float:
+    def should_exit_positions(self, prices: Dict[str, float]) -> List[Tuple[str, str]]:
+        """Check every active position for an exit in one vectorized pass.
+
+        Applies the same rules as should_exit_position. Positions without a
+        price are skipped.
+
+        Args:
+            prices: Current price of each position by symbol
+
+        Returns:
+            List of (symbol, reason) for positions that should be exited
+        """
+        if not self.active_positions:
+            return []
+
+        arrays = self._exit_arrays
+        if arrays is None:
+            arrays = self._exit_arrays = self._build_exit_arrays()
+
+        symbols = arrays["symbols"]
+        current = np.fromiter(
+            (prices.get(symbol, np.nan) for symbol in symbols),
+            dtype=np.float64,
+            count=len(symbols),
+        )
+
+        hit = (
+            (current <= arrays["exit_low"])
+            | (current >= arrays["exit_high"])
+            | (current <= arrays["r_exit_low"])
+            | (current >= arrays["r_exit_high"])
+        )
+        hit |= arrays["exit_ordinal"] <= self._today_key().toordinal()
+        hit &= ~np.isnan(current)  # Skip positions without a price
+
+        # Only positions that hit are revisited to pick the exit reason
+        exits = []
+        for i in np.flatnonzero(hit).tolist():
+            symbol = symbols[i]
+            _, reason = self.should_exit_position(symbol, float(current[i]))
+            exits.append((symbol, reason))
+
+        return exits
+
+    def _build_exit_arrays(self) -> Dict[str, Any]:
+        """Lay out the exit triggers of active positions as parallel arrays.
+
+        Returns:
+            Dictionary of symbols plus one array per trigger
+        """
+        positions = list(self.active_positions.values())
+        arrays: Dict[str, Any] = {"symbols": list(self.active_positions)}
+        for name in ("exit_low", "exit_high", "r_exit_low", "r_exit_high"):
+            arrays[name] = np.array(
+                [position[name] for position in positions], dtype=np.float64
+            )
+        arrays["exit_ordinal"] = np.array(
+            [position["exit_date"].toordinal() for position in positions],
+            dtype=np.int64,
+        )
+        return arrays
+
+    def calculate_portfolio_heat(self, account_value: Optional[float] = None) -> float:
         """Calculate current portfolio heat (percentage of account at risk).
 
+        Args:
+            account_value: Account value already known to the caller;
+                fetched from the broker when omitted
+
         Returns:
             Portfolio heat percentage
         """
-        account_value = self.get_account_value()
-        total_risk = 0.0
-
-        for symbol, position in self.active_positions.items():
-            position_cost = position["entry_price"] * position["contracts"] * 100
-            position_risk = position_cost * self.config.RISK_PER_TRADE
-            total_risk += position_risk
+        if account_value is None:
+            account_value = self.get_account_value()
+        total_risk = self._total_risk
 
         portfolio_heat = (total_risk / account_value) * 100 if account_value > 0 else 0
         return portfolio_heat
@@ -573,16 +1014,8 @@ def calculate_directional_exposure(self) -> Tuple[float, float]:
         Returns:
             Tuple of (long_exposure_percent, short_exposure_percent)
         """
-        long_exposure = 0.0
-        short_exposure = 0.0
-
-        for symbol, position in self.active_positions.items():
-            position_cost = position["entry_price"] * position["contracts"] * 100
-
-            if position["direction"] == "LONG":
-                long_exposure += position_cost
-            else:  # SHORT
-                short_exposure += position_cost
+        long_exposure = self._long_exposure
+        short_exposure = self._short_exposure
 
         total_exposure = long_exposure + short_exposure
 
@@ -604,46 +1037,68 @@ def get_sector_industry(self, symbol: str) -> Tuple[Optional[str], Optional[str]
         Returns:
             Tuple of (sector, industry)
         """
+        cached = self._sector_cache.get(symbol)
+        if cached is not None:
+            return cached
+
         # This would typically use an external data source or API
         # For now, return placeholder values
         if self.broker_api:
             try:
                 sector_data = self.broker_api.get_symbol_fundamentals(symbol)
-                return sector_data.get("sector"), sector_data.get("industry")
+                result = sector_data.get("sector"), sector_data.get("industry")
+                self._sector_cache[symbol] = result
+                return result
             except Exception as e:
+                # Failed lookups are not cached so the next call retries
                 log_error(f"Error getting sector/industry data: {str(e)}")
 
         return None, None
 
+    def refresh_fundamentals(self, symbol: Optional[str] = None) -> None:
+        """Drop cached sector/industry data so it is fetched again.
+
+        Args:
+            symbol: Symbol to refresh (default: all symbols)
+        """
+        if symbol is None:
+            self._sector_cache.clear()
+        else:
+            self._sector_cache.pop(symbol, None)
+
     def get_metrics(self) -> Dict[str, Any]:
         """Get risk management metrics.
 
         Returns:
             Dictionary of risk metrics
         """
-        today = datetime.now().date()
-        today_str = today.strftime("%Y-%m-%d")
+        metrics = self.get_metrics_lightweight()
+        metrics["sector_exposure"] = dict(self.sector_exposure)
+        metrics["industry_exposure"] = dict(self.industry_exposure)
+        return metrics
+
+    def get_metrics_lightweight(self) -> Dict[str, Any]:
+        """Get the scalar risk metrics, without per-sector breakdowns.
+
+        Cheap enough for high-frequency polling.
+
+        Returns:
+            Dictionary of risk metrics
+        """
+        daily_trades = self._daily_trade_count(self._today_key())
+        active_positions = len(self.active_positions)
 
         # Calculate portfolio metrics
-        portfolio_heat = self.calculate_portfolio_heat()
         long_exposure, short_exposure = self.calculate_directional_exposure()
 
-        return {
-            "daily_trades": len(self.daily_trades.get(today_str, [])),
-            "max_daily_trades": self.config.MAX_DAILY_TRADES,
-            "active_positions": len(self.active_positions),
-            "max_positions": self.config.MAX_POSITIONS,
-            "remaining_trades_today": max(
-                0,
-                self.config.MAX_DAILY_TRADES
-                - len(self.daily_trades.get(today_str, [])),
-            ),
-            "remaining_positions": max(
-                0, self.config.MAX_POSITIONS - len(self.active_positions)
-            ),
-            "portfolio_heat": portfolio_heat,
-            "long_exposure": long_exposure,
-            "short_exposure": short_exposure,
-            "sector_exposure": dict(self.sector_exposure),
-            "industry_exposure": dict(self.industry_exposure),
-        }
+        metrics = self._metrics_template.copy()
+        metrics["daily_trades"] = daily_trades
+        metrics["active_positions"] = active_positions
+        metrics["remaining_trades_today"] = max(
+            0, self._max_daily_trades - daily_trades
+        )
+        metrics["remaining_positions"] = max(0, self.max_positions - active_positions)
+        metrics["portfolio_heat"] = self.calculate_portfolio_heat()
+        metrics["long_exposure"] = long_exposure
+        metrics["short_exposure"] = short_exposure
+        return metrics
@@ -1,17 +1,39 @@
+import asyncio
+import itertools
 import time as time_module
-from datetime import datetime, time
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from time import perf_counter
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
-import pytz
 from src.app.config import Config
 from src.models.option import OptionSpread
+from src.utils.compat import DATACLASS_SLOTS
 from src.utils.logger import log_debug, log_error, log_info, log_warning
 from src.utils.time_utils import convert_to_eastern, is_market_open
 
+# Simulated broker round-trip latency in seconds
+_PAPER_LATENCY = 0.5
+_LIVE_LATENCY = 0.7  # Limit orders take longer to work
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ExecutionMetrics:
+    """Running counters for trade execution."""
+
+    total_trades: int = 0
+    successful_trades: int = 0
+    failed_trades: int = 0
+    avg_execution_time: float = 0.0
+
 
 class TradeExecutor:
     """Handles the execution of option spread trades with IBKR."""
 
+    # Process-wide sequence for synthetic order IDs
+    _order_seq = itertools.count(1)
+
     def __init__(self, config: Config, broker_api=None, alert_system=None):
         """Initialize the trade executor.
 
@@ -23,14 +45,18 @@ def __init__(self, config: Config, broker_api=None, alert_system=None):
         self.config = config
         self.broker_api = broker_api
         self.alert_system = alert_system
-        self.queued_trades: List[Dict[str, Any]] = []
+        self.queued_trades: Deque[Dict[str, Any]] = deque()
         self.trading_mode = config.TRADING_MODE or "PAPER"  # Default to paper trading
-        self.execution_metrics = {
-            "total_trades": 0,
-            "successful_trades": 0,
-            "failed_trades": 0,
-            "avg_execution_time": 0,
-        }
+        # Live limit placement between bid (0) and ask (1), defaults to 0.4
+        self._price_improvement_factor = getattr(
+            config, "PRICE_IMPROVEMENT_FACTOR", 0.4
+        )
+        self.execution_metrics = ExecutionMetrics()
+        # (minute, result) of the last execution-window check
+        self._valid_time_cache: Tuple[Optional[datetime], bool] = (None, False)
+        # Date part of order IDs, refreshed once the clock passes midnight
+        self._date_prefix = ""
+        self._date_prefix_rollover = 0.0
 
     def execute_trade(
         self, trade_signal: Dict, option_spread: OptionSpread, position_size: int
@@ -58,23 +84,36 @@ def execute_trade(
             }
             self.queued_trades.append(queued_trade)
 
+            symbol = trade_signal["symbol"]
+            direction = trade_signal["direction"]
+
             # Send alert about queued trade if alert_system is available
-            if self.alert_system:
-                self.alert_system.send_alert(
-                    f"Trade queued for {trade_signal['symbol']}",
-                    f"Direction: {trade_signal['direction']}, Size: {position_size}",
-                    severity="INFO",
-                )
+            self._maybe_alert(
+                "INFO",
+                "Trade queued for {symbol}",
+                "Direction: {direction}, Size: {size}",
+                symbol=symbol,
+                direction=direction,
+                size=position_size,
+            )
 
             log_info(
-                f"Trade queued for {trade_signal['symbol']} ({trade_signal['direction']}) - "
-                f"Will execute after 3PM ET"
+                "Trade queued for %s (%s) - Will execute after 3PM ET",
+                symbol,
+                direction,
+                extra={
+                    "event": "trade",
+                    "status": "QUEUED",
+                    "symbol": symbol,
+                    "direction": direction,
+                    "size": position_size,
+                },
             )
             return "QUEUED", "Trade queued for execution after 3PM ET"
 
         # Execute the trade
         try:
-            start_time = time_module.time()
+            start_time = perf_counter()
 
             # Different execution methods based on trading mode
             if self.trading_mode == "PAPER":
@@ -86,45 +125,127 @@ def execute_trade(
                     trade_signal, option_spread, position_size
                 )
 
-            execution_time = time_module.time() - start_time
+            execution_time = perf_counter() - start_time
+        except Exception as e:
+            return self._record_failure(trade_signal, str(e))
 
-            # Update execution metrics
-            self.execution_metrics["total_trades"] += 1
-            self.execution_metrics["successful_trades"] += 1
-            self._update_avg_execution_time(execution_time)
+        return self._record_success(
+            trade_signal, position_size, order_id, execution_time
+        )
 
-            # Send alert about executed trade if alert_system is available
-            if self.alert_system:
-                self.alert_system.send_alert(
-                    f"Trade executed for {trade_signal['symbol']}",
-                    f"Direction: {trade_signal['direction']}, Size: {position_size}, Order ID: {order_id}",
-                    severity="INFO",
-                )
+    def _record_success(
+        self,
+        trade_signal: Dict,
+        position_size: int,
+        order_id: str,
+        execution_time: float,
+    ) -> Tuple[str, Any]:
+        """Update metrics and notify about an executed trade.
 
-            log_info(
-                f"Trade executed for {trade_signal['symbol']} ({trade_signal['direction']}) - "
-                f"Order ID: {order_id}, Execution time: {execution_time:.2f}s"
-            )
+        Args:
+            trade_signal: The trade signal
+            position_size: Number of contracts traded
+            order_id: Order ID returned by the execution method
+            execution_time: Execution time in seconds
 
-            return "EXECUTED", order_id
-        except Exception as e:
-            error_msg = str(e)
-            self.execution_metrics["total_trades"] += 1
-            self.execution_metrics["failed_trades"] += 1
+        Returns:
+            Tuple of ("EXECUTED", order_id)
+        """
+        # Update execution metrics
+        metrics = self.execution_metrics
+        metrics.total_trades += 1
+        metrics.successful_trades += 1
+        self._update_avg_execution_time(execution_time)
+
+        symbol = trade_signal["symbol"]
+        direction = trade_signal["direction"]
+
+        # Send alert about executed trade if alert_system is available
+        self._maybe_alert(
+            "INFO",
+            "Trade executed for {symbol}",
+            "Direction: {direction}, Size: {size}, Order ID: {order_id}",
+            symbol=symbol,
+            direction=direction,
+            size=position_size,
+            order_id=order_id,
+        )
 
-            log_error(
-                f"Trade execution failed for {trade_signal['symbol']}: {error_msg}"
-            )
+        log_info(
+            "Trade executed for %s (%s) - Order ID: %s, Execution time: %.2fs",
+            symbol,
+            direction,
+            order_id,
+            execution_time,
+            extra={
+                "event": "trade",
+                "status": "EXECUTED",
+                "symbol": symbol,
+                "direction": direction,
+                "size": position_size,
+                "order_id": order_id,
+                "exec_time_ms": round(execution_time * 1000.0, 1),
+            },
+        )
 
-            # Send alert about failed trade if alert_system is available
-            if self.alert_system:
-                self.alert_system.send_alert(
-                    f"Trade execution failed for {trade_signal['symbol']}",
-                    error_msg,
-                    severity="HIGH",
-                )
+        return "EXECUTED", order_id
+
+    def _record_failure(self, trade_signal: Dict, error_msg: str) -> Tuple[str, Any]:
+        """Update metrics and notify about a failed trade.
+
+        Args:
+            trade_signal: The trade signal
+            error_msg: Description of the failure
+
+        Returns:
+            Tuple of ("FAILED", error_msg)
+        """
+        metrics = self.execution_metrics
+        metrics.total_trades += 1
+        metrics.failed_trades += 1
+
+        symbol = trade_signal["symbol"]
+        log_error(
+            f"Trade execution failed for {symbol}: {error_msg}",
+            extra={
+                "event": "trade",
+                "status": "FAILED",
+                "symbol": symbol,
+                "direction": trade_signal["direction"],
+                "error": error_msg,
+            },
+        )
+
+        # Send alert about failed trade if alert_system is available
+        self._maybe_alert(
+            "HIGH",
+            "Trade execution failed for {symbol}",
+            "{error}",
+            symbol=symbol,
+            error=error_msg,
+        )
 
-            return "FAILED", error_msg
+        return "FAILED", error_msg
+
+    def _maybe_alert(
+        self, severity: str, title_fmt: str, body_fmt: str, **fields: Any
+    ) -> None:
+        """Send an alert if an alert system is configured.
+
+        The title and body are only formatted when an alert is actually sent.
+
+        Args:
+            severity: Alert severity
+            title_fmt: str.format template for the alert title
+            body_fmt: str.format template for the alert body
+            **fields: Values for the templates
+        """
+        if self.alert_system is None:
+            return
+
+        self.alert_system.send_alert(
+            title_fmt.format(**fields), body_fmt.format(**fields), severity=severity
+        )
 
     def _execute_paper_trade(
         self, trade_signal: Dict, option_spread: OptionSpread, position_size: int
@@ -139,24 +260,10 @@ def _execute_paper_trade(
         Returns:
             Order ID string
         """
-        # In paper trading, we need to use exact bid/ask prices as price improvement isn't modeled
-        if trade_signal["direction"] == "LONG":
-            # For LONG trades in paper mode, pay the ask price
-            price = option_spread.long_leg.ask - option_spread.short_leg.bid
-        else:
-            # For SHORT trades in paper mode, sell at the bid price
-            price = option_spread.long_leg.bid - option_spread.short_leg.ask
+        price = self._paper_fill_price(trade_signal, option_spread)
 
         # For now, simulate a broker API call with a delay
-        time_module.sleep(0.5)  # Simulate network latency
-
-        # Create a synthetic order ID
-        order_id = f"PAPER-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-
-        log_debug(
-            f"PAPER trade: {trade_signal['symbol']} {trade_signal['direction']} x{position_size} "
-            f"contracts at ${price:.2f} using {option_spread.spread_type}"
-        )
+        time_module.sleep(_PAPER_LATENCY)  # Simulate network latency
 
         # If we had a real broker API, we would call something like:
         # if self.broker_api:
@@ -169,6 +276,57 @@ def _execute_paper_trade(
         #         limit_price=None
         #     )
 
+        return self._paper_order_id(trade_signal, option_spread, position_size, price)
+
+    @staticmethod
+    def _paper_fill_price(trade_signal: Dict, option_spread: OptionSpread) -> float:
+        """Get the fill price for a paper trade.
+
+        In paper trading, we need to use exact bid/ask prices as price
+        improvement isn't modeled.
+
+        Args:
+            trade_signal: The trade signal
+            option_spread: The option spread to trade
+
+        Returns:
+            Net spread price
+        """
+        if trade_signal["direction"] == "LONG":
+            # For LONG trades in paper mode, pay the ask price
+            return option_spread.long_leg.ask - option_spread.short_leg.bid
+        # For SHORT trades in paper mode, sell at the bid price
+        return option_spread.long_leg.bid - option_spread.short_leg.ask
+
+    def _paper_order_id(
+        self,
+        trade_signal: Dict,
+        option_spread: OptionSpread,
+        position_size: int,
+        price: float,
+    ) -> str:
+        """Create a synthetic order ID for a paper trade and log it.
+
+        Args:
+            trade_signal: The trade signal
+            option_spread: The option spread traded
+            position_size: Number of contracts traded
+            price: Fill price
+
+        Returns:
+            Order ID string
+        """
+        order_id = self._next_order_id("PAPER")
+
+        log_debug(
+            "PAPER trade: %s %s x%d contracts at $%.2f using %s",
+            trade_signal["symbol"],
+            trade_signal["direction"],
+            position_size,
+            price,
+            option_spread.spread_type,
+        )
+
         return order_id
 
     def _execute_live_trade(
@@ -184,37 +342,10 @@ def _execute_live_trade(
         Returns:
             Order ID string
         """
-        # For live trading, attempt to get price improvement by placing limit orders
-        if trade_signal["direction"] == "LONG":
-            # For LONG trades in live mode, try to get fill between bid and ask
-            # Calculate midpoint or slightly better than midpoint price
-            bid = option_spread.long_leg.bid - option_spread.short_leg.ask
-            ask = option_spread.long_leg.ask - option_spread.short_leg.bid
-            # Use price improvement factor (default to 0.4 if not in config, meaning closer to bid)
-            improvement_factor = getattr(self.config, "PRICE_IMPROVEMENT_FACTOR", 0.4)
-            limit_price: float = bid + (ask - bid) * improvement_factor
-        else:
-            # For SHORT trades in live mode, try to get fill between bid and ask
-            bid = option_spread.long_leg.bid - option_spread.short_leg.ask
-            ask = option_spread.long_leg.ask - option_spread.short_leg.bid
-            # Use price improvement factor (default to 0.6 if not in config, meaning closer to ask)
-            improvement_factor = 1 - getattr(
-                self.config, "PRICE_IMPROVEMENT_FACTOR", 0.4
-            )
-            limit_price: float = bid + (ask - bid) * improvement_factor
+        limit_price = self._live_limit_price(trade_signal, option_spread)
 
         # For now, simulate a broker API call with a delay
-        time_module.sleep(
-            0.7
-        )  # Simulate network latency with longer delay for limit orders
-
-        # Create a synthetic order ID
-        order_id = f"LIVE-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-
-        log_debug(
-            f"LIVE trade: {trade_signal['symbol']} {trade_signal['direction']} x{position_size} "
-            f"contracts with limit price ${limit_price:.2f} using {option_spread.spread_type}"
-        )
+        time_module.sleep(_LIVE_LATENCY)  # Simulate network latency
 
         # If we had a real broker API, we would call something like:
         # if self.broker_api:
@@ -227,11 +358,107 @@ def _execute_live_trade(
         #         limit_price=limit_price
         #     )
 
+        return self._live_order_id(
+            trade_signal, option_spread, position_size, limit_price
+        )
+
+    def _live_limit_price(
+        self, trade_signal: Dict, option_spread: OptionSpread
+    ) -> float:
+        """Get the limit price for a live trade.
+
+        For live trading, attempt to get price improvement by placing the
+        limit between the spread's bid and ask.
+
+        Args:
+            trade_signal: The trade signal
+            option_spread: The option spread to trade
+
+        Returns:
+            Limit price for the spread
+        """
+        long_leg, short_leg = option_spread.long_leg, option_spread.short_leg
+        bid = long_leg.bid - short_leg.ask
+        ask = long_leg.ask - short_leg.bid
+        # LONG trades use the factor as-is (closer to the bid by default),
+        # SHORT trades mirror it (closer to the ask)
+        base = self._price_improvement_factor
+        improvement_factor = base if trade_signal["direction"] == "LONG" else 1 - base
+        return bid + (ask - bid) * improvement_factor
+
+    def _live_order_id(
+        self,
+        trade_signal: Dict,
+        option_spread: OptionSpread,
+        position_size: int,
+        limit_price: float,
+    ) -> str:
+        """Create a synthetic order ID for a live trade and log it.
+
+        Args:
+            trade_signal: The trade signal
+            option_spread: The option spread traded
+            position_size: Number of contracts traded
+            limit_price: Limit price of the order
+
+        Returns:
+            Order ID string
+        """
+        order_id = self._next_order_id("LIVE")
+
+        log_debug(
+            "LIVE trade: %s %s x%d contracts with limit price $%.2f using %s",
+            trade_signal["symbol"],
+            trade_signal["direction"],
+            position_size,
+            limit_price,
+            option_spread.spread_type,
+        )
+
         return order_id
 
+    def _next_order_id(self, mode: str) -> str:
+        """Create a unique synthetic order ID.
+
+        IDs combine the date with a process-wide sequence number, so trades
+        executed within the same second no longer collide.
+
+        Args:
+            mode: Order ID prefix ("PAPER" or "LIVE")
+
+        Returns:
+            Order ID string
+        """
+        if time_module.time() >= self._date_prefix_rollover:
+            today = date.today()
+            next_midnight = datetime.combine(today + timedelta(days=1), time.min)
+            self._date_prefix = today.strftime("%Y%m%d")
+            self._date_prefix_rollover = next_midnight.timestamp()
+
+        return f"{mode}-{self._date_prefix}-{next(self._order_seq)}"
+
     def is_valid_execution_time(self, current_time: datetime) -> bool:
         """Check if current time is valid for trade execution.
 
+        Args:
+            current_time: Current datetime
+
+        Returns:
+            True if valid execution time, False otherwise
+        """
+        # The answer only changes on minute boundaries, so reuse it within one
+        key = current_time.replace(second=0, microsecond=0)
+        cached_key, cached_valid = self._valid_time_cache
+        if cached_key == key:
+            return cached_valid
+
+        valid = self._check_execution_time(current_time)
+        self._valid_time_cache = (key, valid)
+        return valid
+
+    def _check_execution_time(self, current_time: datetime) -> bool:
+        """Evaluate the execution window for a point in time, without caching.
+
         Args:
             current_time: Current datetime
 
@@ -243,7 +470,7 @@ def is_valid_execution_time(self, current_time: datetime) -> bool:
 
         # Check if market is open
         if not is_market_open(et_time):
-            log_debug(f"Market is closed at {et_time}")
+            log_debug("Market is closed at %s", et_time)
             return False
 
         # Check if after 3 PM ET
@@ -260,7 +487,10 @@ def is_valid_execution_time(self, current_time: datetime) -> bool:
             return True
 
         log_debug(
-            f"Not a valid execution time: {et_time.strftime('%H:%M:%S')} ET (before 3 PM)"
+            "Not a valid execution time: %02d:%02d:%02d ET (before 3 PM)",
+            et_time.hour,
+            et_time.minute,
+            et_time.second,
         )
         return False
 
@@ -270,6 +500,10 @@ def process_queued_trades(self) -> int:
         Returns:
             Number of trades processed
         """
+        # Nothing queued is the common case; skip the clock and window checks
+        if not self.queued_trades:
+            return 0
+
         current_time = datetime.now()
 
         if not self.is_valid_execution_time(current_time):
@@ -277,40 +511,134 @@ def process_queued_trades(self) -> int:
 
         trades_processed = 0
 
-        # Process all queued trades
-        for queued_trade in self.queued_trades[:]:  # Create a copy for safe iteration
-            status, result = self.execute_trade(
-                queued_trade["signal"], queued_trade["spread"], queued_trade["size"]
-            )
+        # Drain the queue and submit everything in batched broker requests
+        pending = [
+            self.queued_trades.popleft() for _ in range(len(self.queued_trades))
+        ]
+        results = self.execute_batch(pending)
 
-            if status == "EXECUTED":
-                self.queued_trades.remove(queued_trade)
-                trades_processed += 1
+        for queued_trade, (status, result) in zip(pending, results):
+            if status != "EXECUTED":
+                # Requeue trades that did not execute
+                self.queued_trades.append(queued_trade)
+                continue
 
-                # Log successful execution from queue
-                queue_time = current_time - queued_trade["queued_at"]
-                log_info(
-                    f"Processed queued trade for {queued_trade['signal']['symbol']} after "
-                    f"{queue_time.total_seconds() / 60:.1f} minutes in queue"
-                )
+            trades_processed += 1
+
+            # Log successful execution from queue
+            queue_time = current_time - queued_trade["queued_at"]
+            log_info(
+                "Processed queued trade for %s after %.1f minutes in queue",
+                queued_trade["signal"]["symbol"],
+                queue_time.total_seconds() / 60,
+            )
 
         return trades_processed
 
+    def execute_batch(self, trades: List[Dict[str, Any]]) -> List[Tuple[str, Any]]:
+        """Execute trades in batches, one broker submission per batch.
+
+        Trades are split into batches of at most MAX_BATCH_SIZE orders and the
+        batches are submitted concurrently.
+
+        Args:
+            trades: Trade dictionaries with "signal", "spread" and "size" keys
+
+        Returns:
+            List of (status, result) tuples in the same order as trades
+        """
+        if not trades:
+            return []
+
+        batch_size = max(1, int(getattr(self.config, "MAX_BATCH_SIZE", 20)))
+        batches = [
+            trades[i : i + batch_size] for i in range(0, len(trades), batch_size)
+        ]
+
+        async def gather_batches() -> List[Any]:
+            return await asyncio.gather(
+                *(self._execute_batch_async(batch) for batch in batches),
+                return_exceptions=True,
+            )
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            batch_results = asyncio.run(gather_batches())
+        else:
+            # Already inside an event loop; asyncio.run would fail here
+            log_warning("Event loop already running, executing trades serially")
+            return [
+                self.execute_trade(t["signal"], t["spread"], t["size"]) for t in trades
+            ]
+
+        results: List[Tuple[str, Any]] = []
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, BaseException):
+                results.extend(("FAILED", str(batch_result)) for _ in batch)
+            else:
+                results.extend(batch_result)
+        return results
+
+    async def _execute_batch_async(
+        self, batch: List[Dict[str, Any]]
+    ) -> List[Tuple[str, Any]]:
+        """Submit a batch of trades in a single broker round-trip.
+
+        Args:
+            batch: Trade dictionaries with "signal", "spread" and "size" keys
+
+        Returns:
+            List of (status, result) tuples in the same order as batch
+        """
+        live = self.trading_mode != "PAPER"
+        price_order = self._live_limit_price if live else self._paper_fill_price
+        make_order_id = self._live_order_id if live else self._paper_order_id
+
+        results: Dict[int, Tuple[str, Any]] = {}
+        start_time = perf_counter()
+
+        # Price every order up front so the batch goes out in one request;
+        # an order that can't be priced fails alone, as execute_trade would
+        priced: List[Tuple[int, Dict[str, Any], float]] = []
+        for i, t in enumerate(batch):
+            try:
+                priced.append((i, t, price_order(t["signal"], t["spread"])))
+            except Exception as e:
+                results[i] = self._record_failure(t["signal"], str(e))
+
+        if priced:
+            try:
+                # Simulate one broker round-trip for the whole batch
+                await asyncio.sleep(_LIVE_LATENCY if live else _PAPER_LATENCY)
+
+                order_ids = [
+                    make_order_id(t["signal"], t["spread"], t["size"], price)
+                    for _, t, price in priced
+                ]
+
+                execution_time = perf_counter() - start_time
+            except Exception as e:
+                for i, t, _ in priced:
+                    results[i] = self._record_failure(t["signal"], str(e))
+            else:
+                for (i, t, _), order_id in zip(priced, order_ids):
+                    results[i] = self._record_success(
+                        t["signal"], t["size"], order_id, execution_time
+                    )
+
+        return [results[i] for i in range(len(batch))]
+
     def _update_avg_execution_time(self, new_time: float) -> None:
         """Update the average execution time metric.
 
         Args:
             new_time: New execution time in seconds
         """
-        if self.execution_metrics["successful_trades"] == 1:
-            self.execution_metrics["avg_execution_time"] = new_time
-        else:
-            # Calculate running average
-            successful_trades = self.execution_metrics["successful_trades"]
-            current_avg = self.execution_metrics["avg_execution_time"]
-            self.execution_metrics["avg_execution_time"] = (
-                current_avg * (successful_trades - 1) + new_time
-            ) / successful_trades
+        # Incremental running average; the first trade sets it to new_time
+        metrics = self.execution_metrics
+        avg = metrics.avg_execution_time
+        metrics.avg_execution_time = avg + (new_time - avg) / metrics.successful_trades
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get execution metrics.
@@ -318,16 +646,16 @@ def get_metrics(self) -> Dict[str, Any]:
         Returns:
             Dictionary of execution metrics
         """
+        metrics = self.execution_metrics
+        total_trades = metrics.total_trades
+        successful_trades = metrics.successful_trades
         return {
-            "total_trades": self.execution_metrics["total_trades"],
-            "successful_trades": self.execution_metrics["successful_trades"],
-            "failed_trades": self.execution_metrics["failed_trades"],
-            "avg_execution_time": self.execution_metrics["avg_execution_time"],
+            "total_trades": total_trades,
+            "successful_trades": successful_trades,
+            "failed_trades": metrics.failed_trades,
+            "avg_execution_time": metrics.avg_execution_time,
             "success_rate": (
-                self.execution_metrics["successful_trades"]
-                / self.execution_metrics["total_trades"]
-                if self.execution_metrics["total_trades"] > 0
-                else 0
+                successful_trades / total_trades if total_trades > 0 else 0
             ),
             "queued_trades": len(self.queued_trades),
         }
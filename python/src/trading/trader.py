@@ -1,7 +1,5 @@
 from typing import Dict, List, Optional, Tuple, Any
 import queue
-import threading
-import time
 from datetime import datetime
 
 from src.app.config import Config
@@ -11,7 +9,11 @@
 from src.trading.option_selector import OptionSelector
 from src.trading.risk_manager import RiskManager
 from src.trading.trade_executor import TradeExecutor
-from src.utils.logger import log_debug, log_error, log_info, log_warning
+from src.utils.logger import log_error, log_info, log_warning
+from src.utils.signal_worker import SignalWorker
+
+# Seconds between broker callback pumps on the worker thread
+_CALLBACK_INTERVAL = 1.0
 
 
 class Trader:
@@ -33,6 +35,15 @@ def __init__(self, config_file: str = "config.yaml"):
         # Connect to IBKR using the appropriate implementation
         from src.brokers import get_broker_api
         self.broker_api = get_broker_api(self.config, use_ib_insync=use_ib_insync)
+
+        # Probe optional broker methods once instead of hasattr on every call
+        broker = self.broker_api
+        self._caps = {
+            "callbacks": callable(getattr(broker, "handle_callbacks", None)),
+            "account_summary": callable(getattr(broker, "get_account_summary", None)),
+            "positions": callable(getattr(broker, "get_positions", None)),
+            "disconnect": callable(getattr(broker, "disconnect", None)),
+        }
         
         # Attempt to connect
         connected = self.broker_api.connect()
@@ -45,61 +56,49 @@ def __init__(self, config_file: str = "config.yaml"):
         self.risk_manager = RiskManager(self.config, self.broker_api)
         self.trade_executor = TradeExecutor(self.config, self.broker_api)
 
-        # Signal processing queue
-        self.signal_queue = queue.Queue()
-        self.processing = False
-        self.processing_thread = None
+        # Signals and broker housekeeping share one worker thread, so the
+        # broker client is only ever called from that thread
+        self._worker = SignalWorker(
+            self.process_signal, maxsize=getattr(self.config, "SIGNAL_QUEUE_MAX", 1000)
+        )
+        self._worker.add_task(
+            getattr(self.config, "POSITION_UPDATE_INTERVAL", 30.0),
+            self.risk_manager.update_positions_from_broker,
+        )
+        self._worker.add_task(
+            getattr(self.config, "QUEUED_TRADE_INTERVAL", 5.0),
+            self.trade_executor.process_queued_trades,
+        )
+        if self._caps["callbacks"]:
+            # Process IB callbacks to keep connection alive
+            self._worker.add_task(_CALLBACK_INTERVAL, self.broker_api.handle_callbacks)
         
         # Start processing thread if autostart enabled
         if getattr(self.config, "AUTOSTART_PROCESSING", False):
             self.start_processing()
 
+    @property
+    def signal_queue(self) -> "queue.Queue[Any]":
+        """Queue of signals waiting for the worker thread."""
+        return self._worker.queue
+
+    @property
+    def processing(self) -> bool:
+        """Whether the worker thread is running."""
+        return self._worker.running
+
     def start_processing(self) -> None:
-        """Start the signal processing thread."""
+        """Start the worker thread for signals and housekeeping."""
         if not self.processing:
-            self.processing = True
-            self.processing_thread = threading.Thread(target=self._process_signals_thread)
-            self.processing_thread.daemon = True
-            self.processing_thread.start()
+            self._worker.start()
             log_info("Started signal processing thread")
 
     def stop_processing(self) -> None:
-        """Stop the signal processing thread."""
+        """Stop the worker thread for signals and housekeeping."""
         if self.processing:
-            self.processing = False
-            if self.processing_thread:
-                self.processing_thread.join(timeout=5.0)
+            self._worker.stop()
             log_info("Stopped signal processing thread")
 
-    def _process_signals_thread(self) -> None:
-        """Background thread for processing signals from the queue."""
-        while self.processing:
-            try:
-                # Process any queued signals with a timeout
-                try:
-                    signal = self.signal_queue.get(timeout=1.0)
-                    status, result = self.process_signal(signal)
-                    log_debug(f"Signal processing result: {status} - {result}")
-                    self.signal_queue.task_done()
-                except queue.Empty:
-                    # No signals to process
-                    pass
-                    
-                # Process IB callbacks to keep connection alive
-                if self.broker_api and hasattr(self.broker_api, 'handle_callbacks'):
-                    self.broker_api.handle_callbacks()
-                    
-                # Periodically update positions from broker
-                self.risk_manager.update_positions_from_broker()
-
-                # Process any queued trades
-                self.trade_executor.process_queued_trades()
-                    
-                # Sleep to avoid excessive CPU usage
-                time.sleep(0.1)
-            except Exception as e:
-                log_error(f"Error in signal processing thread: {str(e)}")
-
     def process_signal(self, signal: Signal) -> Tuple[bool, Dict[str, Any]]:
         """Process a trading signal.
         
@@ -160,11 +159,13 @@ def add_signal(self, signal: Signal) -> bool:
             signal: Trading signal to add
             
         Returns:
-            True if successfully added
+            True if successfully added, False if the queue is full
         """
         try:
-            self.signal_queue.put(signal)
-            return True
+            if self._worker.put(signal):
+                return True
+            log_warning(f"Signal queue full, dropping signal: {signal}")
+            return False
         except Exception as e:
             log_error(f"Error adding signal to queue: {str(e)}")
             return False
@@ -178,7 +179,7 @@ def get_account_summary(self) -> Dict[str, Any]:
         if not self.broker_api:
             return {"error": "Broker API not initialized"}
             
-        if hasattr(self.broker_api, 'get_account_summary'):
+        if self._caps["account_summary"]:
             return self.broker_api.get_account_summary()
         else:
             return {"error": "Account summary not supported by broker API"}
@@ -192,7 +193,7 @@ def get_positions(self) -> Dict[str, Dict[str, Any]]:
         if not self.broker_api:
             return {}
             
-        if hasattr(self.broker_api, 'get_positions'):
+        if self._caps["positions"]:
             return self.broker_api.get_positions()
         else:
             return {}
@@ -225,11 +226,11 @@ def debug_account_info(self) -> Dict[str, Any]:
                 debug_info["connection_details"][attr] = getattr(self.broker_api, attr)
         
         # Get account summary
-        if hasattr(self.broker_api, 'get_account_summary'):
+        if self._caps["account_summary"]:
             debug_info["account_summary"] = self.broker_api.get_account_summary()
         
         # Get positions
-        if hasattr(self.broker_api, 'get_positions'):
+        if self._caps["positions"]:
             debug_info["positions"] = self.broker_api.get_positions()
         
         # Check if the account data was properly loaded
@@ -253,8 +254,11 @@ def debug_account_info(self) -> Dict[str, Any]:
     def shutdown(self) -> None:
         """Shutdown the trader and release resources."""
         self.stop_processing()
+
+        # Drop cached option chains at the session boundary
+        self.option_selector.clear_chain_cache()
         
-        if self.broker_api and hasattr(self.broker_api, 'disconnect'):
+        if self.broker_api and self._caps["disconnect"]:
             self.broker_api.disconnect()
             
         log_info("Trader shutdown complete") 
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Utilities package for IBKR Auto Vertical Spread Trader."""
 
 from .logger import (
+    JsonFormatter,
     get_logger,
+    is_debug_enabled,
     log_debug,
     log_error,
     log_info,
@@ -10,8 +12,10 @@
 )
 
 __all__ = [
+    "JsonFormatter",
     "get_logger",
     "setup_logger",
+    "is_debug_enabled",
     "log_debug",
     "log_info",
     "log_warning",
@@ -2,16 +2,237 @@
 AlertSystem for sending trading and system notifications.
 """
 
+import asyncio
+import atexit
+import heapq
+import itertools
 import json
+import math
 import os
+import queue
 import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import as_completed
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from src.utils.logger import log_debug, log_error, log_info, log_warning
+from urllib3.util.retry import Retry
+
+try:
+    import aiosmtplib
+
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from orjson import dumps as _json_bytes
+except ImportError:
+
+    def _json_bytes(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# History eviction scores alerts by severity and freshness:
+#   score = _SEVERITY_WEIGHT * rank + _FRESHNESS_WEIGHT * exp(-_FRESHNESS_DECAY * age)
+# so under a full history a fresh INFO outranks a WARNING older than ~7 minutes,
+# but never a HIGH or CRITICAL alert.
+_SEVERITY_RANK = {"INFO": 1, "WARNING": 2, "HIGH": 3, "CRITICAL": 4}
+_VALID_SEVERITIES = frozenset(_SEVERITY_RANK)
+_SEVERITY_WEIGHT = 1.0
+_FRESHNESS_WEIGHT = 2.0
+_FRESHNESS_DECAY = 1.0 / 600
+# Seconds between re-scoring the whole history as freshness decays
+_RESCORE_INTERVAL = 60.0
+
+# GSM 03.38 default alphabet; extension characters take two septets
+_GSM7_BASIC = frozenset(
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+_GSM7_EXTENDED = frozenset("^{}\\[~]|€\f")
+_GSM7_CHARS = _GSM7_BASIC | _GSM7_EXTENDED
+# Single-segment limits: GSM-7 septets, or UTF-16 code units for UCS-2
+_SMS_GSM7_LIMIT = 160
+_SMS_UCS2_LIMIT = 70
+
+
+class _Gsm7Filter(dict):
+    """str.translate table that drops characters outside the GSM-7 alphabet.
+
+    Lookups are cached, so each code point is classified only once.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = codepoint if chr(codepoint) in _GSM7_CHARS else None
+        self[codepoint] = value
+        return value
+
+
+_GSM7_FILTER = _Gsm7Filter()
+
+
+def _truncate_sms(message: str) -> str:
+    """Truncate a message to a single SMS segment.
+
+    Messages using only GSM-7 characters get 160 septets; anything else is
+    sent as UCS-2 with 70 code units, never splitting a surrogate pair.
+
+    Args:
+        message: Message text
+
+    Returns:
+        Text that fits in one segment
+    """
+    if not _GSM7_CHARS.issuperset(message):
+        # Cut the UTF-16 encoding; a split surrogate pair is dropped on decode
+        units = message.encode("utf-16-le")[: _SMS_UCS2_LIMIT * 2]
+        return units.decode("utf-16-le", "ignore")
+
+    if len(message) <= _SMS_GSM7_LIMIT // 2:
+        return message
+    septets = 0
+    for i, ch in enumerate(message):
+        septets += 2 if ch in _GSM7_EXTENDED else 1
+        if septets > _SMS_GSM7_LIMIT:
+            return message[:i]
+    return message
+
+
+# Upper bound on a single email delivery, including a reconnect
+_SMTP_TIMEOUT = 30.0
+# (connect, read) timeouts for webhook and SMS API calls
+_HTTP_TIMEOUT = (3, 5)
+# Slack allows about one webhook post per second with a small burst
+_SLACK_RATE = 1.0
+_SLACK_BURST = 3
+# Longest Retry-After we are willing to honour for a rate-limited post
+_SLACK_MAX_RETRY_AFTER = 30.0
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _http_session(
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+) -> requests.Session:
+    """Create an HTTP session for notification webhooks.
+
+    The session keeps connections alive between alerts and retries transient
+    server errors with a short backoff.
+
+    Args:
+        retry_statuses: HTTP status codes to retry
+
+    Returns:
+        Configured session
+    """
+    retries = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=retry_statuses,
+        # urllib3 retries any 429 carrying Retry-After unless told not to
+        respect_retry_after_header=429 in retry_statuses,
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries),
+    )
+    return session
+
+
+def _alert_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop used for async notification I/O.
+
+    The loop is started on first use in a daemon thread and shared by all
+    notifiers.
+
+    Returns:
+        Running event loop
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="alert-loop", daemon=True
+            ).start()
+        return _loop
+
+
+class _LoopClient:
+    """httpx.AsyncClient tied to the event loop it was created on.
+
+    Connections belong to the loop that opened them, so a client can't be
+    reused once that loop closes (for example across asyncio.run calls); a new
+    one is made whenever the running loop changes.
+    """
+
+    __slots__ = ("_loop", "_client")
+
+    def __init__(self) -> None:
+        """Initialize without a client; one is created on first use."""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Any = None
+
+    def get(self) -> Any:
+        """Get the client for the running event loop.
+
+        Returns:
+            httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self.close()
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(_HTTP_TIMEOUT[1], connect=_HTTP_TIMEOUT[0])
+            )
+            self._loop = loop
+        return self._client
+
+    def close(self) -> None:
+        """Close the client on its own loop, if that loop is still alive."""
+        client, loop = self._client, self._loop
+        self._client = self._loop = None
+        if client is None or loop is None or loop.is_closed():
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        try:
+            loop.run_until_complete(client.aclose())
+        except RuntimeError as e:
+            log_debug(f"Error closing HTTP client: {str(e)}")
+
+
+class AlertRecord(NamedTuple):
+    """An alert as kept in AlertSystem history."""
+
+    timestamp: datetime
+    message: str
+    details: Optional[str]
+    severity: str
+    channels: Tuple[str, ...]
+    success: bool
 
 
 class AlertSystem:
@@ -25,7 +246,41 @@ def __init__(self, config: Dict[str, Any]) -> None:
         """
         self.config = config
         self.notification_channels = self.setup_channels()
-        self.alert_history = []
+        # Default channels per severity, resolved once
+        self._severity_channels: Dict[str, Tuple[str, ...]] = {
+            severity: tuple(names)
+            for severity, names in (
+                getattr(config, "SEVERITY_CHANNELS", None) or {}
+            ).items()
+        }
+        # Bounded min-heap of [score, seq, created, alert]; when full the
+        # lowest-scoring alert is evicted rather than simply the oldest
+        self._history: List[List[Any]] = []
+        self._history_size = getattr(config, "ALERT_HISTORY_SIZE", 1000)
+        self._history_seq = itertools.count()
+        self._history_lock = threading.Lock()
+        self._scored_at = time.monotonic()
+
+        # Channels are sent to in parallel so a slow one doesn't hold up the rest
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="alert")
+        self._alert_timeout = getattr(config, "ALERT_TIMEOUT", 30.0)
+
+        # (severity, message) -> (last sent, occurrences since then)
+        self._dedup: Dict[Tuple[str, str], Tuple[float, int]] = {}
+        self._dedup_window = getattr(config, "ALERT_DEDUP_SECONDS", 60.0)
+        self._dedup_lock = threading.Lock()
+
+        # Non-critical alerts are batched into one digest per window, keyed
+        # by (severity, channels) -> [(headline, digest line, history record)]
+        self._digest_interval = getattr(config, "DIGEST_INTERVAL_S", 30.0)
+        self._buffer: Dict[
+            Tuple[str, Tuple[str, ...]], List[Tuple[str, str, AlertRecord]]
+        ] = {}
+        self._buffer_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # Send whatever is still buffered before the interpreter exits
+        atexit.register(self.close)
 
     def setup_channels(self) -> Dict[str, Any]:
         """Set up notification channels based on configuration.
@@ -58,7 +313,7 @@ def send_alert(
         message: str,
         details: Optional[str] = None,
         severity: str = "INFO",
-        channels: Optional[List[str]] = None,
+        channels: Optional[Sequence[str]] = None,
     ) -> bool:
         """Send an alert through configured notification channels.
 
@@ -69,62 +324,359 @@ def send_alert(
             channels: List of channels to use (if None, uses default for severity)
 
         Returns:
-            True if alert was sent successfully to at least one channel
+            True if alert was sent successfully to at least one channel, or
+            was buffered for the next digest
+        """
+        alert, formatted_alert, result = self._prepare_alert(
+            message, details, severity, channels
+        )
+        if alert is None:
+            return result
+
+        success = self._dispatch(formatted_alert, alert.channels, message)
+
+        # Record in history
+        self._record_alert(alert._replace(success=success))
+
+        return success
+
+    async def send_alert_async(
+        self,
+        message: str,
+        details: Optional[str] = None,
+        severity: str = "INFO",
+        channels: Optional[Sequence[str]] = None,
+    ) -> bool:
+        """Send an alert from a coroutine without blocking the event loop.
+
+        Same behaviour as send_alert, but channels are sent through with
+        their send_async coroutines on the caller's loop.
+
+        Args:
+            message: Alert message
+            details: Additional details (optional)
+            severity: Alert severity level (INFO, WARNING, HIGH, CRITICAL)
+            channels: List of channels to use (if None, uses default for severity)
+
+        Returns:
+            True if alert was sent successfully to at least one channel, or
+            was buffered for the next digest
+        """
+        alert, formatted_alert, result = self._prepare_alert(
+            message, details, severity, channels
+        )
+        if alert is None:
+            return result
+
+        names = [c for c in alert.channels if c in self.notification_channels]
+        success = False
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(
+                        self.notification_channels[c].send_async(formatted_alert)
+                        for c in names
+                    ),
+                    return_exceptions=True,
+                ),
+                timeout=self._alert_timeout,
+            )
+        except asyncio.TimeoutError:
+            log_error(f"Timed out sending alert through {', '.join(names)}")
+        else:
+            for channel, sent in zip(names, results):
+                if isinstance(sent, Exception):
+                    log_error(f"Failed to send alert through {channel}: {str(sent)}")
+                elif sent:
+                    success = True
+                    log_debug(f"Alert sent via {channel}: {message}")
+
+        # Record in history
+        self._record_alert(alert._replace(success=success))
+
+        return success
+
+    def _prepare_alert(
+        self,
+        message: str,
+        details: Optional[str],
+        severity: str,
+        channels: Optional[Sequence[str]],
+    ) -> Tuple[Optional[AlertRecord], str, bool]:
+        """Resolve, dedup and format an alert ahead of dispatch.
+
+        Args:
+            message: Alert message
+            details: Additional details
+            severity: Alert severity level
+            channels: Requested channels (if None, uses default for severity)
+
+        Returns:
+            Tuple of (alert, formatted alert, result). alert is None when the
+            alert was handled without dispatch (no channels, duplicate or
+            buffered for the digest); result is then the value to return.
         """
         # Default severity
-        if severity not in ["INFO", "WARNING", "HIGH", "CRITICAL"]:
+        if severity not in _VALID_SEVERITIES:
             severity = "INFO"
 
         # Determine which channels to use
         if channels is None:
             # Use default channels for this severity
-            severity_channels = getattr(self.config, "SEVERITY_CHANNELS", {})
-            channels = severity_channels.get(severity, ["email"])
+            channels = self._severity_channels.get(severity, ("email",))
+
+        # Nothing to send through (alerting disabled or misconfigured): just
+        # record it without formatting, dedup or digest buffering
+        if not any(channel in self.notification_channels for channel in channels):
+            self._record_alert(
+                AlertRecord(
+                    datetime.now(), message, details, severity, tuple(channels), False
+                )
+            )
+            return None, "", False
+
+        # Suppress repeats of an alert sent within the dedup window
+        repeats = self._check_duplicate(severity, message)
+        if repeats is None:
+            return None, "", True
 
-        # Format the alert
-        formatted_alert = self.format_alert(message, details, severity)
+        # Format the alert; the same timestamp is recorded in history
+        now = datetime.now()
+        headline = f"{message} (repeated {repeats} times)" if repeats else message
+        alert = AlertRecord(now, message, details, severity, tuple(channels), False)
+
+        # Everything below CRITICAL waits for the next digest
+        if severity != "CRITICAL" and self._digest_interval > 0:
+            line = f"- {now:%H:%M:%S} {headline}"
+            if details:
+                line += f"\n  Details: {details}"
+            self._buffer_alert((severity, alert.channels), headline, line, alert)
+            return None, "", True
+
+        return alert, self.format_alert(headline, details, severity, now), False
+
+    def _dispatch(
+        self,
+        formatted_alert: str,
+        channels: Sequence[str],
+        label: str,
+        serial: bool = False,
+        _dbg: Any = log_debug,
+        _err: Any = log_error,
+    ) -> bool:
+        """Send a formatted alert through all channels concurrently.
+
+        The logging helpers are bound as defaults so the per-channel loop
+        reads them as locals.
+
+        Args:
+            formatted_alert: Message text to send
+            channels: Channels to send through
+            label: Short description used in log messages
+            serial: Send from the calling thread, one channel at a time. The
+                pool refuses new work once the interpreter is shutting down.
 
-        # Send through each channel
+        Returns:
+            True if sent successfully to at least one channel
+        """
+        if serial:
+            sent_any = False
+            for channel in channels:
+                notifier = self.notification_channels.get(channel)
+                if notifier is not None and notifier.send(formatted_alert):
+                    sent_any = True
+                    _dbg("Alert sent via %s: %s", channel, label)
+            return sent_any
+
+        futures = {
+            self._pool.submit(
+                self.notification_channels[channel].send, formatted_alert
+            ): channel
+            for channel in channels
+            if channel in self.notification_channels
+        }
         success = False
-        for channel in channels:
-            if channel in self.notification_channels:
+        try:
+            for future in as_completed(futures, timeout=self._alert_timeout):
+                channel = futures[future]
                 try:
-                    self.notification_channels[channel].send(formatted_alert)
-                    success = True
-                    log_debug(f"Alert sent via {channel}: {message}")
+                    if future.result():
+                        success = True
+                        _dbg("Alert sent via %s: %s", channel, label)
                 except Exception as e:
-                    log_error(f"Failed to send alert through {channel}: {str(e)}")
+                    _err(f"Failed to send alert through {channel}: {str(e)}")
+        except FuturesTimeoutError:
+            pending = [c for f, c in futures.items() if not f.done()]
+            _err(f"Timed out sending alert through {', '.join(pending)}")
+        return success
 
-        # Record in history
-        self.alert_history.append(
-            {
-                "timestamp": datetime.now(),
-                "message": message,
-                "details": details,
-                "severity": severity,
-                "channels": channels,
-                "success": success,
-            }
+    def _buffer_alert(
+        self,
+        key: Tuple[str, Tuple[str, ...]],
+        headline: str,
+        line: str,
+        alert: AlertRecord,
+    ) -> None:
+        """Buffer an alert for the next digest, starting the flush timer.
+
+        Args:
+            key: (severity, channels) the alert is sent with
+            headline: Alert message as it should be sent on its own
+            line: Digest line for the alert
+            alert: History record for the alert
+        """
+        with self._buffer_lock:
+            self._buffer.setdefault(key, []).append((headline, line, alert))
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self._digest_interval, self._flush
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Send buffered alerts now instead of waiting for the digest timer."""
+        self._flush()
+
+    def close(self) -> None:
+        """Send buffered alerts and close notifier connections.
+
+        Runs automatically at interpreter exit. Alerts sent afterwards are
+        dispatched straight away instead of being buffered.
+        """
+        atexit.unregister(self.close)
+        self._digest_interval = 0
+        self._flush(serial=True)
+        for notifier in self.notification_channels.values():
+            try:
+                notifier.close()
+            except Exception as e:
+                log_debug(f"Error closing notifier: {str(e)}")
+
+    def _flush(self, serial: bool = False) -> None:
+        """Send one digest per (severity, channels) for all buffered alerts.
+
+        Args:
+            serial: Send from the calling thread instead of the channel pool
+        """
+        with self._buffer_lock:
+            buffered, self._buffer = self._buffer, {}
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        now = datetime.now()
+        for (severity, channels), entries in buffered.items():
+            if len(entries) == 1:
+                headline, _, alert = entries[0]
+                text = self.format_alert(
+                    headline, alert.details, severity, alert.timestamp
+                )
+            else:
+                stamp = now.isoformat(sep=" ", timespec="seconds")
+                lines = "\n".join(line for _, line, _ in entries)
+                text = f"[{severity} x{len(entries)}] {stamp}\n{lines}"
+
+            success = self._dispatch(
+                text, channels, f"{severity} digest of {len(entries)}", serial
+            )
+            for _, _, alert in entries:
+                self._record_alert(alert._replace(success=success))
+
+    @staticmethod
+    def _history_score(severity: str, created: float, now: float) -> float:
+        """Score an alert for history eviction.
+
+        Args:
+            severity: Alert severity level
+            created: Monotonic time the alert was recorded
+            now: Monotonic time the score is computed for
+
+        Returns:
+            Eviction score; the lowest-scoring alert is evicted first
+        """
+        # Alerts recorded after the reference time count as brand new, so
+        # freshness never exceeds 1 and can't lift an alert a severity rank
+        freshness = math.exp(-_FRESHNESS_DECAY * max(now - created, 0.0))
+        return (
+            _SEVERITY_WEIGHT * _SEVERITY_RANK[severity] + _FRESHNESS_WEIGHT * freshness
         )
 
-        return success
+    def _record_alert(self, alert: AlertRecord) -> None:
+        """Add an alert to the bounded history.
+
+        All scores are computed relative to the same reference time so the
+        heap order stays consistent; the whole heap is re-scored once that
+        reference is more than _RESCORE_INTERVAL old.
+
+        Args:
+            alert: Alert record
+        """
+        now = time.monotonic()
+        with self._history_lock:
+            heap = self._history
+            if now - self._scored_at > _RESCORE_INTERVAL:
+                self._scored_at = now
+                for item in heap:
+                    item[0] = self._history_score(item[3].severity, item[2], now)
+                heapq.heapify(heap)
+
+            score = self._history_score(alert.severity, now, self._scored_at)
+            item = [score, next(self._history_seq), now, alert]
+            if len(heap) < self._history_size:
+                heapq.heappush(heap, item)
+            else:
+                heapq.heappushpop(heap, item)
+
+    def _check_duplicate(self, severity: str, message: str) -> Optional[int]:
+        """Check an alert against the dedup cache.
 
-    def format_alert(self, message: str, details: Optional[str], severity: str) -> str:
+        Args:
+            severity: Alert severity level
+            message: Alert message
+
+        Returns:
+            None if the alert should be suppressed, otherwise the number of
+            duplicates suppressed since it was last sent
+        """
+        key = (severity, message)
+        now = time.monotonic()
+        with self._dedup_lock:
+            entry = self._dedup.get(key)
+            if entry is not None and now - entry[0] < self._dedup_window:
+                self._dedup[key] = (entry[0], entry[1] + 1)
+                return None
+
+            # Drop expired keys while we're inserting anyway
+            window = self._dedup_window
+            self._dedup = {
+                k: v for k, v in self._dedup.items() if now - v[0] < window
+            }
+            self._dedup[key] = (now, 1)
+            return entry[1] - 1 if entry is not None else 0
+
+    def format_alert(
+        self,
+        message: str,
+        details: Optional[str],
+        severity: str,
+        timestamp: Optional[datetime] = None,
+    ) -> str:
         """Format alert message with timestamp and severity.
 
         Args:
             message: Alert message
             details: Additional details
             severity: Alert severity level
+            timestamp: Alert time (default: now)
 
         Returns:
             Formatted alert message
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted = f"[{severity}] {timestamp} - {message}"
+        ts = (timestamp or datetime.now()).isoformat(sep=" ", timespec="seconds")
         if details:
-            formatted += f"\nDetails: {details}"
-        return formatted
+            return f"[{severity}] {ts} - {message}\nDetails: {details}"
+        return f"[{severity}] {ts} - {message}"
 
     def send_trade_alert(
         self,
@@ -232,13 +784,33 @@ def get_recent_alerts(self, count: int = 10) -> List[Dict[str, Any]]:
             count: Number of alerts to retrieve
 
         Returns:
-            List of recent alerts
+            List of recent alerts, oldest first
         """
-        return self.alert_history[-count:] if self.alert_history else []
+        with self._history_lock:
+            newest = heapq.nlargest(count, self._history, key=lambda item: item[1])
+        return [item[3]._asdict() for item in reversed(newest)]
 
 
 class EmailNotifier:
-    """Email notification handler."""
+    """Email notification handler.
+
+    Keeps a small pool of SMTP sessions open across alerts instead of paying
+    the connect/STARTTLS/login round trips on every message; concurrent sends
+    each check out their own session. Uses aiosmtplib on the background alert
+    loop when it is installed, smtplib otherwise.
+    """
+
+    __slots__ = (
+        "smtp_server",
+        "smtp_port",
+        "username",
+        "password",
+        "from_address",
+        "to_addresses",
+        "_to_header",
+        "_subject",
+        "_conn_pool",
+    )
 
     def __init__(self, settings: Dict[str, Any]):
         """Initialize email notifier.
@@ -253,7 +825,19 @@ def __init__(self, settings: Dict[str, Any]):
         self.from_address = settings.get("from_address", self.username)
         self.to_addresses = settings.get("to_addresses", [])
 
-    def send(self, message: str) -> bool:
+        # Headers are the same for every alert
+        self._to_header = ", ".join(self.to_addresses)
+        self._subject = "Trading System Alert"
+
+        # Session slots, each connected lazily on first use (None = closed).
+        # LIFO so sequential alerts keep reusing the same warm session.
+        self._conn_pool: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        for _ in range(max(1, settings.get("pool_size", 2))):
+            self._conn_pool.put(None)
+
+    def send(
+        self, message: str, *, _warn: Any = log_warning, _err: Any = log_error
+    ) -> bool:
         """Send email notification.
 
         Args:
@@ -263,32 +847,179 @@ def send(self, message: str) -> bool:
             True if sent successfully
         """
         if not self.to_addresses:
-            log_warning("No email recipients configured")
+            _warn("No email recipients configured")
             return False
 
         try:
-            msg = MIMEMultipart()
-            msg["From"] = self.from_address
-            msg["To"] = ", ".join(self.to_addresses)
-            msg["Subject"] = "Trading System Alert"
+            msg = self._build_message(message)
+
+            conn = self._conn_pool.get(timeout=_SMTP_TIMEOUT)
+            try:
+                if AIOSMTPLIB_AVAILABLE:
+                    conn = asyncio.run_coroutine_threadsafe(
+                        self._send_async(conn, msg), _alert_loop()
+                    ).result(timeout=_SMTP_TIMEOUT)
+                else:
+                    conn = self._send_sync(conn, msg)
+            except BaseException:
+                conn = None
+                raise
+            finally:
+                self._conn_pool.put(conn)
 
-            msg.attach(MIMEText(message, "plain"))
+            return True
+        except Exception as e:
+            _err(f"Failed to send email: {str(e)}")
+            return False
+
+    async def send_async(self, message: str) -> bool:
+        """Send email notification from a coroutine.
+
+        With aiosmtplib the message is sent on the caller's loop over its own
+        connection (pooled sessions belong to the background loop); without
+        it, send() runs in the loop's default executor.
+
+        Args:
+            message: Alert message
 
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.username, self.password)
-            server.send_message(msg)
-            server.quit()
+        Returns:
+            True if sent successfully
+        """
+        if not AIOSMTPLIB_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.send, message)
+
+        if not self.to_addresses:
+            log_warning("No email recipients configured")
+            return False
 
+        try:
+            await aiosmtplib.send(
+                self._build_message(message),
+                hostname=self.smtp_server,
+                port=self.smtp_port,
+                start_tls=True,
+                username=self.username,
+                password=self.password,
+                timeout=_SMTP_TIMEOUT,
+            )
             return True
         except Exception as e:
             log_error(f"Failed to send email: {str(e)}")
             return False
 
+    def _build_message(self, message: str) -> MIMEMultipart:
+        """Build the email for an alert.
+
+        Args:
+            message: Alert message
+
+        Returns:
+            Email message
+        """
+        msg = MIMEMultipart()
+        msg["From"] = self.from_address
+        msg["To"] = self._to_header
+        msg["Subject"] = self._subject
+
+        msg.attach(MIMEText(message, "plain"))
+        return msg
+
+    async def _send_async(self, conn: Any, msg: MIMEMultipart) -> Any:
+        """Send a message over a pooled aiosmtplib session.
+
+        Reconnects and retries once if the server dropped the session.
+
+        Args:
+            conn: Pooled session, or None if it isn't open
+            msg: Message to send
+
+        Returns:
+            Session to return to the pool
+        """
+        for attempt in range(2):
+            try:
+                if conn is None or not conn.is_connected:
+                    conn = aiosmtplib.SMTP(
+                        hostname=self.smtp_server,
+                        port=self.smtp_port,
+                        use_tls=False,
+                        start_tls=True,
+                    )
+                    await conn.connect()
+                    await conn.login(self.username, self.password)
+                await conn.send_message(msg)
+                return conn
+            except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPTimeoutError):
+                conn = None
+                if attempt:
+                    raise
+                log_debug("SMTP session lost, reconnecting")
+        return conn
+
+    def _send_sync(self, conn: Any, msg: MIMEMultipart) -> Any:
+        """Send a message over a pooled smtplib session.
+
+        Reconnects and retries once if the server dropped the session.
+
+        Args:
+            conn: Pooled session, or None if it isn't open
+            msg: Message to send
+
+        Returns:
+            Session to return to the pool
+        """
+        for attempt in range(2):
+            try:
+                if conn is None:
+                    conn = smtplib.SMTP(
+                        self.smtp_server, self.smtp_port, timeout=_SMTP_TIMEOUT
+                    )
+                    conn.starttls()
+                    conn.login(self.username, self.password)
+                conn.send_message(msg)
+                return conn
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                conn = None
+                if attempt:
+                    raise
+                log_debug("SMTP session lost, reconnecting")
+        return conn
+
+    def close(self) -> None:
+        """Close all open pooled SMTP sessions."""
+        for _ in range(self._conn_pool.qsize()):
+            conn = self._conn_pool.get()
+            self._conn_pool.put(None)
+            if conn is None:
+                continue
+            try:
+                if AIOSMTPLIB_AVAILABLE:
+                    asyncio.run_coroutine_threadsafe(
+                        conn.quit(), _alert_loop()
+                    ).result(timeout=_SMTP_TIMEOUT)
+                else:
+                    conn.quit()
+            except Exception as e:
+                log_debug(f"Error closing SMTP session: {str(e)}")
+
 
 class SMSNotifier:
     """SMS notification handler."""
 
+    __slots__ = (
+        "service",
+        "api_key",
+        "api_url",
+        "phone_numbers",
+        "gsm7_only",
+        "email_notifier",
+        "_session",
+        "_headers",
+        "_pool",
+        "_aclient",
+    )
+
     def __init__(self, settings: Dict[str, Any]):
         """Initialize SMS notifier.
 
@@ -299,6 +1030,8 @@ def __init__(self, settings: Dict[str, Any]):
         self.api_key = settings.get("api_key", "")
         self.api_url = settings.get("api_url", "")
         self.phone_numbers = settings.get("phone_numbers", [])
+        # Drop characters outside GSM-7 so alerts always get 160-char segments
+        self.gsm7_only = settings.get("gsm7_only", False)
 
         # For email-to-SMS
         self.email_notifier = None
@@ -307,7 +1040,19 @@ def __init__(self, settings: Dict[str, Any]):
             if email_settings:
                 self.email_notifier = EmailNotifier(email_settings)
 
-    def send(self, message: str) -> bool:
+        self._session = _http_session()
+        self._headers = {"Authorization": f"Bearer {self.api_key}"}
+        # Recipients are independent, so API sends go out in parallel
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(16, len(self.phone_numbers) or 1),
+            thread_name_prefix="sms",
+        )
+        # httpx client for send_async, per event loop
+        self._aclient = _LoopClient()
+
+    def send(
+        self, message: str, *, _warn: Any = log_warning, _err: Any = log_error
+    ) -> bool:
         """Send SMS notification.
 
         Args:
@@ -317,7 +1062,7 @@ def send(self, message: str) -> bool:
             True if sent successfully
         """
         if not self.phone_numbers:
-            log_warning("No SMS recipients configured")
+            _warn("No SMS recipients configured")
             return False
 
         if self.service == "email" and self.email_notifier:
@@ -326,39 +1071,142 @@ def send(self, message: str) -> bool:
         elif self.service == "api":
             # Use SMS API
             try:
-                for phone in self.phone_numbers:
-                    response = requests.post(
+                if self.gsm7_only:
+                    message = message.translate(_GSM7_FILTER)
+                text = _truncate_sms(message)
+                futures = [
+                    self._pool.submit(
+                        self._session.post,
                         self.api_url,
-                        headers={
-                            "Authorization": f"Bearer {self.api_key}",
-                            "Content-Type": "application/json",
-                        },
-                        data=json.dumps(
-                            {
-                                "to": phone,
-                                "message": message[
-                                    :160
-                                ],  # SMS typically limited to 160 chars
-                            }
-                        ),
+                        headers=self._headers,
+                        timeout=_HTTP_TIMEOUT,
+                        json={"to": phone, "message": text},
                     )
-
+                    for phone in self.phone_numbers
+                ]
+                for future in as_completed(futures):
+                    response = future.result()
                     if response.status_code != 200:
-                        log_error(f"SMS API error: {response.text}")
+                        _err(f"SMS API error: {response.text}")
                         return False
 
                 return True
             except Exception as e:
-                log_error(f"Failed to send SMS via API: {str(e)}")
+                _err(f"Failed to send SMS via API: {str(e)}")
                 return False
         else:
-            log_warning(f"Unsupported SMS service: {self.service}")
+            _warn(f"Unsupported SMS service: {self.service}")
             return False
 
+    async def send_async(self, message: str) -> bool:
+        """Send SMS notification from a coroutine.
+
+        API sends go through httpx when it is installed; otherwise send()
+        runs in the loop's default executor.
+
+        Args:
+            message: Alert message
+
+        Returns:
+            True if sent successfully
+        """
+        if self.service == "email" and self.email_notifier:
+            if not self.phone_numbers:
+                log_warning("No SMS recipients configured")
+                return False
+            return await self.email_notifier.send_async(message)
+        if self.service != "api" or not HTTPX_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.send, message)
+
+        if not self.phone_numbers:
+            log_warning("No SMS recipients configured")
+            return False
+
+        try:
+            client = self._aclient.get()
+            if self.gsm7_only:
+                message = message.translate(_GSM7_FILTER)
+            text = _truncate_sms(message)
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        self.api_url,
+                        headers=self._headers,
+                        json={"to": phone, "message": text},
+                    )
+                    for phone in self.phone_numbers
+                )
+            )
+            for response in responses:
+                if response.status_code != 200:
+                    log_error(f"SMS API error: {response.text}")
+                    return False
+
+            return True
+        except Exception as e:
+            log_error(f"Failed to send SMS via API: {str(e)}")
+            return False
+
+    def close(self) -> None:
+        """Close open HTTP and SMTP connections."""
+        if self.email_notifier:
+            self.email_notifier.close()
+        self._session.close()
+        self._aclient.close()
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    __slots__ = ("rate", "capacity", "tokens", "last_refill", "_lock")
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> float:
+        """Reserve a token.
+
+        The token is reserved even when the bucket is empty, so concurrent
+        callers are spaced out in the order they asked.
+
+        Returns:
+            Seconds to wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
 
 class SlackNotifier:
     """Slack notification handler."""
 
+    __slots__ = (
+        "webhook_url",
+        "channel",
+        "username",
+        "_session",
+        "_headers",
+        "_bucket",
+        "_payload_prefix",
+        "_aclient",
+    )
+
     def __init__(self, settings: Dict[str, Any]):
         """Initialize Slack notifier.
 
@@ -369,7 +1217,26 @@ def __init__(self, settings: Dict[str, Any]):
         self.channel = settings.get("channel", "#alerts")
         self.username = settings.get("username", "Trading Bot")
 
-    def send(self, message: str) -> bool:
+        # 429s are handled in send() so they also go through the rate limiter
+        self._session = _http_session(retry_statuses=(500, 502, 503, 504))
+        self._headers = {"Content-Type": "application/json"}
+        self._bucket = TokenBucket(rate=_SLACK_RATE, capacity=_SLACK_BURST)
+
+        # Everything but the text is fixed, so serialize it once without the
+        # closing brace and splice the text in per message
+        self._payload_prefix = _json_bytes(
+            {
+                "channel": self.channel,
+                "username": self.username,
+                "icon_emoji": ":chart_with_upwards_trend:",
+            }
+        )[:-1]
+        # httpx client for send_async, per event loop
+        self._aclient = _LoopClient()
+
+    def send(
+        self, message: str, *, _warn: Any = log_warning, _err: Any = log_error
+    ) -> bool:
         """Send Slack notification.
 
         Args:
@@ -378,23 +1245,56 @@ def send(self, message: str) -> bool:
         Returns:
             True if sent successfully
         """
+        if not self.webhook_url:
+            _warn("No Slack webhook URL configured")
+            return False
+
+        try:
+            body = self._payload_prefix + b',"text":' + _json_bytes(message) + b"}"
+
+            response = self._post(body)
+            if response.status_code == 429:
+                # Rate limited anyway; back off as instructed and retry once
+                time.sleep(self._retry_after(response))
+                response = self._post(body)
+
+            if response.status_code != 200:
+                _err(f"Slack API error: {response.text}")
+                return False
+
+            return True
+        except Exception as e:
+            _err(f"Failed to send Slack notification: {str(e)}")
+            return False
+
+    async def send_async(self, message: str) -> bool:
+        """Send Slack notification from a coroutine.
+
+        Posts through httpx when it is installed; otherwise send() runs in
+        the loop's default executor.
+
+        Args:
+            message: Alert message
+
+        Returns:
+            True if sent successfully
+        """
+        if not HTTPX_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.send, message)
+
         if not self.webhook_url:
             log_warning("No Slack webhook URL configured")
             return False
 
         try:
-            payload = {
-                "channel": self.channel,
-                "username": self.username,
-                "text": message,
-                "icon_emoji": ":chart_with_upwards_trend:",
-            }
+            body = self._payload_prefix + b',"text":' + _json_bytes(message) + b"}"
 
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
-            )
+            response = await self._post_async(body)
+            if response.status_code == 429:
+                # Rate limited anyway; back off as instructed and retry once
+                await asyncio.sleep(self._retry_after(response))
+                response = await self._post_async(body)
 
             if response.status_code != 200:
                 log_error(f"Slack API error: {response.text}")
@@ -404,3 +1304,59 @@ def send(self, message: str) -> bool:
         except Exception as e:
             log_error(f"Failed to send Slack notification: {str(e)}")
             return False
+
+    async def _post_async(self, body: bytes) -> Any:
+        """Post a payload to the webhook with httpx, waiting for the rate limiter.
+
+        Args:
+            body: Serialized JSON payload
+
+        Returns:
+            HTTP response
+        """
+        wait = self._bucket.take()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return await self._aclient.get().post(
+            self.webhook_url, content=body, headers=self._headers
+        )
+
+    def _post(self, body: bytes) -> requests.Response:
+        """Post a payload to the webhook, waiting for the rate limiter.
+
+        Args:
+            body: Serialized JSON payload
+
+        Returns:
+            HTTP response
+        """
+        wait = self._bucket.take()
+        if wait > 0:
+            time.sleep(wait)
+        return self._session.post(
+            self.webhook_url,
+            data=body,
+            headers=self._headers,
+            timeout=_HTTP_TIMEOUT,
+        )
+
+    def close(self) -> None:
+        """Close open HTTP connections."""
+        self._session.close()
+        self._aclient.close()
+
+    @staticmethod
+    def _retry_after(response: Any) -> float:
+        """Get the back-off requested by a 429 response.
+
+        Args:
+            response: Rate-limited response
+
+        Returns:
+            Seconds to wait, capped at _SLACK_MAX_RETRY_AFTER
+        """
+        try:
+            delay = float(response.headers.get("Retry-After", 1.0))
+        except ValueError:
+            delay = 1.0
+        return min(max(delay, 0.0), _SLACK_MAX_RETRY_AFTER)
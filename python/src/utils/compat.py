@@ -0,0 +1,12 @@
+"""
+Compatibility helpers for supported Python versions.
+"""
+
+import sys
+from typing import Dict
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__.
+# Use as ``@dataclass(**DATACLASS_SLOTS)``.
+DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
@@ -4,12 +4,45 @@
 
 import time
 import traceback
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
 from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple
 
 from src.utils.logger import log_debug, log_error, log_info, log_warning
 
+# Frames kept when a stack trace is attached to an alert
+_STACK_TRACE_LIMIT = 16
+
+# Nanoseconds per minute, for the monotonic timestamps kept per error
+_NS_PER_MINUTE = 60 * 1_000_000_000
+
+# Error types that always alert and can trip a component's circuit breaker
+_CRITICAL_ERRORS = frozenset(
+    {
+        "CONNECTION_ERROR",
+        "AUTHENTICATION_ERROR",
+        "ORDER_EXECUTION_ERROR",
+        "DATA_INTEGRITY_ERROR",
+        "ACCOUNT_ERROR",
+        "POSITION_ERROR",
+        "MARKET_ACCESS_ERROR",
+    }
+)
+
+
+def _wall_clock(monotonic_ns: int) -> datetime:
+    """
+    Convert a time.monotonic_ns() reading to local wall-clock time for messages.
+
+    Args:
+        monotonic_ns: Monotonic timestamp in nanoseconds
+
+    Returns:
+        Corresponding wall-clock datetime
+    """
+    offset_us = (monotonic_ns - time.monotonic_ns()) // 1000
+    return datetime.now() + timedelta(microseconds=offset_us)
+
 
 class ErrorHandler:
     """
@@ -24,11 +57,33 @@ class ErrorHandler:
 
     config: Dict[str, Any]
     alert_system: Any
-    error_counts: DefaultDict[str, int]
-    recovery_attempts: DefaultDict[str, int]
+    error_counts: DefaultDict[Tuple[str, str], int]
+    recovery_attempts: DefaultDict[Tuple[str, str], int]
     circuit_breakers: Dict[str, Dict[str, Any]]
-    last_errors: Dict[str, datetime]
-    component_errors: Dict[str, List[Dict[str, Any]]]
+    last_errors: "OrderedDict[Tuple[str, str], int]"
+    component_errors: DefaultDict[str, List[Dict[str, Any]]]
+    component_totals: DefaultDict[str, int]
+    _recovery_dispatch: Dict[str, Callable[[str, Optional[Dict]], Tuple[bool, str]]]
+
+    # Recovery handler method names by error type, per component
+    _IBKR_STRATEGIES: Dict[str, str] = {
+        "CONNECTION_ERROR": "_ibkr_reconnect",
+        "AUTHENTICATION_ERROR": "_ibkr_auth_fail",
+        "REQUEST_ERROR": "_ibkr_retry_request",
+    }
+    _DATA_PROVIDER_STRATEGIES: Dict[str, str] = {
+        "DATA_MISSING": "_data_alternate_source",
+        "CONNECTION_ERROR": "_data_reconnect",
+    }
+    _OPTION_SELECTOR_STRATEGIES: Dict[str, str] = {
+        "NO_SUITABLE_OPTIONS": "_options_relax_criteria",
+    }
+    _TRADE_EXECUTOR_STRATEGIES: Dict[str, str] = {
+        "ORDER_EXECUTION_ERROR": "_order_retry_market",
+    }
+    _RISK_MANAGER_STRATEGIES: Dict[str, str] = {
+        "POSITION_SYNC_ERROR": "_risk_refresh_positions",
+    }
 
     def __init__(
         self, config: Dict[str, Any], alert_system: Optional[Any] = None
@@ -42,11 +97,23 @@ def __init__(
         """
         self.config = config
         self.alert_system = alert_system
-        self.error_counts = defaultdict(int)  # Track errors by component:type
+        self.error_counts = defaultdict(int)  # Track errors by (component, type)
         self.recovery_attempts = defaultdict(int)  # Track recovery attempts
         self.circuit_breakers = {}  # Track circuit breaker status
-        self.last_errors = {}  # Track last error time
-        self.component_errors = {}  # Track detailed error history by component
+        # Last error time (monotonic ns) per key, least recently seen first
+        self.last_errors = OrderedDict()
+        self.component_errors = defaultdict(list)  # Error history by component
+        self.component_totals = defaultdict(int)  # Running error count by component
+        self.update_config()
+
+        # Component-specific recovery strategies; others use _generic_recovery
+        self._recovery_dispatch = {
+            "IBKR_API": self._recover_ibkr_api,
+            "DATA_PROVIDER": self._recover_data_provider,
+            "OPTION_SELECTOR": self._recover_option_selector,
+            "TRADE_EXECUTOR": self._recover_trade_executor,
+            "RISK_MANAGER": self._recover_risk_manager,
+        }
 
         # Initialize circuit breakers for critical components
         critical_components = [
@@ -60,10 +127,21 @@ def __init__(
         for component in critical_components:
             self.circuit_breakers[component] = {
                 "tripped": False,
-                "trip_time": None,
-                "reset_time": None,
+                "trip_time_ns": None,
+                "reset_time_ns": None,
             }
-            self.component_errors[component] = []
+
+    def update_config(self) -> None:
+        """
+        Refresh the thresholds cached from config.
+
+        Call this after changing config at runtime.
+        """
+        self._error_threshold = self.config.get("ERROR_THRESHOLD", 3)
+        self._max_recovery_attempts = self.config.get("MAX_RECOVERY_ATTEMPTS", 3)
+        self._cb_threshold = self.config.get("CIRCUIT_BREAKER_THRESHOLD", 5)
+        self._cb_minutes = self.config.get("CIRCUIT_BREAKER_MINUTES", 30)
+        self._include_stack = self.config.get("INCLUDE_STACK_TRACE_IN_ALERTS", False)
 
     def handle_error(
         self,
@@ -84,16 +162,15 @@ def handle_error(
         Returns:
             Tuple of (recovery_succeeded, recovery_message)
         """
-        # Get stack trace
-        stack_trace = traceback.format_exc()
-
         # Log the error
         log_error(f"Error in {component}: {error_type} - {error_msg}")
 
         # Increment error counter
-        error_key = f"{component}:{error_type}"
+        error_key = (component, error_type)
         self.error_counts[error_key] += 1
-        self.last_errors[error_key] = datetime.now()
+        self.component_totals[component] += 1
+        self.last_errors[error_key] = time.monotonic_ns()
+        self.last_errors.move_to_end(error_key)
 
         # Check circuit breaker status
         if (
@@ -106,45 +183,44 @@ def handle_error(
                 self.alert_system.send_system_alert(
                     component,
                     "CIRCUIT_BREAKER_ACTIVE",
-                    f"Circuit breaker active until {self.circuit_breakers[component]['reset_time']}",
+                    "Circuit breaker active until "
+                    f"{_wall_clock(self.circuit_breakers[component]['reset_time_ns'])}",
                 )
 
             return False, "Circuit breaker active"
 
         # Alert if critical error or threshold exceeded
-        if self.is_critical_error(error_type) or self.error_counts[
-            error_key
-        ] >= self.config.get("ERROR_THRESHOLD", 3):
+        critical = self.is_critical_error(error_type)
+        error_count = self.error_counts[error_key]
+        if critical or error_count >= self._error_threshold:
             if self.alert_system:
+                # Only format the trace when it is actually sent
+                stack_trace = ""
+                if self._include_stack:
+                    stack_trace = traceback.format_exc(limit=_STACK_TRACE_LIMIT)
                 self.alert_system.send_system_alert(
                     component,
                     "ERROR",
-                    f"{error_type}: {error_msg}\n{stack_trace if self.config.get('INCLUDE_STACK_TRACE_IN_ALERTS', False) else ''}",
+                    f"{error_type}: {error_msg}\n{stack_trace}",
                 )
 
             # Trip circuit breaker if critical and repeated errors
-            if self.is_critical_error(error_type) and self.error_counts[
-                error_key
-            ] >= self.config.get("CIRCUIT_BREAKER_THRESHOLD", 5):
+            if critical and error_count >= self._cb_threshold:
                 self._trip_circuit_breaker(component)
                 return False, "Circuit breaker tripped"
 
         # Attempt recovery if allowed
-        if self.recovery_attempts[error_key] < self.config.get(
-            "MAX_RECOVERY_ATTEMPTS", 3
-        ):
+        max_attempts = self._max_recovery_attempts
+        if self.recovery_attempts[error_key] < max_attempts:
             return self.attempt_recovery(component, error_type, context)
         else:
             if self.alert_system:
                 self.alert_system.send_system_alert(
                     component,
                     "RECOVERY_FAILED",
-                    f"Max recovery attempts ({self.config.get('MAX_RECOVERY_ATTEMPTS', 3)}) reached for {error_type}",
+                    f"Max recovery attempts ({max_attempts}) reached for {error_type}",
                 )
-            return (
-                False,
-                f"Max recovery attempts reached ({self.config.get('MAX_RECOVERY_ATTEMPTS', 3)})",
-            )
+            return False, f"Max recovery attempts reached ({max_attempts})"
 
     def is_critical_error(self, error_type: str) -> bool:
         """
@@ -156,16 +232,7 @@ def is_critical_error(self, error_type: str) -> bool:
         Returns:
             True if error is critical
         """
-        critical_errors = [
-            "CONNECTION_ERROR",
-            "AUTHENTICATION_ERROR",
-            "ORDER_EXECUTION_ERROR",
-            "DATA_INTEGRITY_ERROR",
-            "ACCOUNT_ERROR",
-            "POSITION_ERROR",
-            "MARKET_ACCESS_ERROR",
-        ]
-        return error_type in critical_errors
+        return error_type in _CRITICAL_ERRORS
 
     def attempt_recovery(
         self, component: str, error_type: str, context: Optional[Dict] = None
@@ -181,27 +248,40 @@ def attempt_recovery(
         Returns:
             Tuple of (recovery_succeeded, recovery_message)
         """
-        error_key = f"{component}:{error_type}"
+        error_key = (component, error_type)
         self.recovery_attempts[error_key] += 1
 
         log_info(
             f"Attempting recovery for {component}:{error_type} (attempt {self.recovery_attempts[error_key]})"
         )
 
-        # Component-specific recovery strategies
-        if component == "IBKR_API":
-            return self._recover_ibkr_api(error_type, context)
-        elif component == "DATA_PROVIDER":
-            return self._recover_data_provider(error_type, context)
-        elif component == "OPTION_SELECTOR":
-            return self._recover_option_selector(error_type, context)
-        elif component == "TRADE_EXECUTOR":
-            return self._recover_trade_executor(error_type, context)
-        elif component == "RISK_MANAGER":
-            return self._recover_risk_manager(error_type, context)
-        else:
+        handler = self._recovery_dispatch.get(component)
+        if handler is None:
             # Generic recovery for other components
             return self._generic_recovery(component, error_type, context)
+        return handler(error_type, context)
+
+    def _apply_strategy(
+        self,
+        strategies: Dict[str, str],
+        error_type: str,
+        context: Optional[Dict],
+    ) -> Tuple[bool, str]:
+        """
+        Run the recovery handler registered for an error type.
+
+        Args:
+            strategies: Mapping of error type to handler method name
+            error_type: Type of error
+            context: Additional context
+
+        Returns:
+            Tuple of (recovery_succeeded, recovery_message)
+        """
+        strategy = strategies.get(error_type)
+        if strategy is None:
+            return False, f"No recovery strategy for {error_type}"
+        return getattr(self, strategy)(context)
 
     def _recover_ibkr_api(
         self, error_type: str, context: Optional[Dict] = None
@@ -216,65 +296,91 @@ def _recover_ibkr_api(
         Returns:
             Tuple of (recovery_succeeded, recovery_message)
         """
-        if error_type == "CONNECTION_ERROR":
-            # Try reconnecting to the API
-            log_info("Attempting to reconnect to IBKR API")
-
-            try:
-                # If context contains the API client, use it to reconnect
-                if context and "client" in context:
-                    client = context["client"]
-                    # Simulate disconnect/reconnect cycle with a delay
-                    time.sleep(2)
-                    # client.disconnect()
-                    # time.sleep(1)
-                    # connected = client.connect()
-                    connected = True  # Simulated success
-
-                    if connected:
-                        log_info("Successfully reconnected to IBKR API")
-                        return True, "Reconnected to API"
-                    else:
-                        log_warning("Failed to reconnect to IBKR API")
-                        return False, "Reconnect attempt failed"
-                else:
-                    return False, "No API client in context"
-            except Exception as e:
-                log_error(f"Error during IBKR API recovery: {str(e)}")
-                return False, f"Recovery error: {str(e)}"
+        return self._apply_strategy(self._IBKR_STRATEGIES, error_type, context)
 
-        elif error_type == "AUTHENTICATION_ERROR":
-            # Authentication errors typically require user intervention
-            if self.alert_system:
-                self.alert_system.send_system_alert(
-                    "IBKR_API",
-                    "AUTHENTICATION_REQUIRED",
-                    "API authentication error - manual intervention required",
-                )
-            return False, "Authentication error requires manual intervention"
-
-        elif error_type == "REQUEST_ERROR":
-            # For request errors, we can try again with backoff
-            try:
-                retry_count = context.get("retry_count", 0) if context else 0
-                backoff_seconds = min(
-                    2**retry_count, 60
-                )  # Exponential backoff, max 60 seconds
-
-                log_info(f"Retrying request after {backoff_seconds} seconds")
-                time.sleep(backoff_seconds)
-
-                # If context contains the request function and parameters, retry it
-                if context and "request_func" in context and "params" in context:
-                    result = context["request_func"](*context["params"])
-                    return True, "Request retried successfully"
+    def _ibkr_reconnect(self, context: Optional[Dict]) -> Tuple[bool, str]:
+        """
+        Reconnect to the IBKR API after a connection error.
+
+        Args:
+            context: Additional context
+
+        Returns:
+            Tuple of (recovery_succeeded, recovery_message)
+        """
+        # Try reconnecting to the API
+        log_info("Attempting to reconnect to IBKR API")
+
+        try:
+            # If context contains the API client, use it to reconnect
+            if context and "client" in context:
+                client = context["client"]
+                # Simulate disconnect/reconnect cycle with a delay
+                time.sleep(2)
+                # client.disconnect()
+                # time.sleep(1)
+                # connected = client.connect()
+                connected = True  # Simulated success
+
+                if connected:
+                    log_info("Successfully reconnected to IBKR API")
+                    return True, "Reconnected to API"
                 else:
-                    return False, "Insufficient context for retry"
-            except Exception as e:
-                log_error(f"Error during request retry: {str(e)}")
-                return False, f"Retry error: {str(e)}"
+                    log_warning("Failed to reconnect to IBKR API")
+                    return False, "Reconnect attempt failed"
+            else:
+                return False, "No API client in context"
+        except Exception as e:
+            log_error(f"Error during IBKR API recovery: {str(e)}")
+            return False, f"Recovery error: {str(e)}"
 
-        return False, f"No recovery strategy for {error_type}"
+    def _ibkr_auth_fail(self, context: Optional[Dict]) -> Tuple[bool, str]:
+        """
+        Escalate an IBKR authentication error.
+
+        Args:
+            context: Additional context
+
+        Returns:
+            Tuple of (recovery_succeeded, recovery_message)
+        """
+        # Authentication errors typically require user intervention
+        if self.alert_system:
+            self.alert_system.send_system_alert(
+                "IBKR_API",
+                "AUTHENTICATION_REQUIRED",
+                "API authentication error - manual intervention required",
+            )
+        return False, "Authentication error requires manual intervention"
+
+    def _ibkr_retry_request(self, context: Optional[Dict]) -> Tuple[bool, str]:
+        """
+        Retry a failed IBKR request with exponential backoff.
+
+        Args:
+            context: Additional context
+
+        Returns:
+            Tuple of (recovery_succeeded, recovery_message)
+        """
+        try:
+            retry_count = context.get("retry_count", 0) if context else 0
+            backoff_seconds = min(
+                2**retry_count, 60
+            )  # Exponential backoff, max 60 seconds
+
+            log_info(f"Retrying request after {backoff_seconds} seconds")
+            time.sleep(backoff_seconds)
+
+            # If context contains the request function and parameters, retry it
+            if context and "request_func" in context and "params" in context:
+                result = context["request_func"](*context["params"])
+                return True, "Request retried successfully"
+            else:
+                return False, "Insufficient context for retry"
+        except Exception as e:
+            log_error(f"Error during request retry: {str(e)}")
+            return False, f"Retry error: {str(e)}"
 
     def _recover_data_provider(
         self, error_type: str, context: Optional[Dict] = None
@@ -289,36 +395,55 @@ def _recover_data_provider(
         Returns:
             Tuple of (recovery_succeeded, recovery_message)
         """
-        if error_type == "DATA_MISSING":
-            # Try alternative data source
-            try:
-                symbol = context.get("symbol") if context else None
-                if not symbol:
-                    return False, "No symbol in context"
-
-                log_info(f"Attempting to fetch data for {symbol} from alternate source")
-
-                # Simulate fallback data fetch
-                # In a real implementation, this would use an alternative data source
-                time.sleep(1)
-
-                # Simulate success
-                return True, "Retrieved data from alternate source"
-            except Exception as e:
-                log_error(f"Error during data recovery: {str(e)}")
-                return False, f"Recovery error: {str(e)}"
-
-        elif error_type == "CONNECTION_ERROR":
-            # Similar to API connection error
-            try:
-                log_info("Attempting to reconnect to data provider")
-                time.sleep(2)  # Simulated reconnection delay
-                return True, "Reconnected to data provider"
-            except Exception as e:
-                log_error(f"Error reconnecting to data provider: {str(e)}")
-                return False, f"Recovery error: {str(e)}"
-
-        return False, f"No recovery strategy for {error_type}"
+        return self._apply_strategy(
+            self._DATA_PROVIDER_STRATEGIES, error_type, context
+        )
+
+    def _data_alternate_source(self, context: Optional[Dict]) -> Tuple[bool, str]:
+        """
+        Fetch missing data from an alternate source.
+
+        Args:
+            context: Additional context
+
+        Returns:
+            Tuple of (recovery_succeeded, recovery_message)
+        """
+        try:
+            symbol = context.get("symbol") if context else None
+            if not symbol:
+                return False, "No symbol in context"
+
+            log_info(f"Attempting to fetch data for {symbol} from alternate source")
+
+            # Simulate fallback data fetch
+            # In a real implementation, this would use an alternative data source
+            time.sleep(1)
+
+            # Simulate success
+            return True, "Retrieved data from alternate source"
+        except Exception as e:
+            log_error(f"Error during data recovery: {str(e)}")
+            return False, f"Recovery error: {str(e)}"
+
+    def _data_reconnect(self, context: Optional[Dict]) -> Tuple[bool, str]:
+        """
+        Reconnect to the data provider after a connection error.
+
+        Args:
+            context: Additional context
+
+        Returns:
+            Tuple of (recovery_succeeded, recovery_message)
+        """
+        # Similar to API connection error
+        try:
+            log_info("Attempting to reconnect to data provider")
+            time.sleep(2)  # Simulated reconnection delay
+            return True, "Reconnected to data provider"
+        except Exception as e:
+            log_error(f"Error reconnecting to data provider: {str(e)}")
+            return False, f"Recovery error: {str(e)}"
 
     def _recover_option_selector(
         self, error_type: str, context: Optional[Dict] = None
@@ -333,36 +458,46 @@ def _recover_option_selector(
         Returns:
             Tuple of (recovery_succeeded, recovery_message)
         """
-        if error_type == "NO_SUITABLE_OPTIONS":
-            # Try with relaxed criteria
-            try:
-                log_info("Attempting option selection with relaxed criteria")
+        return self._apply_strategy(
+            self._OPTION_SELECTOR_STRATEGIES, error_type, context
+        )
 
-                # If context contains the selector and original parameters, retry with relaxed criteria
-                if context and "selector" in context and "params" in context:
-                    # Relax delta constraints by 20%
-                    original_min_delta = getattr(self.config, "MIN_DELTA", 0.3)
-                    original_max_delta = getattr(self.config, "MAX_DELTA", 0.5)
+    def _options_relax_criteria(self, context: Optional[Dict]) -> Tuple[bool, str]:
+        """
+        Retry option selection with relaxed delta criteria.
 
-                    # Temporarily adjust config
-                    setattr(self.config, "MIN_DELTA", original_min_delta * 0.8)
-                    setattr(self.config, "MAX_DELTA", original_max_delta * 1.2)
+        Args:
+            context: Additional context
 
-                    # Try again
-                    # result = context['selector'].select_vertical_spread(*context['params'])
+        Returns:
+            Tuple of (recovery_succeeded, recovery_message)
+        """
+        try:
+            log_info("Attempting option selection with relaxed criteria")
 
-                    # Restore original config
-                    setattr(self.config, "MIN_DELTA", original_min_delta)
-                    setattr(self.config, "MAX_DELTA", original_max_delta)
+            # If context contains the selector and original parameters, retry with relaxed criteria
+            if context and "selector" in context and "params" in context:
+                # Relax delta constraints by 20%
+                original_min_delta = getattr(self.config, "MIN_DELTA", 0.3)
+                original_max_delta = getattr(self.config, "MAX_DELTA", 0.5)
 
-                    return True, "Selected options with relaxed criteria"
-                else:
-                    return False, "Insufficient context for option retry"
-            except Exception as e:
-                log_error(f"Error during option selection recovery: {str(e)}")
-                return False, f"Recovery error: {str(e)}"
+                # Temporarily adjust config
+                setattr(self.config, "MIN_DELTA", original_min_delta * 0.8)
+                setattr(self.config, "MAX_DELTA", original_max_delta * 1.2)
+
+                # Try again
+                # result = context['selector'].select_vertical_spread(*context['params'])
 
-        return False, f"No recovery strategy for {error_type}"
+                # Restore original config
+                setattr(self.config, "MIN_DELTA", original_min_delta)
+                setattr(self.config, "MAX_DELTA", original_max_delta)
+
+                return True, "Selected options with relaxed criteria"
+            else:
+                return False, "Insufficient context for option retry"
+        except Exception as e:
+            log_error(f"Error during option selection recovery: {str(e)}")
+            return False, f"Recovery error: {str(e)}"
 
     def _recover_trade_executor(
         self, error_type: str, context: Optional[Dict] = None
@@ -377,28 +512,39 @@ def _recover_trade_executor(
         Returns:
             Tuple of (recovery_succeeded, recovery_message)
         """
-        if error_type == "ORDER_EXECUTION_ERROR":
-            # For order execution errors, we might retry or use a different order type
-            try:
-                log_info("Attempting order execution recovery")
+        return self._apply_strategy(
+            self._TRADE_EXECUTOR_STRATEGIES, error_type, context
+        )
 
-                if context and "executor" in context and "order" in context:
-                    # Modify order type to improve chances of execution
-                    # E.g., switch from LIMIT to MARKET
-                    modified_order = context["order"].copy()
-                    modified_order["order_type"] = "MARKET"
+    def _order_retry_market(self, context: Optional[Dict]) -> Tuple[bool, str]:
+        """
+        Retry a failed order as a MARKET order.
 
-                    log_info("Retrying with MARKET order")
-                    # result = context['executor'].execute_order(modified_order)
+        Args:
+            context: Additional context
 
-                    return True, "Order executed successfully with MARKET type"
-                else:
-                    return False, "Insufficient context for order retry"
-            except Exception as e:
-                log_error(f"Error during order execution recovery: {str(e)}")
-                return False, f"Recovery error: {str(e)}"
+        Returns:
+            Tuple of (recovery_succeeded, recovery_message)
+        """
+        # For order execution errors, we might retry or use a different order type
+        try:
+            log_info("Attempting order execution recovery")
+
+            if context and "executor" in context and "order" in context:
+                # Modify order type to improve chances of execution
+                # E.g., switch from LIMIT to MARKET
+                modified_order = context["order"].copy()
+                modified_order["order_type"] = "MARKET"
 
-        return False, f"No recovery strategy for {error_type}"
+                log_info("Retrying with MARKET order")
+                # result = context['executor'].execute_order(modified_order)
+
+                return True, "Order executed successfully with MARKET type"
+            else:
+                return False, "Insufficient context for order retry"
+        except Exception as e:
+            log_error(f"Error during order execution recovery: {str(e)}")
+            return False, f"Recovery error: {str(e)}"
 
     def _recover_risk_manager(
         self, error_type: str, context: Optional[Dict] = None
@@ -413,22 +559,31 @@ def _recover_risk_manager(
         Returns:
             Tuple of (recovery_succeeded, recovery_message)
         """
-        if error_type == "POSITION_SYNC_ERROR":
-            # For position synchronization errors, we might force a refresh
-            try:
-                log_info("Attempting to refresh positions from broker")
+        return self._apply_strategy(self._RISK_MANAGER_STRATEGIES, error_type, context)
 
-                if context and "risk_manager" in context:
-                    # Force position update from broker
-                    context["risk_manager"].update_positions_from_broker()
-                    return True, "Positions refreshed from broker"
-                else:
-                    return False, "Risk manager not available in context"
-            except Exception as e:
-                log_error(f"Error during position refresh: {str(e)}")
-                return False, f"Recovery error: {str(e)}"
+    def _risk_refresh_positions(self, context: Optional[Dict]) -> Tuple[bool, str]:
+        """
+        Force a position refresh from the broker.
 
-        return False, f"No recovery strategy for {error_type}"
+        Args:
+            context: Additional context
+
+        Returns:
+            Tuple of (recovery_succeeded, recovery_message)
+        """
+        # For position synchronization errors, we might force a refresh
+        try:
+            log_info("Attempting to refresh positions from broker")
+
+            if context and "risk_manager" in context:
+                # Force position update from broker
+                context["risk_manager"].update_positions_from_broker()
+                return True, "Positions refreshed from broker"
+            else:
+                return False, "Risk manager not available in context"
+        except Exception as e:
+            log_error(f"Error during position refresh: {str(e)}")
+            return False, f"Recovery error: {str(e)}"
 
     def _generic_recovery(
         self, component: str, error_type: str, context: Optional[Dict] = None
@@ -461,16 +616,15 @@ def _trip_circuit_breaker(self, component: str) -> None:
         if component not in self.circuit_breakers:
             return
 
-        now = datetime.now()
-        reset_time = now + timedelta(
-            minutes=self.config.get("CIRCUIT_BREAKER_MINUTES", 30)
-        )
+        now_ns = time.monotonic_ns()
+        reset_time_ns = now_ns + self._cb_minutes * _NS_PER_MINUTE
+        reset_time = _wall_clock(reset_time_ns)
 
         log_warning(f"Tripping circuit breaker for {component} until {reset_time}")
 
         self.circuit_breakers[component]["tripped"] = True
-        self.circuit_breakers[component]["trip_time"] = now
-        self.circuit_breakers[component]["reset_time"] = reset_time
+        self.circuit_breakers[component]["trip_time_ns"] = now_ns
+        self.circuit_breakers[component]["reset_time_ns"] = reset_time_ns
 
         if self.alert_system:
             self.alert_system.send_system_alert(
@@ -487,15 +641,15 @@ def check_circuit_breakers(self) -> List[str]:
             List of components whose circuit breakers were reset
         """
         reset_components = []
-        now = datetime.now()
+        now_ns = time.monotonic_ns()
 
         for component, breaker in self.circuit_breakers.items():
-            if breaker["tripped"] and now >= breaker["reset_time"]:
+            if breaker["tripped"] and now_ns >= breaker["reset_time_ns"]:
                 log_info(f"Resetting circuit breaker for {component}")
 
                 breaker["tripped"] = False
-                breaker["trip_time"] = None
-                breaker["reset_time"] = None
+                breaker["trip_time_ns"] = None
+                breaker["reset_time_ns"] = None
 
                 reset_components.append(component)
 
@@ -532,20 +686,25 @@ def clear_error_counts(self, older_than_minutes: int = 60) -> int:
             Number of error records cleared
         """
         cleared = 0
-        threshold_time = datetime.now() - timedelta(minutes=older_than_minutes)
+        threshold_time = time.monotonic_ns() - older_than_minutes * _NS_PER_MINUTE
 
-        for error_key in list(self.error_counts.keys()):
-            if (
-                error_key in self.last_errors
-                and self.last_errors[error_key] < threshold_time
-            ):
-                del self.error_counts[error_key]
-                del self.last_errors[error_key]
+        # Keys are ordered by last error time, so stop at the first recent one
+        last_errors = self.last_errors
+        while last_errors:
+            error_key, last_error = next(iter(last_errors.items()))
+            if last_error >= threshold_time:
+                break
 
-                if error_key in self.recovery_attempts:
-                    del self.recovery_attempts[error_key]
+            del last_errors[error_key]
+            count = self.error_counts.pop(error_key, 0)
+            self.recovery_attempts.pop(error_key, None)
 
-                cleared += 1
+            component = error_key[0]
+            self.component_totals[component] -= count
+            if self.component_totals[component] <= 0:
+                del self.component_totals[component]
+
+            cleared += 1
 
         return cleared
 
@@ -556,25 +715,19 @@ def get_error_summary(self) -> Dict[str, Any]:
         Returns:
             Error summary dictionary
         """
-        component_errors: Dict[str, int] = defaultdict(int)
-
-        # Count errors by component
-        for error_key in self.error_counts:
-            component = error_key.split(":")[0]
-            component_errors[component] += self.error_counts[error_key]
-
         # Create circuit breaker status summary
         circuit_status = {}
+        now_ns = time.monotonic_ns()
         for component, breaker in self.circuit_breakers.items():
             if breaker["tripped"]:
-                reset_in = (breaker["reset_time"] - datetime.now()).total_seconds() / 60
+                reset_in = (breaker["reset_time_ns"] - now_ns) / _NS_PER_MINUTE
                 circuit_status[component] = f"Tripped, reset in {reset_in:.1f} minutes"
             else:
                 circuit_status[component] = "Normal"
 
         return {
-            "total_errors": sum(self.error_counts.values()),
+            "total_errors": sum(self.component_totals.values()),
             "total_recovery_attempts": sum(self.recovery_attempts.values()),
-            "errors_by_component": dict(component_errors),
+            "errors_by_component": dict(self.component_totals),
             "circuit_breaker_status": circuit_status,
         }
@@ -2,48 +2,158 @@
 Logging utility for IBKR Auto Vertical Spread Trader.
 """
 
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize an object to JSON, stringifying unsupported values."""
+        return orjson.dumps(obj, default=str).decode("utf-8")
+
+except ImportError:
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize an object to JSON, stringifying unsupported values."""
+        return json.dumps(obj, default=str)
 
 # Global logger instance
 _logger = None
+# Background thread writing queued records to the real handlers
+_listener: Optional[QueueListener] = None
+# Handlers created by setup_logger, and the arguments they were built from
+_handlers: List[logging.Handler] = []
+_config_signature: Optional[Tuple[Any, ...]] = None
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__
+) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter that renders each record as a single JSON object.
+
+    Fields passed to the log call through ``extra`` become top-level keys, so
+    log shippers can read them without parsing the message text. ``time`` is
+    the record's epoch timestamp in seconds.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record as JSON.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            JSON string
+        """
+        payload: Dict[str, Any] = {
+            "time": record.created,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return _json_dumps(payload)
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler for a listener thread in the same process.
+
+    The message is rendered before the record is queued so later changes to
+    the arguments can't leak into it. Unlike the stock handler, exc_info and
+    extra fields are kept so formatters see the record as logged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a record for queuing.
+
+        Args:
+            record: Log record
+
+        Returns:
+            Copy of the record with the message already merged
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def setup_logger(
-    log_level: str = "INFO", log_file: Optional[str] = None, console: bool = True
+    log_level: Union[str, int] = "INFO",
+    log_file: Optional[str] = None,
+    console: bool = True,
+    json_format: bool = False,
+    queued: bool = True,
 ) -> logging.Logger:
     """Set up the logger.
 
+    Calling again with the same settings returns the existing logger; other
+    settings replace the handlers set up by the previous call.
+
     Args:
-        log_level: Logging level
+        log_level: Logging level name or number
         log_file: Path to log file (if None, logs to console only)
         console: Whether to log to console
+        json_format: Emit one JSON object per record instead of plain text
+        queued: Hand records to a background thread so logging calls don't
+            wait on console or disk I/O
 
     Returns:
         Configured logger instance
     """
-    global _logger
+    global _logger, _listener, _config_signature
 
+    # Accept level numbers as-is; unknown level names fall back to INFO
+    if isinstance(log_level, int):
+        level = log_level
+    else:
+        level = getattr(logging, str(log_level).upper(), None)
+        if not isinstance(level, int):
+            level = logging.INFO
+
+    signature = (level, log_file, console, json_format, queued)
     if _logger is not None:
-        return _logger
+        if signature == _config_signature:
+            return _logger
+        _remove_handlers()
+    _config_signature = signature
 
     # Create logger
     _logger = logging.getLogger("auto_trader")
-    _logger.setLevel(getattr(logging, log_level.upper()))
+    _logger.setLevel(level)
 
     # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    formatter: logging.Formatter
+    if json_format:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        )
+
+    handlers: List[logging.Handler] = []
 
     # Add console handler if requested
     if console:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        _logger.addHandler(console_handler)
+        console_handler.setLevel(level)
+        handlers.append(console_handler)
 
     # Add file handler if log file specified
     if log_file:
@@ -54,11 +164,51 @@ def setup_logger(
 
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        _logger.addHandler(file_handler)
+        file_handler.setLevel(level)
+        handlers.append(file_handler)
+
+    if queued and handlers:
+        # SimpleQueue is unbounded and implemented in C, so a log call is a
+        # single lock-free put with no task accounting
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = _InProcessQueueHandler(log_queue)
+        _logger.addHandler(queue_handler)
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        handlers.append(queue_handler)
+    else:
+        for handler in handlers:
+            _logger.addHandler(handler)
 
+    _handlers[:] = handlers
     return _logger
 
 
+def _remove_handlers() -> None:
+    """Detach and close the handlers added by the last setup_logger call."""
+    if _logger is not None:
+        for handler in _handlers:
+            _logger.removeHandler(handler)
+    # Detached first so nothing new is queued while the listener drains
+    _stop_listener()
+    for handler in _handlers:
+        handler.close()
+    _handlers.clear()
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread, if running."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Drain what's queued before the interpreter exits
+atexit.register(_stop_listener)
+
+
 def get_logger() -> logging.Logger:
     """Get the logger instance.
 
@@ -73,48 +223,75 @@ def get_logger() -> logging.Logger:
     return _logger
 
 
-def log_debug(message: str) -> None:
+def is_debug_enabled() -> bool:
+    """Check whether debug messages would be emitted.
+
+    Use this to skip building expensive debug messages.
+
+    Returns:
+        True if the logger is enabled for DEBUG
+    """
+    return get_logger().isEnabledFor(logging.DEBUG)
+
+
+def log_debug(message: str, *args: Any) -> None:
     """Log a debug message.
 
     Args:
-        message: Message to log
+        message: Message to log, optionally with %-style placeholders
+        *args: Values for the placeholders, formatted only if the message is emitted
     """
     logger = get_logger()
-    logger.debug(message)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message, *args)
 
 
-def log_info(message: str) -> None:
+def log_info(
+    message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+) -> None:
     """Log an info message.
 
     Args:
-        message: Message to log
+        message: Message to log, optionally with %-style placeholders
+        *args: Values for the placeholders, formatted only if the message is emitted
+        extra: Structured fields to attach to the record
     """
     logger = get_logger()
-    logger.info(message)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message, *args, extra=extra)
 
 
-def log_warning(message: str) -> None:
+def log_warning(message: str, *args: Any) -> None:
     """Log a warning message.
 
     Args:
-        message: Message to log
+        message: Message to log, optionally with %-style placeholders
+        *args: Values for the placeholders, formatted only if the message is emitted
     """
     logger = get_logger()
-    logger.warning(message)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(message, *args)
 
 
-def log_error(message: str, extra_info: Optional[str] = None) -> None:
+def log_error(
+    message: str,
+    extra_info: Optional[str] = None,
+    extra: Optional[Dict[str, Any]] = None,
+) -> None:
     """Log an error message.
 
     Args:
         message: Message to log
         extra_info: Optional additional information
+        extra: Structured fields to attach to the record
     """
     logger = get_logger()
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     if extra_info:
-        logger.error(f"{message}: {extra_info}")
+        logger.error(f"{message}: {extra_info}", extra=extra)
     else:
-        logger.error(message)
+        logger.error(message, extra=extra)
 
 
 def log_exception(message: str) -> None:
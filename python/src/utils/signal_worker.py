@@ -0,0 +1,143 @@
+"""
+Background worker shared by the trader front-ends.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from src.utils.logger import log_debug, log_error
+
+
+class SignalWorker:
+    """
+    Single background thread that processes queued signals and runs periodic
+    housekeeping tasks.
+
+    Signals and housekeeping share one thread, so broker clients bound to a
+    single thread (ib_insync runs on one event loop) are never called
+    concurrently and no extra locking is needed.
+    """
+
+    queue: "queue.Queue[Any]"
+    _handler: Callable[[Any], Any]
+    _tasks: List[List[Any]]
+    _stop_event: threading.Event
+    _thread: Optional[threading.Thread]
+
+    def __init__(self, handler: Callable[[Any], Any], maxsize: int = 1000) -> None:
+        """
+        Initialize the worker.
+
+        Args:
+            handler: Called on the worker thread with each queued signal
+            maxsize: Queue capacity, so a runaway producer can't exhaust memory
+        """
+        self.queue = queue.Queue(maxsize=maxsize)
+        self._handler = handler
+        # Housekeeping as [next_due, interval, task]
+        self._tasks = []
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread has been started and not stopped."""
+        return self._thread is not None and not self._stop_event.is_set()
+
+    def add_task(self, interval: float, task: Callable[[], Any]) -> None:
+        """
+        Register a periodic task; it first runs as soon as the worker starts.
+
+        Args:
+            interval: Seconds between runs
+            task: Callable taking no arguments
+        """
+        self._tasks.append([0.0, interval, task])
+
+    def put(self, signal: Any) -> bool:
+        """
+        Queue a signal without blocking.
+
+        Args:
+            signal: Signal to pass to the handler
+
+        Returns:
+            True if queued, False if the queue is full
+        """
+        try:
+            self.queue.put(signal, block=False)
+            return True
+        except queue.Full:
+            return False
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        # Wake the thread if it is blocked on an empty queue
+        try:
+            self.queue.put(None, timeout=1.0)
+        except queue.Full:
+            pass  # The thread is busy and will see the stop event
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Worker loop: wait for a signal or the next due task, whichever first."""
+        while not self._stop_event.is_set():
+            try:
+                signal = self.queue.get(timeout=self._next_wakeup())
+            except queue.Empty:
+                pass
+            else:
+                try:
+                    if signal is not None:
+                        result = self._handler(signal)
+                        log_debug("Signal processing result: %s", result)
+                except Exception as e:
+                    log_error(f"Error in signal processing thread: {str(e)}")
+                finally:
+                    self.queue.task_done()
+
+            if not self._stop_event.is_set():
+                self._run_due_tasks()
+
+    def _next_wakeup(self) -> Optional[float]:
+        """
+        Get the number of seconds until the next housekeeping task is due.
+
+        Returns:
+            Seconds to wait, or None to wait for a signal indefinitely
+        """
+        if not self._tasks:
+            return None
+        next_due = min(task[0] for task in self._tasks)
+        return max(next_due - time.monotonic(), 0.0)
+
+    def _run_due_tasks(self) -> None:
+        """Run the housekeeping tasks whose deadline has passed."""
+        now = time.monotonic()
+        for task in self._tasks:
+            if now < task[0]:
+                continue
+            task[0] = now + task[1]
+            try:
+                task[2]()
+            except Exception as e:
+                log_error(f"Error in periodic task {task[2].__name__}: {str(e)}")
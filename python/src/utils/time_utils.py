@@ -1,7 +1,29 @@
-from datetime import datetime, time, timedelta
+from datetime import datetime, time, timedelta, timezone
 from typing import Optional
 
-import pytz
+try:
+    from zoneinfo import ZoneInfo
+
+    _EASTERN = ZoneInfo("America/New_York")
+except (ImportError, KeyError):  # Python 3.8, or no tz database available
+    import pytz
+
+    _EASTERN = pytz.timezone("US/Eastern")
+
+
+def _localize_eastern(dt: datetime) -> datetime:
+    """Attach US Eastern time to a naive datetime.
+
+    Args:
+        dt: Naive datetime expressed in Eastern wall-clock time
+
+    Returns:
+        Timezone-aware datetime
+    """
+    localize = getattr(_EASTERN, "localize", None)
+    if localize is not None:  # pytz zones need localize() for correct DST
+        return localize(dt)
+    return dt.replace(tzinfo=_EASTERN)
 
 
 def convert_to_eastern(dt: Optional[datetime] = None) -> datetime:
@@ -16,14 +38,12 @@ def convert_to_eastern(dt: Optional[datetime] = None) -> datetime:
     if dt is None:
         dt = datetime.now()
 
-    eastern = pytz.timezone("US/Eastern")
-
     # If datetime is naive (no timezone), assume it's UTC
     if dt.tzinfo is None:
-        dt = pytz.utc.localize(dt)
+        dt = dt.replace(tzinfo=timezone.utc)
 
     # Convert to Eastern
-    return dt.astimezone(eastern)
+    return dt.astimezone(_EASTERN)
 
 
 def is_market_open(dt: Optional[datetime] = None) -> bool:
@@ -63,14 +83,13 @@ def get_next_market_close_timestamp() -> float:
     Returns:
         Unix timestamp for next market close
     """
-    now = datetime.now(pytz.utc)
+    now = datetime.now(timezone.utc)
     et_now = convert_to_eastern(now)
 
     # Create datetime for today's market close (4:00 PM ET)
-    eastern = pytz.timezone("US/Eastern")
     today = et_now.date()
     close_time = time(16, 0)
-    close_dt = eastern.localize(datetime.combine(today, close_time))
+    close_dt = _localize_eastern(datetime.combine(today, close_time))
 
     # If current time is past market close, move to next trading day
     if et_now >= close_dt:
@@ -84,7 +103,7 @@ def get_next_market_close_timestamp() -> float:
         import pandas as pd
 
         next_day = today + pd.Timedelta(days=days_to_add)
-        close_dt = eastern.localize(datetime.combine(next_day, close_time))
+        close_dt = _localize_eastern(datetime.combine(next_day, close_time))
 
     # Convert to timestamp
     return close_dt.timestamp()
@@ -156,8 +175,7 @@ def get_next_market_open() -> datetime:
     Returns:
         Datetime of next market open
     """
-    eastern = pytz.timezone("US/Eastern")
-    now = datetime.now(eastern)
+    now = datetime.now(_EASTERN)
 
     # Start with today
     next_open_day = now.date()
@@ -172,7 +190,7 @@ def get_next_market_open() -> datetime:
         next_open_day = (now + timedelta(days=1)).date()
 
     # Create datetime for next market open (9:30 AM ET)
-    next_open = eastern.localize(datetime.combine(next_open_day, time(9, 30)))
+    next_open = _localize_eastern(datetime.combine(next_open_day, time(9, 30)))
 
     return next_open
 
@@ -183,8 +201,7 @@ def get_next_market_close() -> datetime:
     Returns:
         Datetime of next market close
     """
-    eastern = pytz.timezone("US/Eastern")
-    now = datetime.now(eastern)
+    now = datetime.now(_EASTERN)
 
     # Start with today
     next_close_day = now.date()
@@ -199,7 +216,7 @@ def get_next_market_close() -> datetime:
         next_close_day = (now + timedelta(days=1)).date()
 
     # Create datetime for next market close (4:00 PM ET)
-    next_close = eastern.localize(datetime.combine(next_close_day, time(16, 0)))
+    next_close = _localize_eastern(datetime.combine(next_close_day, time(16, 0)))
 
     return next_close
 
@@ -210,7 +227,7 @@ def time_to_next_market_open() -> timedelta:
     Returns:
         Timedelta until next market open
     """
-    now = datetime.now(pytz.timezone("US/Eastern"))
+    now = datetime.now(_EASTERN)
     next_open = get_next_market_open()
 
     return next_open - now
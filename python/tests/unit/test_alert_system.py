@@ -0,0 +1,202 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.utils import alert_system
+from src.utils.alert_system import AlertSystem, TokenBucket, _truncate_sms
+
+
+class FakeNotifier:
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+
+    def send(self, message):
+        self.sent.append(message)
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+class AlertSystemTestCase(unittest.TestCase):
+    config = {}
+
+    def setUp(self):
+        # Drive the module clock by hand; other modules keep the real one
+        self.clock = MagicMock()
+        self.clock.monotonic.return_value = 1000.0
+        self.time_patcher = patch.object(alert_system, "time", self.clock)
+        self.time_patcher.start()
+
+        self.alerts = AlertSystem(SimpleNamespace(**self.config))
+        self.notifier = FakeNotifier()
+        self.alerts.notification_channels = {"email": self.notifier}
+
+    def tearDown(self):
+        self.alerts.close()
+        self.time_patcher.stop()
+
+    def advance(self, seconds):
+        self.clock.monotonic.return_value += seconds
+
+
+class TestDuplicateSuppression(AlertSystemTestCase):
+    config = {"ALERT_DEDUP_SECONDS": 60.0}
+
+    def test_repeats_suppressed_within_window(self):
+        for _ in range(3):
+            self.assertTrue(self.alerts.send_alert("Disk full", severity="CRITICAL"))
+        self.assertEqual(len(self.notifier.sent), 1)
+
+        self.advance(30)
+        self.alerts.send_alert("Disk full", severity="CRITICAL")
+        self.assertEqual(len(self.notifier.sent), 1)
+
+    def test_repeat_count_sent_after_window(self):
+        for _ in range(4):
+            self.alerts.send_alert("Disk full", severity="CRITICAL")
+        self.advance(61)
+        self.alerts.send_alert("Disk full", severity="CRITICAL")
+
+        self.assertEqual(len(self.notifier.sent), 2)
+        self.assertIn("Disk full (repeated 3 times)", self.notifier.sent[1])
+
+    def test_severity_is_part_of_the_key(self):
+        self.alerts.send_alert("Disk full", severity="CRITICAL")
+        self.alerts.send_alert("Disk full", severity="HIGH")
+        self.alerts.send_alert("Disk low", severity="CRITICAL")
+        self.alerts.flush()
+        self.assertEqual(len(self.notifier.sent), 3)
+
+
+class TestDigest(AlertSystemTestCase):
+    config = {"DIGEST_INTERVAL_S": 60.0}
+
+    def test_buffered_alerts_sent_as_one_digest(self):
+        for message in ("Fill slow", "Quote stale", "Spread wide"):
+            self.assertTrue(self.alerts.send_alert(message, severity="WARNING"))
+        self.assertEqual(self.notifier.sent, [])
+
+        self.alerts.flush()
+        self.assertEqual(len(self.notifier.sent), 1)
+        digest = self.notifier.sent[0]
+        self.assertTrue(digest.startswith("[WARNING x3]"))
+        for message in ("Fill slow", "Quote stale", "Spread wide"):
+            self.assertIn(message, digest)
+
+        history = self.alerts.get_recent_alerts()
+        self.assertEqual(len(history), 3)
+        self.assertTrue(all(alert["success"] for alert in history))
+
+    def test_single_alert_sent_as_is(self):
+        self.alerts.send_alert("Fill slow", details="SPY", severity="HIGH")
+        self.alerts.flush()
+        self.assertEqual(len(self.notifier.sent), 1)
+        self.assertTrue(self.notifier.sent[0].startswith("[HIGH] "))
+        self.assertIn("Details: SPY", self.notifier.sent[0])
+
+    def test_critical_skips_digest(self):
+        self.alerts.send_alert("Broker down", severity="CRITICAL")
+        self.assertEqual(len(self.notifier.sent), 1)
+
+    def test_close_flushes_and_closes_notifiers(self):
+        self.alerts.send_alert("Fill slow", severity="WARNING")
+        self.alerts.close()
+
+        self.assertEqual(len(self.notifier.sent), 1)
+        self.assertTrue(self.notifier.closed)
+
+        # Alerts after close are no longer buffered
+        self.alerts.send_alert("Quote stale", severity="INFO")
+        self.assertEqual(len(self.notifier.sent), 2)
+
+
+class TestHistoryEviction(AlertSystemTestCase):
+    config = {"ALERT_HISTORY_SIZE": 2, "DIGEST_INTERVAL_S": 0}
+
+    def messages(self):
+        return [alert["message"] for alert in self.alerts.get_recent_alerts()]
+
+    def test_lowest_score_evicted_first(self):
+        self.alerts.send_alert("warn", severity="WARNING")
+        self.advance(1)
+        self.alerts.send_alert("info 1", severity="INFO")
+        self.advance(1)
+        self.alerts.send_alert("info 2", severity="INFO")
+
+        # The older INFO goes, not the oldest alert
+        self.assertEqual(self.messages(), ["warn", "info 2"])
+
+    def test_fresh_info_does_not_evict_high(self):
+        self.alerts.send_alert("high", severity="HIGH")
+        # Half an hour later: the first INFO re-scores the history, the rest
+        # are recorded after that reference time
+        self.advance(1800)
+        self.alerts.send_alert("info 1", severity="INFO")
+        self.advance(59)
+        self.alerts.send_alert("info 2", severity="INFO")
+        self.alerts.send_alert("info 3", severity="INFO")
+
+        self.assertEqual(self.messages(), ["high", "info 3"])
+
+    def test_stale_alert_evicted_by_fresh_one(self):
+        self.alerts.send_alert("warn", severity="WARNING")
+        self.alerts.send_alert("high", severity="HIGH")
+        self.advance(3600)
+        self.alerts.send_alert("info", severity="INFO")
+
+        self.assertEqual(self.messages(), ["high", "info"])
+
+
+class TestTruncateSms(unittest.TestCase):
+    def test_short_message_unchanged(self):
+        self.assertEqual(_truncate_sms("Broker down"), "Broker down")
+
+    def test_gsm7_truncated_to_160(self):
+        self.assertEqual(_truncate_sms("a" * 200), "a" * 160)
+        self.assertEqual(_truncate_sms("a" * 160), "a" * 160)
+
+    def test_extended_characters_take_two_septets(self):
+        self.assertEqual(_truncate_sms("€" * 100), "€" * 80)
+        self.assertEqual(_truncate_sms("a" + "[" * 80), "a" + "[" * 79)
+
+    def test_ucs2_truncated_to_70_units(self):
+        self.assertEqual(_truncate_sms("Ж" * 100), "Ж" * 70)
+
+    def test_surrogate_pair_never_split(self):
+        message = "a" + "\U0001f680" * 40
+        truncated = _truncate_sms(message)
+
+        # 1 + 34 * 2 units fit; the 35th emoji would straddle the limit
+        self.assertEqual(truncated, message[:35])
+        self.assertLessEqual(len(truncated.encode("utf-16-le")), 140)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = MagicMock()
+        self.clock.monotonic.return_value = 50.0
+        self.time_patcher = patch.object(alert_system, "time", self.clock)
+        self.time_patcher.start()
+
+    def tearDown(self):
+        self.time_patcher.stop()
+
+    def test_burst_then_spaced_waits(self):
+        bucket = TokenBucket(rate=2.0, capacity=3)
+        self.assertEqual([bucket.take() for _ in range(3)], [0.0, 0.0, 0.0])
+        # Empty bucket: each reservation waits one more token interval
+        self.assertAlmostEqual(bucket.take(), 0.5)
+        self.assertAlmostEqual(bucket.take(), 1.0)
+
+    def test_refill_capped_at_capacity(self):
+        bucket = TokenBucket(rate=2.0, capacity=3)
+        bucket.take()
+        self.clock.monotonic.return_value += 100.0
+        self.assertEqual([bucket.take() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.take(), 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.utils import error_handler
+from src.utils.error_handler import ErrorHandler
+
+NS_PER_MINUTE = 60 * 1_000_000_000
+
+
+class ErrorHandlerTestCase(unittest.TestCase):
+    def setUp(self):
+        # Fake clock; recovery strategies sleep, so that is stubbed too
+        self.clock = MagicMock()
+        self.clock.monotonic_ns.return_value = 1_000 * NS_PER_MINUTE
+        self.time_patcher = patch.object(error_handler, "time", self.clock)
+        self.time_patcher.start()
+
+        self.alerts = MagicMock()
+        self.handler = ErrorHandler({"MAX_RECOVERY_ATTEMPTS": 100}, self.alerts)
+
+    def tearDown(self):
+        self.time_patcher.stop()
+
+    def advance(self, minutes):
+        self.clock.monotonic_ns.return_value += int(minutes * NS_PER_MINUTE)
+
+
+class TestErrorCounts(ErrorHandlerTestCase):
+    def test_totals_follow_errors(self):
+        for _ in range(3):
+            self.handler.handle_error("DATA_PROVIDER", "DATA_MISSING", "no bars")
+        self.handler.handle_error("DATA_PROVIDER", "TIMEOUT", "slow")
+        self.handler.handle_error("SCANNER", "TIMEOUT", "slow")
+
+        summary = self.handler.get_error_summary()
+        self.assertEqual(summary["total_errors"], 5)
+        self.assertEqual(
+            summary["errors_by_component"], {"DATA_PROVIDER": 4, "SCANNER": 1}
+        )
+        # Totals always agree with a scan of the per-key counts
+        for component, total in self.handler.component_totals.items():
+            self.assertEqual(
+                total,
+                sum(
+                    count
+                    for (c, _), count in self.handler.error_counts.items()
+                    if c == component
+                ),
+            )
+
+    def test_clear_drops_only_stale_keys(self):
+        self.handler.handle_error("DATA_PROVIDER", "DATA_MISSING", "no bars")
+        self.handler.handle_error("SCANNER", "TIMEOUT", "slow")
+        self.advance(30)
+        self.handler.handle_error("DATA_PROVIDER", "TIMEOUT", "slow")
+        # Seeing an old key again makes it recent
+        self.handler.handle_error("SCANNER", "TIMEOUT", "slow")
+        self.advance(45)
+
+        self.assertEqual(self.handler.clear_error_counts(older_than_minutes=60), 1)
+        self.assertEqual(
+            list(self.handler.last_errors),
+            [("DATA_PROVIDER", "TIMEOUT"), ("SCANNER", "TIMEOUT")],
+        )
+        self.assertNotIn(("DATA_PROVIDER", "DATA_MISSING"), self.handler.error_counts)
+        self.assertNotIn(
+            ("DATA_PROVIDER", "DATA_MISSING"), self.handler.recovery_attempts
+        )
+        self.assertEqual(self.handler.error_counts[("SCANNER", "TIMEOUT")], 2)
+        self.assertEqual(
+            dict(self.handler.component_totals), {"DATA_PROVIDER": 1, "SCANNER": 2}
+        )
+
+    def test_clear_with_nothing_stale(self):
+        self.handler.handle_error("SCANNER", "TIMEOUT", "slow")
+        self.advance(59)
+
+        self.assertEqual(self.handler.clear_error_counts(older_than_minutes=60), 0)
+        self.assertEqual(list(self.handler.last_errors), [("SCANNER", "TIMEOUT")])
+
+    def test_clear_removes_empty_component_totals(self):
+        self.handler.handle_error("SCANNER", "TIMEOUT", "slow")
+        self.advance(61)
+
+        self.assertEqual(self.handler.clear_error_counts(older_than_minutes=60), 1)
+        self.assertEqual(self.handler.get_error_summary()["errors_by_component"], {})
+        self.assertEqual(self.handler.clear_error_counts(older_than_minutes=60), 0)
+
+
+class TestRecoveryDispatch(ErrorHandlerTestCase):
+    def test_strategies_resolve_to_handlers(self):
+        tables = [
+            ErrorHandler._IBKR_STRATEGIES,
+            ErrorHandler._DATA_PROVIDER_STRATEGIES,
+            ErrorHandler._OPTION_SELECTOR_STRATEGIES,
+            ErrorHandler._TRADE_EXECUTOR_STRATEGIES,
+            ErrorHandler._RISK_MANAGER_STRATEGIES,
+        ]
+        for table in tables:
+            for error_type, method in table.items():
+                with self.subTest(error_type=error_type, method=method):
+                    self.assertTrue(callable(getattr(self.handler, method)))
+
+    def test_component_strategy_runs(self):
+        risk_manager = MagicMock()
+        result = self.handler.attempt_recovery(
+            "RISK_MANAGER", "POSITION_SYNC_ERROR", {"risk_manager": risk_manager}
+        )
+
+        self.assertEqual(result, (True, "Positions refreshed from broker"))
+        risk_manager.update_positions_from_broker.assert_called_once_with()
+        self.assertEqual(
+            self.handler.recovery_attempts[("RISK_MANAGER", "POSITION_SYNC_ERROR")], 1
+        )
+
+    def test_same_error_type_per_component(self):
+        ibkr = self.handler.attempt_recovery(
+            "IBKR_API", "CONNECTION_ERROR", {"client": object()}
+        )
+        data = self.handler.attempt_recovery("DATA_PROVIDER", "CONNECTION_ERROR")
+        self.assertEqual(ibkr, (True, "Reconnected to API"))
+        self.assertEqual(data, (True, "Reconnected to data provider"))
+
+    def test_unknown_error_type(self):
+        result = self.handler.attempt_recovery("TRADE_EXECUTOR", "MARGIN_CALL")
+        self.assertEqual(result, (False, "No recovery strategy for MARGIN_CALL"))
+
+    def test_unknown_component_uses_generic_recovery(self):
+        result = self.handler.attempt_recovery("SCANNER", "TIMEOUT")
+        self.assertFalse(result[0])
+        self.assertIn("Generic recovery", result[1])
+        self.clock.sleep.assert_called_once_with(1)
+
+
+class TestCircuitBreaker(ErrorHandlerTestCase):
+    def test_trips_and_resets_on_monotonic_time(self):
+        for _ in range(5):
+            self.handler.handle_error("TRADE_EXECUTOR", "ORDER_EXECUTION_ERROR", "x")
+        self.assertFalse(self.handler.can_use_component("TRADE_EXECUTOR"))
+
+        result = self.handler.handle_error(
+            "TRADE_EXECUTOR", "ORDER_EXECUTION_ERROR", "x"
+        )
+        self.assertEqual(result, (False, "Circuit breaker active"))
+
+        self.advance(10)
+        self.assertEqual(
+            self.handler.get_error_summary()["circuit_breaker_status"][
+                "TRADE_EXECUTOR"
+            ],
+            "Tripped, reset in 20.0 minutes",
+        )
+        self.assertEqual(self.handler.check_circuit_breakers(), [])
+
+        self.advance(20)
+        self.assertEqual(self.handler.check_circuit_breakers(), ["TRADE_EXECUTOR"])
+        self.assertTrue(self.handler.can_use_component("TRADE_EXECUTOR"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import unittest
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.models.option import Option, OptionSpread
+from src.trading.exit_strategy import AtrTable, ExitStrategyManager
+
+
+def make_spread(symbol, long_strike=100.0, short_strike=105.0, cost=1.5):
+    expiration = date.today() + timedelta(days=30)
+    legs = [
+        Option(
+            f"{symbol}C{strike}",
+            symbol,
+            "call",
+            strike,
+            expiration,
+            1.0,
+            1.1,
+            1.05,
+            100,
+            1000,
+            0.3,
+            0.5,
+            0.01,
+            -0.02,
+            0.1,
+            0.01,
+        )
+        for strike in (long_strike, short_strike)
+    ]
+    return OptionSpread(
+        symbol=symbol,
+        expiration=expiration,
+        spread_type="BULL_CALL",
+        long_leg=legs[0],
+        short_leg=legs[1],
+        cost=cost,
+        max_profit=short_strike - long_strike - cost,
+        max_loss=cost,
+        delta=0.2,
+    )
+
+
+class TestAtrTable(unittest.TestCase):
+    def test_update_and_lookup(self):
+        table = AtrTable({"SPY": 4.5, "QQQ": 6.25})
+        table.update({"QQQ": 7.0, "IWM": 3.0})
+
+        self.assertEqual(table.symbol_index, {"SPY": 0, "QQQ": 1, "IWM": 2})
+        self.assertEqual(table.values.dtype, np.float32)
+        self.assertAlmostEqual(table.get("QQQ"), 7.0, places=5)
+        self.assertEqual(table.get("TSLA", default=-1.0), -1.0)
+        np.testing.assert_array_equal(
+            table.indices(["IWM", "TSLA", "SPY"]), [2, -1, 0]
+        )
+
+    def test_missing_atr_stored_as_zero(self):
+        table = AtrTable({"SPY": None})
+        self.assertEqual(table.get("SPY"), 0.0)
+
+
+class TestAtrExitsBatch(unittest.TestCase):
+    def setUp(self):
+        self.config = MagicMock()
+        self.config.ATR_TARGET_MULTIPLE = 2.5
+        self.manager = ExitStrategyManager(self.config)
+
+    def test_batch_matches_scalar(self):
+        atrs = {"SPY": 1.37, "QQQ": 2.11, "IWM": 0.0}
+        table = AtrTable(atrs)
+        entry_prices = [3.45, 1.2, 2.05, 0.4, 5.0]
+        directions = ["LONG", "SHORT", "LONG", "SHORT", "LONG"]
+        symbols = ["SPY", "QQQ", "QQQ", "SPY", "IWM"]
+
+        targets, has_atr = self.manager.calculate_atr_exits_batch(
+            np.array(entry_prices), directions, symbols, table
+        )
+
+        np.testing.assert_array_equal(has_atr, [True, True, True, True, False])
+        for i, (entry, direction, symbol) in enumerate(
+            zip(entry_prices, directions, symbols)
+        ):
+            if not has_atr[i]:
+                continue  # The caller falls back to the profit target
+            expected = self.manager._calculate_atr_exit(
+                entry, direction, {"atr": atrs[symbol]}, make_spread(symbol)
+            )
+            # ATRs are stored as float32
+            self.assertAlmostEqual(targets[i], expected, places=5)
+
+    def test_short_target_floored(self):
+        table = AtrTable({"SPY": 10.0})
+        targets, _ = self.manager.calculate_atr_exits_batch(
+            np.array([1.0]), ["SHORT"], ["SPY"], table
+        )
+        self.assertEqual(targets[0], 0.05)
+        self.assertEqual(
+            self.manager._calculate_atr_exit(
+                1.0, "SHORT", {"atr": 10.0}, make_spread("SPY")
+            ),
+            0.05,
+        )
+
+    def test_unknown_symbol_has_no_atr(self):
+        table = AtrTable({"SPY": 1.0})
+        targets, has_atr = self.manager.calculate_atr_exits_batch(
+            np.array([2.0]), ["LONG"], ["TSLA"], table
+        )
+        self.assertFalse(has_atr[0])
+        self.assertEqual(targets[0], 2.0)
+
+
+class TestUpdateExits(unittest.TestCase):
+    def setUp(self):
+        self.config = MagicMock()
+        self.config.ATR_TARGET_MULTIPLE = 2.5
+        self.config.TARGET_REWARD_RISK = 1.5
+        self.config.USE_TRAILING_STOP = False
+        self.config.USE_ADAPTIVE_ATR_EXIT = True
+        self.manager = ExitStrategyManager(self.config)
+
+    def make_position(self, symbol):
+        return {"direction": "LONG", "entry_price": 1.5, "spread": make_spread(symbol)}
+
+    def test_scalar_skips_symbol_missing_from_table(self):
+        position = self.make_position("SPY")
+        self.manager.update_exits_for_position(
+            position, 1.6, atr_table=AtrTable({"QQQ": 2.0})
+        )
+        self.assertNotIn("atr_exit", position)
+
+    def test_zero_atr_falls_back_to_profit_target(self):
+        table = AtrTable({"SPY": 0.0})
+        scalar = self.make_position("SPY")
+        self.manager.update_exits_for_position(scalar, 1.6, atr_table=table)
+
+        batch = {"SPY": self.make_position("SPY")}
+        self.manager.update_exits_for_positions(batch, {"SPY": 1.6}, table)
+
+        # min(max profit 5 - 1.5, 1.5 * 1.5) above the 1.5 entry
+        self.assertEqual(scalar["atr_exit"], 3.75)
+        self.assertEqual(batch["SPY"]["atr_exit"], scalar["atr_exit"])
+
+    def test_scalar_matches_batch(self):
+        table = AtrTable({"SPY": 0.4, "QQQ": 0.25})
+        positions = {s: self.make_position(s) for s in ("SPY", "QQQ")}
+        prices = {"SPY": 1.6, "QQQ": 1.4}
+        self.manager.update_exits_for_positions(positions, prices, table)
+
+        for symbol, position in positions.items():
+            scalar = self.make_position(symbol)
+            self.manager.update_exits_for_position(
+                scalar, prices[symbol], atr_table=table
+            )
+            self.assertAlmostEqual(scalar["atr_exit"], position["atr_exit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from src.utils import logger
+
+
+class TestLogger(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.temp_dir.name, "trader.log")
+
+    def tearDown(self):
+        logger._remove_handlers()
+        logger._logger = None
+        logger._config_signature = None
+        self.temp_dir.cleanup()
+
+    def read_lines(self):
+        # Stopping the listener drains anything still queued
+        logger._stop_listener()
+        with open(self.log_file) as f:
+            return f.read().splitlines()
+
+    def test_json_records_parse_with_extra_fields(self):
+        logger.setup_logger(log_file=self.log_file, console=False, json_format=True)
+        logger.log_info(
+            "Trade executed for %s", "SPY", extra={"symbol": "SPY", "size": 3}
+        )
+
+        (line,) = self.read_lines()
+        record = json.loads(line)
+        self.assertEqual(record["level"], "INFO")
+        self.assertEqual(record["message"], "Trade executed for SPY")
+        self.assertEqual(record["symbol"], "SPY")
+        self.assertEqual(record["size"], 3)
+        self.assertIsInstance(record["time"], float)
+
+    def test_json_time_is_record_created(self):
+        record = logging.LogRecord(
+            "auto_trader", logging.WARNING, __file__, 1, "x=%d", (5,), None
+        )
+        payload = json.loads(logger.JsonFormatter().format(record))
+        self.assertEqual(payload["time"], record.created)
+        self.assertEqual(payload["message"], "x=5")
+
+    def test_queued_output_matches_direct(self):
+        messages = [("Order %s filled at $%.2f", ("A1", 1.234)), ("plain", ())]
+
+        direct_file = os.path.join(self.temp_dir.name, "direct.log")
+        logger.setup_logger(log_file=direct_file, console=False, queued=False)
+        for message, args in messages:
+            logger.log_warning(message, *args)
+        logger._remove_handlers()
+        with open(direct_file) as f:
+            direct = [line.split(" - ", 1)[1] for line in f.read().splitlines()]
+
+        logger.setup_logger(log_file=self.log_file, console=False, queued=True)
+        for message, args in messages:
+            logger.log_warning(message, *args)
+        queued = [line.split(" - ", 1)[1] for line in self.read_lines()]
+
+        self.assertEqual(queued, direct)
+        self.assertEqual(direct[0], "WARNING - Order A1 filled at $1.23")
+
+    def test_setup_is_idempotent(self):
+        first = logger.setup_logger(log_file=self.log_file, console=False)
+        handlers = list(first.handlers)
+
+        second = logger.setup_logger(log_file=self.log_file, console=False)
+        self.assertIs(first, second)
+        self.assertEqual(second.handlers, handlers)
+
+        logger.log_info("once")
+        self.assertEqual(len(self.read_lines()), 1)
+
+    def test_reconfigure_replaces_handlers(self):
+        logger.setup_logger(log_file=self.log_file, console=False, log_level="INFO")
+        old_handlers = list(logger.get_logger().handlers)
+
+        logger.setup_logger(log_file=self.log_file, console=False, log_level="debug")
+        new_handlers = logger.get_logger().handlers
+        self.assertEqual(len(new_handlers), len(old_handlers))
+        self.assertFalse(set(old_handlers) & set(new_handlers))
+        self.assertTrue(logger.is_debug_enabled())
+
+    def test_unknown_level_falls_back_to_info(self):
+        # "basic_format" names a logging attribute that isn't a level
+        for name in ("verbose", "basic_format", "Logger"):
+            with self.subTest(level=name):
+                logger.setup_logger(console=False, log_level=name)
+                self.assertEqual(logger.get_logger().level, logging.INFO)
+
+    def test_numeric_level_used_as_is(self):
+        logger.setup_logger(console=False, log_level=logging.DEBUG)
+        self.assertEqual(logger.get_logger().level, logging.DEBUG)
+
+        logger.setup_logger(console=False, log_level="warning")
+        self.assertEqual(logger.get_logger().level, logging.WARNING)
+
+
+if __name__ == "__main__":
+    unittest.main()
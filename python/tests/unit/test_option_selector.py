@@ -0,0 +1,155 @@
+import importlib.util
+import math
+import sys
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.models.option import Option, OptionSpread
+from src.trading import option_selector
+from src.trading.option_selector import OptionSelector
+
+
+def load_selector_without_scipy():
+    """Load a separate copy of the selector module with SciPy hidden."""
+    spec = importlib.util.spec_from_file_location(
+        "_option_selector_no_scipy", option_selector.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"scipy": None, "scipy.special": None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+def make_option(option_type, strike, bid, ask, delta, expiration):
+    return Option(
+        f"SPY{expiration:%y%m%d}{option_type[0].upper()}{int(strike * 1000):08d}",
+        "SPY",
+        option_type,
+        strike,
+        expiration,
+        bid,
+        ask,
+        (bid + ask) / 2,
+        100,
+        1000,
+        0.3,
+        delta,
+        0.01,
+        -0.02,
+        0.1,
+        0.01,
+    )
+
+
+class TestVerticalSpreadBuilders(unittest.TestCase):
+    def setUp(self):
+        self.config = MagicMock()
+        self.config.STRIKE_WINDOW_PCT = 0.10
+        self.selector = OptionSelector(self.config)
+
+        self.expiry = date(2030, 1, 18)
+        strikes = [95.0, 97.5, 100.0, 102.5, 105.0]
+        self.calls = [
+            make_option("call", k, b, a, d, self.expiry)
+            for k, b, a, d in zip(
+                strikes,
+                [6.0, 4.2, 2.7, 1.5, 0.7],
+                [6.2, 4.4, 2.9, 1.6, 0.8],
+                [0.75, 0.64, 0.5, 0.36, 0.24],
+            )
+        ]
+        self.puts = [
+            make_option("put", k, b, a, d, self.expiry)
+            for k, b, a, d in zip(
+                strikes,
+                [0.6, 1.3, 2.5, 4.0, 5.9],
+                [0.7, 1.4, 2.7, 4.2, 6.1],
+                [-0.24, -0.36, -0.5, -0.64, -0.75],
+            )
+        ]
+        self.chains = {self.expiry: (self.calls, self.puts)}
+
+    def scalar_spreads(self, spread_type):
+        """Build spreads with the per-pair loop the selector used before."""
+        if spread_type == "BULL_CALL":
+            legs = self.calls
+            pairs = [(legs[i], legs[i + 1]) for i in range(len(legs) - 1)]
+        else:
+            legs = self.puts
+            pairs = [(legs[i + 1], legs[i]) for i in range(len(legs) - 1)]
+
+        spreads = []
+        for long_leg, short_leg in pairs:
+            cost = long_leg.ask - short_leg.bid
+            max_profit = abs(short_leg.strike - long_leg.strike) - cost
+            if max_profit <= 0:
+                continue
+            spreads.append(
+                OptionSpread(
+                    symbol="SPY",
+                    expiration=self.expiry,
+                    spread_type=spread_type,
+                    long_leg=long_leg,
+                    short_leg=short_leg,
+                    cost=cost * 100,
+                    max_profit=max_profit * 100,
+                    max_loss=cost * 100,
+                    delta=long_leg.delta - short_leg.delta,
+                    reward_risk_ratio=max_profit / cost if cost > 0 else 0,
+                )
+            )
+        return spreads
+
+    def assert_same_spreads(self, spreads, expected):
+        self.assertEqual(len(spreads), len(expected))
+        for spread, ref in zip(spreads, expected):
+            self.assertIs(spread.long_leg, ref.long_leg)
+            self.assertIs(spread.short_leg, ref.short_leg)
+            self.assertEqual(spread.spread_type, ref.spread_type)
+            self.assertAlmostEqual(spread.cost, ref.cost, places=9)
+            self.assertAlmostEqual(spread.max_profit, ref.max_profit, places=9)
+            self.assertAlmostEqual(spread.max_loss, ref.max_loss, places=9)
+            self.assertAlmostEqual(spread.delta, ref.delta, places=9)
+            self.assertAlmostEqual(
+                spread.reward_risk_ratio, ref.reward_risk_ratio, places=9
+            )
+
+    def test_call_spreads_match_scalar(self):
+        spreads = self.selector.create_call_vertical_spreads(self.chains, 100.0)
+        self.assert_same_spreads(spreads, self.scalar_spreads("BULL_CALL"))
+
+    def test_put_spreads_match_scalar(self):
+        spreads = self.selector.create_put_vertical_spreads(self.chains, 100.0)
+        self.assert_same_spreads(spreads, self.scalar_spreads("BEAR_PUT"))
+
+    def test_strike_window_limits_pairs(self):
+        self.config.STRIKE_WINDOW_PCT = 0.03
+        spreads = self.selector.create_call_vertical_spreads(self.chains, 100.0)
+        strikes = {(s.long_leg.strike, s.short_leg.strike) for s in spreads}
+        self.assertEqual(strikes, {(97.5, 100.0), (100.0, 102.5)})
+
+
+class TestNormCdf(unittest.TestCase):
+    def test_fallback_matches_erfc(self):
+        norm_cdf = load_selector_without_scipy()._norm_cdf
+        x = np.linspace(-8.0, 8.0, 1601)
+        expected = [0.5 * math.erfc(-v / math.sqrt(2.0)) for v in x]
+
+        result = norm_cdf(x)
+        self.assertIsInstance(result, np.ndarray)
+        np.testing.assert_allclose(result, expected, rtol=0, atol=1e-7)
+
+    def test_fallback_symmetry_and_limits(self):
+        norm_cdf = load_selector_without_scipy()._norm_cdf
+        x = np.array([0.0, 0.5, 1.96, 40.0])
+
+        np.testing.assert_allclose(norm_cdf(x) + norm_cdf(-x), 1.0, atol=1e-12)
+        self.assertAlmostEqual(float(norm_cdf(np.array([0.0]))[0]), 0.5, places=8)
+        self.assertEqual(float(norm_cdf(np.array([-40.0]))[0]), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import math
+import unittest
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+from src.models.option import Option, OptionSpread
+from src.trading.risk_manager import RiskManager
+
+
+def make_spread(symbol, long_strike, short_strike, cost, max_loss=None):
+    expiration = date.today() + timedelta(days=30)
+    legs = [
+        Option(
+            f"{symbol}C{strike}",
+            symbol,
+            "call",
+            strike,
+            expiration,
+            1.0,
+            1.1,
+            1.05,
+            100,
+            1000,
+            0.3,
+            0.5,
+            0.01,
+            -0.02,
+            0.1,
+            0.01,
+        )
+        for strike in (long_strike, short_strike)
+    ]
+    return OptionSpread(
+        symbol=symbol,
+        expiration=expiration,
+        spread_type="BULL_CALL",
+        long_leg=legs[0],
+        short_leg=legs[1],
+        cost=cost,
+        max_profit=(short_strike - long_strike) * 100 - cost,
+        max_loss=cost if max_loss is None else max_loss,
+        delta=0.2,
+    )
+
+
+class TestRiskManager(unittest.TestCase):
+    def setUp(self):
+        self.config = MagicMock()
+        self.config.RISK_PER_TRADE = 0.02
+        self.config.MAX_CONTRACTS_PER_TRADE = 100
+        self.config.MAX_POSITIONS = 5
+        self.config.MAX_DAILY_TRADES = 10
+        self.config.MAX_PORTFOLIO_HEAT = 0.1
+        self.config.MAX_SECTOR_EXPOSURE = 0.3
+        self.config.MAX_INDUSTRY_EXPOSURE = 0.2
+        self.config.MAX_DIRECTIONAL_BIAS = 0.8
+        self.config.MIN_BUYING_POWER = 1000.0
+        self.config.STOP_LOSS_PERCENTAGE = 0.5
+        self.config.TARGET_REWARD_RISK = 1.5
+        self.config.USE_R_MULTIPLE_EXIT = False
+        self.config.R_MULTIPLE_TARGET = 2.0
+        self.config.MIN_DAYS_TO_EXPIRY = 5
+        self.risk_manager = RiskManager(self.config)
+
+    def test_position_size_matches_scalar(self):
+        cases = [
+            (10000.0, 3.3349),
+            (10000.0, 2.0),
+            (25000.0, 7.5),
+            (5000.0, 0.01),
+            (12345.67, 1.23),
+            (100.0, 3.0),
+        ]
+        for account_value, spread_cost in cases:
+            with self.subTest(account_value=account_value, spread_cost=spread_cost):
+                expected = min(
+                    math.floor(account_value * 0.02 / spread_cost), 100
+                )
+                self.assertEqual(
+                    self.risk_manager.calculate_contract_position_size(
+                        account_value, spread_cost
+                    ),
+                    expected,
+                )
+
+    def test_position_size_ignores_float_noise(self):
+        # 200 / 3.35 is 59.7; the float product 3.35 * 100 must not push the
+        # cost up a cent and 2% of 10000 must not drop below 200.00
+        self.assertEqual(
+            self.risk_manager.calculate_contract_position_size(10000.0, 3.35), 59
+        )
+        # Exactly on budget: 200 / 2.5 = 80 contracts
+        self.assertEqual(
+            self.risk_manager.calculate_contract_position_size(10000.0, 2.5), 80
+        )
+
+    def test_position_size_rejects_non_positive_cost(self):
+        for spread_cost in (0.0, -1.5):
+            self.assertEqual(
+                self.risk_manager.calculate_contract_position_size(
+                    10000.0, spread_cost
+                ),
+                0,
+            )
+
+    def test_position_size_capped(self):
+        self.assertEqual(
+            self.risk_manager.calculate_contract_position_size(1e7, 1.0), 100
+        )
+
+    def assert_totals_match_scan(self):
+        rm = self.risk_manager
+        long_total = sum(
+            p["net_risk"]
+            for p in rm.active_positions.values()
+            if p["direction"] == "LONG"
+        )
+        short_total = sum(
+            p["net_risk"]
+            for p in rm.active_positions.values()
+            if p["direction"] == "SHORT"
+        )
+        self.assertAlmostEqual(rm._long_exposure, long_total, places=9)
+        self.assertAlmostEqual(rm._short_exposure, short_total, places=9)
+        self.assertAlmostEqual(rm._total_risk, long_total + short_total, places=9)
+
+        heat = (long_total + short_total) / 50000.0 * 100
+        self.assertAlmostEqual(rm.calculate_portfolio_heat(50000.0), heat, places=9)
+
+    def test_running_totals_track_positions(self):
+        rm = self.risk_manager
+        rm.record_trade("SPY", "LONG", 3, make_spread("SPY", 100, 105, 210.0))
+        self.assert_totals_match_scan()
+        rm.record_trade("QQQ", "SHORT", 2, make_spread("QQQ", 300, 305, 180.0))
+        self.assert_totals_match_scan()
+        rm.record_trade("IWM", "LONG", 5, make_spread("IWM", 200, 201, 40.0))
+        self.assert_totals_match_scan()
+
+        # Replacing a position swaps its risk instead of adding to it
+        rm.record_trade("SPY", "SHORT", 1, make_spread("SPY", 100, 105, 150.0))
+        self.assert_totals_match_scan()
+
+        rm.close_position("QQQ")
+        self.assert_totals_match_scan()
+        rm.close_position("MISSING")
+        self.assert_totals_match_scan()
+        rm.close_position("SPY")
+        rm.close_position("IWM")
+        self.assertEqual(rm._total_risk, 0.0)
+        self.assertEqual(rm._long_exposure, 0.0)
+        self.assertEqual(rm._short_exposure, 0.0)
+
+    def test_net_risk_capped_by_width(self):
+        # Max loss above the strike width is capped at the width
+        spread = make_spread("SPY", 100, 101, 150.0)
+        self.assertEqual(RiskManager._net_risk(spread, 2), 200.0)
+
+        spread = make_spread("SPY", 100, 105, 210.0)
+        self.assertEqual(RiskManager._net_risk(spread, 3), 630.0)
+
+    def test_directional_exposure(self):
+        rm = self.risk_manager
+        rm.record_trade("SPY", "LONG", 3, make_spread("SPY", 100, 105, 200.0))
+        rm.record_trade("QQQ", "SHORT", 1, make_spread("QQQ", 300, 305, 200.0))
+
+        long_percent, short_percent = rm.calculate_directional_exposure()
+        self.assertAlmostEqual(long_percent, 75.0)
+        self.assertAlmostEqual(short_percent, 25.0)
+
+    def test_get_metrics_returns_copies(self):
+        rm = self.risk_manager
+        rm.record_trade("SPY", "LONG", 1, make_spread("SPY", 100, 105, 200.0))
+        metrics = rm.get_metrics()
+        for value in metrics.values():
+            if isinstance(value, dict):
+                value["mutated"] = True
+        self.assertNotEqual(rm.get_metrics(), metrics)
+
+    def test_account_summary_shared_by_checks(self):
+        rm = self.risk_manager
+        rm.broker_api = MagicMock()
+        rm.broker_api.get_account_summary.return_value = {"net_liquidation": 50000.0}
+
+        for _ in range(3):
+            self.assertEqual(rm.get_account_value(), 50000.0)
+        rm.broker_api.get_account_summary.assert_called_once_with()
+        # Account value lookups never fetch positions
+        rm.broker_api.get_positions.assert_not_called()
+
+        # A new trade changes the account, so the next check refetches
+        rm.record_trade("SPY", "LONG", 1, make_spread("SPY", 100, 105, 200.0))
+        rm.get_account_value()
+        self.assertEqual(rm.broker_api.get_account_summary.call_count, 2)
+
+    def test_failed_account_summary_not_cached(self):
+        rm = self.risk_manager
+        rm.broker_api = MagicMock()
+        rm.broker_api.get_account_summary.side_effect = [
+            RuntimeError("timeout"),
+            {"net_liquidation": 50000.0},
+        ]
+
+        self.assertEqual(rm.get_account_value(), 100000.0)
+        self.assertEqual(rm.get_account_value(), 50000.0)
+
+    def test_position_refresh_fetches_positions(self):
+        rm = self.risk_manager
+        rm.broker_api = MagicMock()
+        rm.broker_api.get_positions.return_value = {
+            "SPY": {"quantity": 2, "avg_price": 1.5, "realized_pnl": 30.0}
+        }
+        rm.broker_api.get_account_summary.return_value = {"realized_pnl": 45.0}
+
+        rm.update_positions_from_broker()
+        rm.broker_api.get_positions.assert_called_once_with()
+        self.assertEqual(rm.daily_pnl, 45.0)
+
+        # The summary fetched with the positions is reused by risk checks
+        rm.get_account_value()
+        rm.broker_api.get_account_summary.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
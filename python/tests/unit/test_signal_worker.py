@@ -0,0 +1,98 @@
+import threading
+import time
+import unittest
+
+from src.utils.signal_worker import SignalWorker
+
+
+class TestSignalWorker(unittest.TestCase):
+    def setUp(self):
+        self.handled = []
+        self.threads = set()
+        self.done = threading.Event()
+        self.worker = SignalWorker(self.handle)
+
+    def tearDown(self):
+        self.worker.stop()
+
+    def handle(self, signal):
+        self.threads.add(threading.get_ident())
+        if signal == "boom":
+            raise ValueError("bad signal")
+        self.handled.append(signal)
+        if signal == "last":
+            self.done.set()
+        return signal
+
+    def test_signals_handled_in_order(self):
+        self.worker.start()
+        for signal in ("a", "boom", "b", "last"):
+            self.assertTrue(self.worker.put(signal))
+
+        self.assertTrue(self.done.wait(2.0))
+        # A failing signal doesn't stop the worker
+        self.assertEqual(self.handled, ["a", "b", "last"])
+
+    def test_tasks_share_the_signal_thread(self):
+        ran = threading.Event()
+
+        def task():
+            self.threads.add(threading.get_ident())
+            ran.set()
+
+        self.worker.add_task(60.0, task)
+        self.worker.start()
+        self.worker.put("last")
+
+        self.assertTrue(ran.wait(2.0))
+        self.assertTrue(self.done.wait(2.0))
+        self.assertEqual(len(self.threads), 1)
+        self.assertNotIn(threading.get_ident(), self.threads)
+
+    def test_tasks_run_on_their_deadlines(self):
+        fast, slow = [], []
+        self.worker.add_task(0.02, lambda: fast.append(time.monotonic()))
+        self.worker.add_task(60.0, lambda: slow.append(time.monotonic()))
+
+        self.worker.start()
+        time.sleep(0.25)
+        self.worker.stop()
+
+        # Both run straight away; only the short interval repeats
+        self.assertGreaterEqual(len(fast), 3)
+        self.assertEqual(len(slow), 1)
+        gaps = [b - a for a, b in zip(fast, fast[1:])]
+        self.assertGreaterEqual(min(gaps), 0.015)
+
+    def test_failing_task_keeps_running(self):
+        calls = []
+
+        def task():
+            calls.append(1)
+            raise RuntimeError("task failed")
+
+        self.worker.add_task(0.02, task)
+        self.worker.start()
+        time.sleep(0.15)
+        self.worker.stop()
+        self.assertGreaterEqual(len(calls), 2)
+
+    def test_stop_wakes_idle_worker(self):
+        # With no tasks the worker blocks on the queue without a timeout
+        self.worker.start()
+        self.assertTrue(self.worker.running)
+
+        started = time.monotonic()
+        self.worker.stop()
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertFalse(self.worker.running)
+        self.assertEqual(self.handled, [])
+
+    def test_put_reports_full_queue(self):
+        worker = SignalWorker(self.handle, maxsize=1)
+        self.assertTrue(worker.put("a"))
+        self.assertFalse(worker.put("b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import importlib.util
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from src.trading import _spread_kernels
+
+
+def load_numpy_kernels():
+    """Load a separate copy of the kernel module with Numba hidden."""
+    spec = importlib.util.spec_from_file_location(
+        "_spread_kernels_numpy", _spread_kernels.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"numba": None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+def scalar_call_spreads(ask, bid, strike, delta):
+    """Reference per-pair loop the call kernel replaced."""
+    rows = []
+    for i in range(len(ask) - 1):
+        cost = ask[i] - bid[i + 1]
+        max_profit = strike[i + 1] - strike[i] - cost
+        rows.append(
+            (
+                cost,
+                max_profit,
+                delta[i] - delta[i + 1],
+                max_profit / cost if cost > 0 else 0,
+            )
+        )
+    return rows
+
+
+def scalar_put_spreads(ask, bid, strike, delta):
+    """Reference per-pair loop the put kernel replaced."""
+    rows = []
+    for i in range(len(ask) - 1):
+        cost = ask[i + 1] - bid[i]
+        max_profit = strike[i + 1] - strike[i] - cost
+        rows.append(
+            (
+                cost,
+                max_profit,
+                delta[i + 1] - delta[i],
+                max_profit / cost if cost > 0 else 0,
+            )
+        )
+    return rows
+
+
+class TestSpreadKernels(unittest.TestCase):
+    def setUp(self):
+        self.ask = np.array([5.2, 4.1, 3.0, 2.4, 1.1, 0.9])
+        self.bid = np.array([5.0, 3.9, 2.8, 2.2, 1.0, 1.5])
+        self.strike = np.array([95.0, 96.0, 97.0, 98.0, 99.0, 100.0])
+        self.delta = np.array([0.7, 0.62, 0.55, 0.47, 0.4, 0.33])
+        self.numpy_kernels = load_numpy_kernels()
+
+    def assert_matches(self, result, expected):
+        self.assertEqual(len(result), 4)
+        for column, values in zip(result, zip(*expected)):
+            np.testing.assert_allclose(column, values, rtol=0, atol=1e-12)
+
+    def test_numpy_fallback_loaded_without_numba(self):
+        self.assertFalse(self.numpy_kernels.NUMBA_AVAILABLE)
+
+    def test_call_kernel_matches_scalar(self):
+        args = (self.ask, self.bid, self.strike, self.delta)
+        expected = scalar_call_spreads(*args)
+        self.assert_matches(_spread_kernels.call_spread_kernel(*args), expected)
+        self.assert_matches(self.numpy_kernels.call_spread_kernel(*args), expected)
+
+    def test_put_kernel_matches_scalar(self):
+        args = (self.ask, self.bid, self.strike, self.delta)
+        expected = scalar_put_spreads(*args)
+        self.assert_matches(_spread_kernels.put_spread_kernel(*args), expected)
+        self.assert_matches(self.numpy_kernels.put_spread_kernel(*args), expected)
+
+    def test_non_positive_cost_has_zero_reward_risk(self):
+        # The last call pair costs 1.1 - 1.5 < 0 and the put pair 0.9 - 1.0 < 0
+        args = (self.ask, self.bid, self.strike, self.delta)
+        for kernels in (_spread_kernels, self.numpy_kernels):
+            cost, _, _, reward_risk = kernels.call_spread_kernel(*args)
+            self.assertLessEqual(cost[-1], 0)
+            self.assertEqual(reward_risk[-1], 0.0)
+
+            cost, _, _, reward_risk = kernels.put_spread_kernel(*args)
+            self.assertLessEqual(cost[-1], 0)
+            self.assertEqual(reward_risk[-1], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytz
+
+from src.utils import time_utils
+
+
+def pytz_to_eastern(dt):
+    """Reference conversion using pytz, as time_utils did before zoneinfo."""
+    if dt.tzinfo is None:
+        dt = pytz.utc.localize(dt)
+    return dt.astimezone(pytz.timezone("US/Eastern"))
+
+
+class TestTimeUtils(unittest.TestCase):
+    def setUp(self):
+        # Around both 2024 DST transitions, plus ordinary days
+        self.samples = [
+            datetime(2024, 3, 10, 6, 59),
+            datetime(2024, 3, 10, 7, 0),
+            datetime(2024, 7, 1, 19, 30),
+            datetime(2024, 11, 3, 5, 59),
+            datetime(2024, 11, 3, 6, 0),
+            datetime(2024, 12, 24, 14, 29),
+        ]
+
+    def test_convert_naive_matches_pytz(self):
+        for dt in self.samples:
+            with self.subTest(dt=dt):
+                converted = time_utils.convert_to_eastern(dt)
+                expected = pytz_to_eastern(dt)
+                self.assertEqual(converted.timestamp(), expected.timestamp())
+                self.assertEqual(converted.utcoffset(), expected.utcoffset())
+                self.assertEqual(
+                    converted.replace(tzinfo=None), expected.replace(tzinfo=None)
+                )
+
+    def test_convert_aware_matches_pytz(self):
+        tokyo = timezone(timedelta(hours=9))
+        for dt in self.samples:
+            aware = dt.replace(tzinfo=timezone.utc).astimezone(tokyo)
+            with self.subTest(dt=aware):
+                converted = time_utils.convert_to_eastern(aware)
+                expected = pytz_to_eastern(aware)
+                self.assertEqual(converted.utcoffset(), expected.utcoffset())
+                self.assertEqual(
+                    converted.replace(tzinfo=None), expected.replace(tzinfo=None)
+                )
+
+    def test_localize_matches_pytz_zone(self):
+        eastern = pytz.timezone("US/Eastern")
+        for wall in (datetime(2024, 1, 15, 16, 0), datetime(2024, 7, 15, 16, 0)):
+            with self.subTest(wall=wall):
+                localized = time_utils._localize_eastern(wall)
+                expected = eastern.localize(wall)
+                self.assertEqual(localized.utcoffset(), expected.utcoffset())
+
+                # The pytz fallback used on Python 3.8 gives the same result
+                with patch.object(time_utils, "_EASTERN", eastern):
+                    fallback = time_utils._localize_eastern(wall)
+                self.assertEqual(fallback.timestamp(), localized.timestamp())
+
+    def test_market_hours(self):
+        # 2024-07-01 is a Monday; EDT is UTC-4
+        self.assertFalse(time_utils.is_market_open(datetime(2024, 7, 1, 13, 29)))
+        self.assertTrue(time_utils.is_market_open(datetime(2024, 7, 1, 13, 30)))
+        self.assertFalse(time_utils.is_market_open(datetime(2024, 7, 1, 20, 0)))
+        # EST is UTC-5 in January
+        self.assertTrue(time_utils.is_market_open(datetime(2024, 1, 8, 14, 30)))
+        self.assertFalse(time_utils.is_market_open(datetime(2024, 1, 8, 14, 29)))
+        # Saturday
+        self.assertFalse(time_utils.is_market_open(datetime(2024, 7, 6, 15, 0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
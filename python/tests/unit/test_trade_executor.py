@@ -0,0 +1,161 @@
+import unittest
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+from src.models.option import Option, OptionSpread
+from src.trading.trade_executor import TradeExecutor
+
+
+def make_spread(symbol, long_ask, short_bid, long_leg=True):
+    expiration = date.today() + timedelta(days=30)
+
+    def leg(strike, bid, ask):
+        return Option(
+            f"{symbol}C{strike}",
+            symbol,
+            "call",
+            strike,
+            expiration,
+            bid,
+            ask,
+            (bid + ask) / 2,
+            100,
+            1000,
+            0.3,
+            0.5,
+            0.01,
+            -0.02,
+            0.1,
+            0.01,
+        )
+
+    cost = (long_ask - short_bid) * 100
+    return OptionSpread(
+        symbol=symbol,
+        expiration=expiration,
+        spread_type="BULL_CALL",
+        # A spread without a long leg can't be priced, so its order fails
+        long_leg=leg(100.0, long_ask - 0.1, long_ask) if long_leg else None,
+        short_leg=leg(105.0, short_bid, short_bid + 0.1),
+        cost=cost,
+        max_profit=500 - cost,
+        max_loss=cost,
+        delta=0.2,
+    )
+
+
+class TestTradeExecutor(unittest.TestCase):
+    def setUp(self):
+        self.config = MagicMock()
+        self.config.TRADING_MODE = "PAPER"
+        self.config.MAX_BATCH_SIZE = 2
+        self.config.PRICE_IMPROVEMENT_FACTOR = 0.4
+
+        self.latency_patchers = [
+            patch("src.trading.trade_executor._PAPER_LATENCY", 0),
+            patch("src.trading.trade_executor._LIVE_LATENCY", 0),
+        ]
+        for patcher in self.latency_patchers:
+            patcher.start()
+
+        self.executor = TradeExecutor(self.config)
+        self.valid_time_patcher = patch.object(
+            self.executor, "is_valid_execution_time", return_value=True
+        )
+        self.valid_time = self.valid_time_patcher.start()
+
+    def tearDown(self):
+        self.valid_time_patcher.stop()
+        for patcher in self.latency_patchers:
+            patcher.stop()
+
+    def make_trades(self):
+        return [
+            {
+                "signal": {"symbol": symbol, "direction": direction},
+                "spread": make_spread(symbol, 2.5, 1.0, long_leg=priced),
+                "size": size,
+            }
+            for symbol, direction, size, priced in [
+                ("SPY", "LONG", 1, True),
+                ("QQQ", "SHORT", 2, True),
+                ("IWM", "LONG", 3, True),
+                ("DIA", "LONG", 4, False),
+                ("XLF", "SHORT", 5, True),
+            ]
+        ]
+
+    def test_batch_matches_scalar(self):
+        for mode in ("PAPER", "LIVE"):
+            with self.subTest(mode=mode):
+                self.executor.trading_mode = mode
+                trades = self.make_trades()
+
+                scalar = [
+                    self.executor.execute_trade(t["signal"], t["spread"], t["size"])
+                    for t in trades
+                ]
+                batch = self.executor.execute_batch(trades)
+
+                self.assertEqual([s for s, _ in scalar], [s for s, _ in batch])
+                self.assertEqual(scalar[3][0], "FAILED")
+                for (_, scalar_id), (status, batch_id) in zip(scalar, batch):
+                    if status == "EXECUTED":
+                        self.assertTrue(batch_id.startswith(f"{mode}-"))
+                        self.assertEqual(
+                            scalar_id.rsplit("-", 1)[0], batch_id.rsplit("-", 1)[0]
+                        )
+
+    def test_unpriceable_order_fails_alone(self):
+        results = self.executor.execute_batch(self.make_trades())
+
+        # IWM shares a batch with the unpriceable DIA order but still goes out
+        self.assertEqual(
+            [status for status, _ in results],
+            ["EXECUTED", "EXECUTED", "EXECUTED", "FAILED", "EXECUTED"],
+        )
+
+    def test_batch_order_ids_follow_trade_order(self):
+        trades = [t for t in self.make_trades() if t["spread"].long_leg]
+        results = self.executor.execute_batch(trades)
+
+        sequence = [int(order_id.rsplit("-", 1)[1]) for _, order_id in results]
+        self.assertEqual(sequence, sorted(sequence))
+        self.assertEqual(len(set(sequence)), len(trades))
+
+    def test_batch_updates_metrics(self):
+        self.executor.execute_batch(self.make_trades())
+
+        metrics = self.executor.execution_metrics
+        self.assertEqual(metrics.total_trades, 5)
+        self.assertEqual(metrics.successful_trades, 4)
+        self.assertEqual(metrics.failed_trades, 1)
+
+    def test_empty_batch(self):
+        self.assertEqual(self.executor.execute_batch([]), [])
+
+    def test_process_queued_trades_requeues_failures(self):
+        trades = self.make_trades()
+
+        self.valid_time.return_value = False
+        for t in trades:
+            status, _ = self.executor.execute_trade(
+                t["signal"], t["spread"], t["size"]
+            )
+            self.assertEqual(status, "QUEUED")
+        self.assertEqual(self.executor.process_queued_trades(), 0)
+        self.assertEqual(len(self.executor.queued_trades), 5)
+
+        self.valid_time.return_value = True
+        self.assertEqual(self.executor.process_queued_trades(), 4)
+        self.assertEqual(
+            [q["signal"]["symbol"] for q in self.executor.queued_trades], ["DIA"]
+        )
+
+        # The failed trade stays queued for the next pass
+        self.assertEqual(self.executor.process_queued_trades(), 0)
+        self.assertEqual(len(self.executor.queued_trades), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()